@@ -0,0 +1,38 @@
+"""
+Helpers shared by the benchmarks.
+
+The benchmarks are run as scripts, from the root of the repository,
+so this module is imported from the directory of the running script.
+"""
+import logging
+
+import core
+
+def disable_logs() -> None:
+    """
+    Disables every log record.
+    The debug logs of the hot paths would be measured instead of the paths themselves.
+    """
+    logging.disable(logging.CRITICAL)
+
+class BytesReceiver:
+    """
+    Feeds a whole reply to the decoder, with the interface of `network.Receiver`.
+    """
+    def __init__(self, data: bytes) -> None:
+        self._data = data
+        self._idx = 0
+
+    def consume(self, n: int) -> str:
+        start = self._idx
+        self._idx += n
+        return self._data[start:self._idx].decode()
+
+    def consume_crlf(self) -> str:
+        return self.consume_line().decode()
+
+    def consume_line(self) -> bytes:
+        end = self._data.index(b"\r\n", self._idx)
+        line = self._data[self._idx:end]
+        self._idx = end + len(core.CRLF)
+        return line
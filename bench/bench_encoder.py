@@ -0,0 +1,68 @@
+"""
+Benchmarks the encoding of commands into RESP frames.
+
+The string-concatenating encoder of the previous releases is compared to the current one,
+for commands with 1, 100 and 100k arguments.
+Both produce the bytes which are sent to the socket.
+
+Usage: PYTHONPATH=src python3 bench/bench_encoder.py
+"""
+import timeit
+
+import _common
+import core
+from protocol import encoder
+from protocol.constants_resp import RespDataType, RESP_SYMB
+
+_ARGCS: tuple[int, ...] = (1, 100, 100_000)
+"""
+The numbers of arguments of the benchmarked commands.
+"""
+
+_MIN_SECONDS: float = 0.5
+"""
+How long a single measurement runs, at least.
+"""
+
+def _concat_encode_arg(arg: str) -> str:
+    encoded = RESP_SYMB[RespDataType.BULK_STRINGS] + str(len(arg)) + core.CRLF
+    encoded += (arg + core.CRLF)
+    return encoded
+
+def _concat_encoder(cmd: str, argv: list[str]) -> bytes:
+    """
+    The encoder of the previous releases:
+    the frame is concatenated string by string, then encoded as ASCII.
+    """
+    argc = len(argv)
+    encoded = RESP_SYMB[RespDataType.ARRAYS] + str(argc + 1) + core.CRLF
+    encoded += _concat_encode_arg(cmd)
+    for idx in range(argc):
+        encoded += _concat_encode_arg(argv[idx])
+    return encoded.encode(core.ASCII_ENC)
+
+def _measure(encode, cmd: str, argv: list[str]) -> float:
+    """
+    Returns:
+        float: The average seconds spent encoding the command once.
+    """
+    timer = timeit.Timer(lambda: encode(cmd, argv))
+    number, elapsed = timer.autorange()
+    while elapsed < _MIN_SECONDS:
+        number *= 2
+        elapsed = timer.timeit(number)
+    return elapsed / number
+
+def main() -> None:
+    _common.disable_logs()
+    print(f"{'args':>8} {'concat (us)':>14} {'join (us)':>12} {'speedup':>9}")
+    for argc in _ARGCS:
+        argv = [f"member:{idx}" for idx in range(argc)]
+        assert _concat_encoder("SADD", argv) == encoder("SADD", argv)
+
+        concat = _measure(_concat_encoder, "SADD", argv)
+        joined = _measure(encoder, "SADD", argv)
+        print(f"{argc:>8} {concat * 1e6:>14.2f} {joined * 1e6:>12.2f} {concat / joined:>8.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Benchmarks the formatting of repeated replies, with and without the format cache.
+
+The replies are decoded anew every time, as they are received, then formatted by `formatter()`
+and by `formatter_window()`, as the formatting workers do:
+a stream of `+OK` replies, and the reply of an `HGETALL` of 100 fields, polled over and over.
+Without the cache, every reply is formatted from scratch;
+with it, the equal outputs decoded from the previous replies share their formatted text.
+Leaves such as `+OK` are formatted without the cache either way; only the lookup is measured.
+
+Usage: PYTHONPATH=src python3 bench/bench_format_cache.py
+"""
+import importlib
+import timeit
+from unittest.mock import patch
+
+import _common
+import core
+from protocol import Decoder, FormatCache, formatter, formatter_window
+
+_REPEAT: int = 3
+"""
+How many times each measurement is repeated; the fastest one is reported.
+"""
+
+_REPLIES: dict[str, tuple[bytes, int]] = {
+    "+OK": (b"+OK\r\n", 100_000),
+    "HGETALL": (b"%100\r\n" + b"".join(f"$8\r\nfield:{idx:02d}\r\n$8\r\nvalue:{idx:02d}\r\n".encode() for idx in range(100)),
+                2_000),
+}
+"""
+The benchmarked replies, along with how many times they are received.
+"""
+
+def _per_reply(outputs: list, cache: FormatCache, format_output) -> float:
+    """
+    Returns:
+        float: The microseconds spent formatting a reply, by the fastest round.
+    """
+    # The package exports a function of the same name as the module.
+    formatter_module = importlib.import_module("protocol.formatter")
+    with patch.object(formatter_module, "format_cache", cache):
+        def run() -> None:
+            cache.clear()
+            for output in outputs:
+                format_output(output)
+        return min(timeit.repeat(run, number=1, repeat=_REPEAT)) / len(outputs) * 1e6
+
+def main() -> None:
+    _common.disable_logs()
+
+    print(f"{'reply':>8} {'entry point':>17} {'uncached (us)':>14} {'cached (us)':>12}")
+    for name, (reply, count) in _REPLIES.items():
+        outputs = [Decoder(_common.BytesReceiver(reply)).decode() for _ in range(count)]
+        for entry_point, format_output in (("formatter", formatter),
+                                           ("formatter_window", lambda output: formatter_window(output, 0, 200))):
+            uncached = _per_reply(outputs, FormatCache(0), format_output)
+            cached = _per_reply(outputs, FormatCache(core.FORMAT_CACHE_BYTES), format_output)
+            print(f"{name:>8} {entry_point:>17} {uncached:>14.3f} {cached:>12.3f}")
+
+if __name__ == "__main__":
+    main()
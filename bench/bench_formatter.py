@@ -0,0 +1,118 @@
+"""
+Benchmarks the per-element overhead of decoding and formatting replies.
+
+Flat and nested replies of 1k to 1M elements, and a deeply nested reply, are decoded by the `Decoder`,
+then formatted by the current formatter, which traverses the output with an explicit stack,
+appends the formatted chunks to a single list and joins them once,
+and by the formatter of the previous releases, which recursed once per nesting level and per element,
+and concatenated the formatted elements.
+The deeply nested reply stays below the recursion limit, so that the previous formatter can format it;
+the current one is not bounded by it.
+The elements are strings, which both formatters display alike.
+
+Usage: PYTHONPATH=src python3 bench/bench_formatter.py
+"""
+import sys
+import timeit
+
+import _common
+from protocol import Decoder, OutputStr, OutputErr, OutputSeq, OutputMap, OutputAtt, formatter
+
+_SIZES: tuple[int, ...] = (1_000, 10_000, 100_000, 1_000_000)
+"""
+How many elements the flat and nested replies are made of.
+"""
+
+_DEPTH: int = sys.getrecursionlimit() // 4
+"""
+How deep the deeply nested reply is; the previous formatter recursed more than once per level.
+"""
+
+_REPEAT: int = 3
+"""
+How many times each measurement is repeated; the fastest one is reported.
+"""
+
+def _replies(elements: int) -> dict[str, bytes]:
+    """
+    Returns:
+        dict: The benchmarked replies of a size, mapped by their names.
+    """
+    return {
+        "flat": f"*{elements}\r\n".encode() + b"".join(f"+e{idx}\r\n".encode() for idx in range(elements)),
+        "pairs": f"*{elements // 2}\r\n".encode() + b"*2\r\n$6\r\nmember\r\n$3\r\n1.5\r\n" * (elements // 2),
+        "map": f"%{elements // 2}\r\n".encode() + b"".join(f"+k{idx}\r\n+v\r\n".encode() for idx in range(elements // 2)),
+    }
+
+# The recursive formatter of the previous releases.
+def _recursive_formatter(output, prefix: str = "") -> str:
+    if isinstance(output, (OutputStr, OutputErr)):
+        return _recursive_str(output.value, prefix)
+    if isinstance(output, OutputSeq):
+        return _recursive_seq(output, prefix)
+    if isinstance(output, OutputMap):
+        return _recursive_map(output, prefix)
+    assert isinstance(output, OutputAtt)
+    return _recursive_att(output, prefix)
+
+def _recursive_str(output: str, prefix: str) -> str:
+    if prefix == "" or prefix.startswith("1) "):
+        return prefix + output
+    return "\n" + prefix + output
+
+def _recursive_seq(output: OutputSeq, prefix: str) -> str:
+    values = output.values
+    if len(values) < 1:
+        return _recursive_str("(empty sequence)", prefix)
+    formatted = _recursive_formatter(values[0], f"{prefix}1) ")
+    indent_padding = " " * len(prefix)
+    for idx in range(1, len(values)):
+        formatted += _recursive_formatter(values[idx], f"{indent_padding}{idx + 1}) ")
+    return formatted
+
+def _recursive_map(output: OutputMap, prefix: str) -> str:
+    values = output.values
+    if len(values) < 1:
+        return _recursive_str("(empty map)", prefix)
+    formatted = ""
+    indent_padding = " " * len(prefix)
+    for idx, (key, val) in enumerate(values.items()):
+        key_prefix = prefix if idx == 0 else indent_padding
+        formatted += _recursive_formatter(key, f"{key_prefix}{idx * 2 + 1}) ")
+        formatted += _recursive_formatter(val, f"{indent_padding}{idx * 2 + 2}) ")
+    return formatted
+
+def _recursive_att(output: OutputAtt, prefix: str) -> str:
+    if len(output.attributes.values) < 1:
+        return _recursive_formatter(output.payload, prefix)
+    indent_padding = " " * len(prefix)
+    optional_lf = "\n" if indent_padding == "" else ""
+    formatted = _recursive_str("Attributes:", indent_padding)
+    formatted += optional_lf + _recursive_map(output.attributes, indent_padding)
+    formatted += optional_lf + _recursive_str("Payload:", indent_padding)
+    return formatted + optional_lf + _recursive_formatter(output.payload, prefix)
+
+def _per_element(call, elements: int) -> float:
+    """
+    Returns:
+        float: The microseconds spent per element by the fastest call.
+    """
+    return min(timeit.repeat(call, number=1, repeat=_REPEAT)) / elements * 1e6
+
+def main() -> None:
+    _common.disable_logs()
+
+    print(f"{'reply':>8} {'elements':>9} {'decode (us)':>12} {'recursive (us)':>15} {'iterative (us)':>15}")
+    replies = [(name, reply, elements) for elements in _SIZES for name, reply in _replies(elements).items()]
+    replies.append(("deep", b"*1\r\n" * _DEPTH + b"+a\r\n", _DEPTH + 1))
+    for name, reply, elements in replies:
+        output = Decoder(_common.BytesReceiver(reply)).decode()
+        assert formatter(output) == _recursive_formatter(output)
+
+        decode = _per_element(lambda: Decoder(_common.BytesReceiver(reply)).decode(), elements)
+        recursive = _per_element(lambda: _recursive_formatter(output), elements)
+        iterative = _per_element(lambda: formatter(output), elements)
+        print(f"{name:>8} {elements:>9} {decode:>12.3f} {recursive:>15.3f} {iterative:>15.3f}")
+
+if __name__ == "__main__":
+    main()
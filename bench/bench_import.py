@@ -0,0 +1,93 @@
+"""
+Benchmarks the cold start of the command validation.
+
+Each scenario runs in a fresh interpreter, so nothing is imported beforehand,
+except for the `core` package, whose configuration and logging setup are not measured.
+The first validation of a command is compared when:
+    - the pattern tables are imported and compiled at import time (previous releases);
+    - the commands cache is missing, so the first validation builds it;
+    - the commands cache is up to date, so only the index and a single family are loaded.
+
+Usage: PYTHONPATH=src python3 bench/bench_import.py
+"""
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+_RUNS: int = 15
+"""
+How many interpreters each scenario is measured in.
+"""
+
+_PROLOGUE: str = """
+import logging
+import time
+from pathlib import Path
+
+import core
+logging.disable(logging.CRITICAL)
+start = time.perf_counter()
+"""
+"""
+Runs before every scenario; the measurement starts at its end.
+"""
+
+_EPILOGUE: str = """
+print(time.perf_counter() - start)
+"""
+"""
+Runs after every scenario; prints the measured seconds.
+"""
+
+_VALIDATE: str = """
+import protocol
+from protocol import cmds_cache
+cmds_cache._CACHE_PATH = Path({cache_path!r})
+protocol.validator("SET", ["key", "value", "EX", "10"])
+"""
+"""
+Validates a single command, with the commands cache at the given path.
+"""
+
+_SCENARIOS: dict[str, str] = {
+    "tables compiled at import": """
+import protocol
+from protocol.cmds_compiler import compile_families
+compile_families()
+""",
+    "import only": """
+import protocol
+""",
+    "missing cache": _VALIDATE,
+    "up to date cache": _VALIDATE,
+}
+"""
+The benchmarked scenarios mapped by their names.
+"""
+
+def _run(code: str) -> float:
+    """
+    Returns:
+        float: The seconds measured by the scenario in a fresh interpreter.
+    """
+    result = subprocess.run([sys.executable, "-c", _PROLOGUE + code + _EPILOGUE],
+                            capture_output=True, text=True, check=True, env=os.environ)
+    return float(result.stdout.split()[-1])
+
+def main() -> None:
+    print(f"{'scenario':>28} {'median (ms)':>12} {'min (ms)':>10}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache_path = os.path.join(tmp_dir, "cmds.cache")
+        for name, code in _SCENARIOS.items():
+            code = code.format(cache_path=cache_path)
+            timings = []
+            for _ in range(_RUNS):
+                if name == "missing cache" and os.path.exists(cache_path):
+                    os.remove(cache_path)
+                timings.append(_run(code))
+            print(f"{name:>28} {statistics.median(timings) * 1e3:>12.2f} {min(timings) * 1e3:>10.2f}")
+
+if __name__ == "__main__":
+    main()
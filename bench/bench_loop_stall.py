@@ -0,0 +1,76 @@
+"""
+Benchmarks how long the multiplexing loop is stalled by formatting a large `KEYS *` reply.
+
+A reply of a million keys is decoded by the `Decoder`, then handed over as the loop does.
+The previous releases formatted the whole reply on the loop thread, before handing it over.
+The current loop submits it to the formatting workers, which format its first page:
+without workers, on the loop thread, and with a pool of threads.
+The time the loop spends handing the reply over, and the time until it is delivered, are reported.
+
+Usage: PYTHONPATH=src python3 bench/bench_loop_stall.py
+"""
+import time
+from threading import Event
+from unittest.mock import patch
+
+import _common
+import core
+import formatting
+from protocol import Decoder, OutputStr, formatter
+
+_KEYS: int = 1_000_000
+"""
+How many keys the reply is made of.
+"""
+
+_REPLY: bytes = f"*{_KEYS}\r\n".encode() + b"".join(f"$14\r\nkey:{idx:010d}\r\n".encode() for idx in range(_KEYS))
+"""
+The benchmarked reply.
+"""
+
+def _previous(output) -> tuple[float, float]:
+    """
+    Returns:
+        float: The seconds the loop spent handing the reply over, as the previous releases did.
+        float: The seconds until the reply was delivered.
+    """
+    start = time.perf_counter()
+    formatter(output)
+    elapsed = time.perf_counter() - start
+    return elapsed, elapsed
+
+def _current(output, workers: int) -> tuple[float, float]:
+    """
+    Returns:
+        float: The seconds the loop spent submitting the reply to the formatting workers.
+        float: The seconds until the reply was delivered.
+    """
+    with patch.object(core, "FORMAT_WORKERS", workers):
+        # The workers are started beforehand, as they are by the first reply.
+        warm = Event()
+        formatting.submit(None, OutputStr("OK"), lambda res: warm.set())
+        warm.wait()
+
+        delivered = Event()
+        start = time.perf_counter()
+        formatting.submit(None, output, lambda res: delivered.set())
+        stall = time.perf_counter() - start
+        delivered.wait()
+        elapsed = time.perf_counter() - start
+    return stall, elapsed
+
+def main() -> None:
+    _common.disable_logs()
+    output = Decoder(_common.BytesReceiver(_REPLY)).decode()
+
+    print(f"{'formatting':>17} {'loop stall (ms)':>16} {'delivered (ms)':>15}")
+    for name, call in (("previous", lambda: _previous(output)),
+                       ("loop thread", lambda: _current(output, 0)),
+                       ("2 threads", lambda: _current(output, 2))):
+        stall, elapsed = call()
+        print(f"{name:>17} {stall * 1e3:>16.3f} {elapsed * 1e3:>15.3f}")
+    # The workers are never started again once stopped.
+    formatting.shutdown()
+
+if __name__ == "__main__":
+    main()
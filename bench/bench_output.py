@@ -0,0 +1,169 @@
+"""
+Benchmarks the memory held by decoded replies, and the construction of immutable patterns.
+
+Large replies are decoded into the slotted outputs, then into the outputs of the previous releases,
+whose instances carry a `__dict__`, whose numbers are strings, and whose integer arrays are not packed;
+the previous classes are swapped into the decoder module.
+The bytes still allocated after decoding, divided by the number of elements, are reported.
+
+The command patterns are then built with the current `Immutable` base class,
+and with the one of the previous releases, which raised and caught an exception per attribute.
+
+Usage: PYTHONPATH=src python3 bench/bench_output.py
+"""
+import importlib
+import time
+import tracemalloc
+from dataclasses import dataclass
+from frozendict import frozendict
+from typing import Any
+from unittest.mock import patch
+
+import _common
+import core
+from protocol import Decoder, OutputStr
+
+# The package exports a function under the name of the module.
+decoder_module = importlib.import_module("protocol.decoder")
+
+_ELEMENTS: int = 100_000
+"""
+How many elements each benchmarked reply is made of.
+"""
+
+_PATTERNS: int = 100_000
+"""
+How many patterns are built.
+"""
+
+_REPLIES: dict[str, bytes] = {
+    "integers": f"*{_ELEMENTS}\r\n".encode() + b"".join(f":{idx + 2}\r\n".encode() for idx in range(_ELEMENTS)),
+    "bulk strings": f"*{_ELEMENTS}\r\n".encode() + b"".join(b"$5\r\nvalue\r\n" for _ in range(_ELEMENTS)),
+    "map": f"%{_ELEMENTS // 2}\r\n".encode() + b"".join(f"+k{idx}\r\n:1\r\n".encode() for idx in range(_ELEMENTS // 2)),
+    "nested arrays": f"*{_ELEMENTS // 2}\r\n".encode() + b"*1\r\n+a\r\n" * (_ELEMENTS // 2),
+}
+"""
+The benchmarked replies mapped by their names; the elements of nested arrays are counted once.
+"""
+
+# The outputs of the previous releases: frozen dataclasses without slots.
+class _DictOutput:
+    pass
+
+@dataclass(frozen=True)
+class _DictOutputStr(_DictOutput):
+    value: str
+
+@dataclass(frozen=True)
+class _DictOutputErr(_DictOutput):
+    value: str
+
+@dataclass(frozen=True)
+class _DictOutputSeq(_DictOutput):
+    values: tuple
+
+@dataclass(frozen=True)
+class _DictOutputMap(_DictOutput):
+    values: frozendict
+
+@dataclass(frozen=True)
+class _DictOutputAtt(_DictOutput):
+    attributes: _DictOutputMap
+    payload: _DictOutput
+
+_PREVIOUS_OUTPUTS: dict[str, Any] = {
+    "OutputStr": _DictOutputStr, "OutputErr": _DictOutputErr,
+    "OutputInt": lambda value: _DictOutputStr(str(value)),
+    "double": _DictOutputStr,
+    "OutputBool": lambda value: _DictOutputStr("t" if value else "f"),
+    "sequence": lambda values: _DictOutputSeq(tuple(values)),
+    "OutputMap": _DictOutputMap, "OutputAtt": _DictOutputAtt,
+}
+"""
+The previous output classes, mapped by the names the decoder knows them by.
+The shared outputs of the most common lines are built beforehand, so they are not swapped;
+the benchmarked integers are not among them.
+"""
+
+class _ExceptionImmutable:
+    """
+    The `Immutable` base class of the previous releases.
+    """
+    def __setattr__(self, name: str, value: Any) -> None:
+        try:
+            _ = self.__getattribute__(name)
+            raise core.AssignmentError(f"Cannot modify '{name}'")
+        except AttributeError:
+            super().__setattr__(name, value)
+
+# Both patterns are built the same way; only their base class differs.
+class _ExceptionArgStr(_ExceptionImmutable):
+    def __init__(self, pattern: str) -> None:
+        super().__init__()
+        self.pattern = pattern
+
+class _SlotsArgStr(core.Immutable):
+    __slots__ = ("pattern",)
+
+    def __init__(self, pattern: str) -> None:
+        super().__init__()
+        self.pattern = pattern
+
+def _decode(reply: bytes) -> tuple[float, float]:
+    """
+    Returns:
+        float: The bytes held by the decoded reply, per element.
+        float: The microseconds spent decoding an element.
+    """
+    start = time.perf_counter()
+    Decoder(_common.BytesReceiver(reply)).decode()
+    elapsed = time.perf_counter() - start
+
+    receiver = _common.BytesReceiver(reply)
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    output = Decoder(receiver).decode()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del output
+    return (after - before) / _ELEMENTS, elapsed / _ELEMENTS * 1e6
+
+def _build(pattern_cls: type) -> tuple[float, float]:
+    """
+    Returns:
+        float: The bytes held by a pattern.
+        float: The microseconds spent building a pattern.
+    """
+    start = time.perf_counter()
+    for _ in range(_PATTERNS):
+        pattern_cls("KEYWORD")
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    patterns = [pattern_cls("KEYWORD") for _ in range(_PATTERNS)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del patterns
+    return (after - before) / _PATTERNS, elapsed / _PATTERNS * 1e6
+
+def main() -> None:
+    _common.disable_logs()
+    assert not hasattr(OutputStr("v"), "__dict__")
+
+    print(f"{'reply':>14} {'outputs':>8} {'bytes/elem':>11} {'us/elem':>8}")
+    for name, reply in _REPLIES.items():
+        with patch.multiple(decoder_module, **_PREVIOUS_OUTPUTS):
+            held, elapsed = _decode(reply)
+        print(f"{name:>14} {'dict':>8} {held:>11.1f} {elapsed:>8.3f}")
+        held, elapsed = _decode(reply)
+        print(f"{name:>14} {'slots':>8} {held:>11.1f} {elapsed:>8.3f}")
+
+    print()
+    print(f"{'pattern':>14} {'bytes':>8} {'us':>8}")
+    for name, pattern_cls in (("exception", _ExceptionArgStr), ("slots", _SlotsArgStr)):
+        held, elapsed = _build(pattern_cls)
+        print(f"{name:>14} {held:>8.1f} {elapsed:>8.3f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Benchmarks the processing of the user's input into the bytes sent to the socket.
+
+The two steps path (`parser()`, then `encoder()`) is compared to the fused one (`parse_encode()`).
+Quoted inputs take the two steps path in both cases,
+so they show the cost of checking for the fast path.
+
+Usage: PYTHONPATH=src python3 bench/bench_parse_encode.py
+"""
+import timeit
+
+import _common
+from protocol import parser, encoder, parse_encode
+
+_INPUTS: dict[str, str] = {
+    "GET": "GET user:1000",
+    "SET": "SET user:1000 alice",
+    "SADD 100": "SADD set " + " ".join(f"member:{idx}" for idx in range(100)),
+    "SADD 100k": "SADD set " + " ".join(f"member:{idx}" for idx in range(100_000)),
+    "SET quoted": "SET key \"hello world\"",
+}
+"""
+The benchmarked inputs mapped by their names.
+"""
+
+_MIN_SECONDS: float = 0.5
+"""
+How long a single measurement runs, at least.
+"""
+
+def _two_steps(input: str) -> bytes:
+    cmd, argv = parser(input)
+    return encoder(cmd, argv)
+
+def _measure(process, input: str) -> float:
+    """
+    Returns:
+        float: The average seconds spent processing the input once.
+    """
+    timer = timeit.Timer(lambda: process(input))
+    number, elapsed = timer.autorange()
+    while elapsed < _MIN_SECONDS:
+        number *= 2
+        elapsed = timer.timeit(number)
+    return elapsed / number
+
+def main() -> None:
+    _common.disable_logs()
+    print(f"{'input':>12} {'two steps (us)':>16} {'fused (us)':>12} {'speedup':>9}")
+    for name, input in _INPUTS.items():
+        assert _two_steps(input) == parse_encode(input)
+
+        two_steps = _measure(_two_steps, input)
+        fused = _measure(parse_encode, input)
+        print(f"{name:>12} {two_steps * 1e6:>16.2f} {fused * 1e6:>12.2f} {two_steps / fused:>8.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Benchmarks the tokenization of the user's input.
+
+The character-by-character parser of the previous releases is compared to the current one,
+for arguments from 10B to 10MB: unquoted, quoted, and quoted JSON full of escaped quotes.
+The previous parser is quadratic for long arguments,
+so it is skipped above `_SLOW_MAX_SIZE`.
+
+Usage: PYTHONPATH=src python3 bench/bench_parser.py
+"""
+import time
+
+import _common
+import core
+from protocol import parser
+from protocol.constants_resp import SPACE, QUOTE_DOUBLE, QUOTE_SINGLE, QUOTE_TYPE
+from protocol.exceptions import QuoteError, SpaceError
+
+_SIZES: tuple[int, ...] = (10, 1_000, 100_000, 10_000_000)
+"""
+The sizes of the benchmarked arguments, in characters.
+"""
+
+_SLOW_MAX_SIZE: int = 100_000
+"""
+The largest argument given to the previous parser.
+"""
+
+_MIN_SECONDS: float = 0.2
+"""
+How long a single measurement runs, at least.
+"""
+
+class _CharParser:
+    """
+    The argument parser of the previous releases:
+    the input is walked one character at a time, and every argument grows by concatenation.
+    """
+    _ESCAPE_CHAR = "\\"
+
+    def __init__(self, input: str, start_idx: int) -> None:
+        self._input = input
+        self._input_len = len(input)
+        self._idx = start_idx
+        self.argv = []
+        while self._idx < self._input_len:
+            while self._idx < self._input_len and self._input[self._idx] == SPACE:
+                self._idx += 1
+            if self._idx == self._input_len:
+                break
+            char = self._input[self._idx]
+            if char == QUOTE_DOUBLE or char == QUOTE_SINGLE:
+                self._idx += 1
+                arg = self._visit_quoted(char)
+            else:
+                arg = self._visit_unquoted()
+            if self._idx < self._input_len and self._input[self._idx] != SPACE:
+                raise SpaceError("Arguments must be separated by space")
+            self.argv.append(arg)
+
+    def _visit_quoted(self, QUOTE: str) -> str:
+        arg = core.EMPTY_STR
+        while self._idx < self._input_len:
+            char = self._input[self._idx]
+            if char == QUOTE:
+                self._idx += 1
+                return arg
+            if char != _CharParser._ESCAPE_CHAR:
+                arg += char; self._idx += 1; continue
+            if self._idx + 1 == self._input_len:
+                arg += char; self._idx += 1; continue
+            next_char = self._input[self._idx + 1]
+            escaped = QUOTE_TYPE[QUOTE].get(next_char)
+            arg += escaped if escaped is not None else (char + next_char)
+            self._idx += 2
+        raise QuoteError("Argument was not ended with a (correct) quote")
+
+    def _visit_unquoted(self) -> str:
+        arg = core.EMPTY_STR
+        while self._idx < self._input_len:
+            char = self._input[self._idx]
+            if char == QUOTE_DOUBLE or char == QUOTE_SINGLE:
+                raise QuoteError("Unquoted values must NOT contain quotes")
+            if char == SPACE:
+                return arg
+            arg += char
+            self._idx += 1
+        return arg
+
+def _char_parser(input: str) -> tuple[str, list[str]]:
+    space_idx = input.find(SPACE)
+    return input[:space_idx], _CharParser(input, space_idx + 1).argv
+
+def _inputs(size: int) -> dict[str, str]:
+    """
+    Returns:
+        dict: The benchmarked inputs mapped by their names.
+    """
+    text = ("lorem ipsum " * (size // 12 + 1))[:size]
+    json = ("{\"k\": [1, 2]} " * (size // 14 + 1))[:size]
+    return {
+        "unquoted": "SET key " + "x" * size,
+        "quoted": "SET key \"" + text + "\"",
+        "escaped": "SET key \"" + json.replace("\"", "\\\"") + "\"",
+    }
+
+def _measure(parse, input: str) -> float:
+    """
+    Returns:
+        float: The average seconds spent parsing the input once.
+    """
+    number = 0
+    start = time.perf_counter()
+    while (elapsed := time.perf_counter() - start) < _MIN_SECONDS or number == 0:
+        parse(input)
+        number += 1
+    return elapsed / number
+
+def main() -> None:
+    _common.disable_logs()
+    print(f"{'size':>10} {'argument':>10} {'per-char (ms)':>15} {'runs (ms)':>12}")
+    for size in _SIZES:
+        for name, input in _inputs(size).items():
+            fast = _measure(parser, input)
+            if size > _SLOW_MAX_SIZE:
+                slow = "skipped"
+            else:
+                assert _char_parser(input) == parser(input)
+                slow = f"{_measure(_char_parser, input) * 1e3:.3f}"
+            print(f"{size:>10} {name:>10} {slow:>15} {fast * 1e3:>12.3f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""
+Benchmarks the receive path of a connection.
+
+Bulk string replies are received from a local socket in 4KB chunks,
+and consumed by the decoder primitives.
+The copying receiver of the previous releases is compared to the current one.
+
+Every copy of a received byte into a new Python object is an allocation,
+so the bytes allocated per byte received count the copies made in user space.
+The copy from the kernel into the receive buffer is made by both receivers;
+the current one reuses its buffer, so that copy allocates nothing.
+
+Usage: PYTHONPATH=src python3 bench/bench_receiver.py
+"""
+import socket
+import threading
+import time
+import tracemalloc
+
+import _common
+import core
+from network import Receiver
+
+logger = core.get_logger(__name__)
+
+_PAYLOAD_SIZES: tuple[int, ...] = (1 << 10, 1 << 16, 1 << 20)
+"""
+The sizes of the benchmarked bulk strings.
+"""
+
+_ROUNDS: int = 200
+"""
+How many replies are received for the throughput measurement.
+"""
+
+_CHUNK_SIZE: int = 4096
+"""
+How many bytes a single `recv()` call reads.
+"""
+
+class _CopyingReceiver:
+    """
+    The receive path of the previous releases:
+    `recv()` returns a new object, which extends the buffer,
+    and the consumed bytes are sliced out of the buffer before being decoded.
+    """
+    def __init__(self, socket: socket.socket) -> None:
+        self._socket = socket
+        self._buf = bytearray()
+        self._idx = 0
+
+    def empty_buf(self) -> bool:
+        return self._idx >= len(self._buf)
+
+    def recv(self, bufsize: int) -> int:
+        data = self._socket.recv(bufsize)
+        if self.empty_buf():
+            self._buf.clear()
+            self._idx = 0
+        self._buf.extend(data)
+        logger.debug(f"Received {len(data)} bytes from socket. Available: {len(self._buf) - self._idx}.")
+        return len(data)
+
+    def consume(self, bufsize: int) -> str:
+        if self._idx + bufsize > len(self._buf):
+            raise core.PartialResponseError(f"Insufficient buffer bytes: {len(self._buf) - self._idx}. Needed: {bufsize}")
+        data = self._buf[self._idx : self._idx + bufsize]
+        self._idx += bufsize
+        logger.debug(f"Consumed {bufsize} bytes from buffer. Remaining: {len(self._buf) - self._idx}.")
+        return data.decode()
+
+    def consume_crlf(self) -> str:
+        ASCII_CRLF = core.CRLF.encode()
+        try:
+            end_idx = self._buf.index(ASCII_CRLF, self._idx)
+        except ValueError:
+            raise core.PartialResponseError("Buffer does not contain a CRLF")
+        data = self._buf[self._idx : end_idx]
+        end_idx += len(ASCII_CRLF)
+        logger.debug(f"Consumed {end_idx - self._idx} bytes from buffer. Remaining: {len(self._buf) - end_idx}.")
+        self._idx = end_idx
+        return data.decode()
+
+def _bulk_reply(size: int) -> bytes:
+    return f"${size}{core.CRLF}".encode() + b"x" * size + core.CRLF.encode()
+
+def _consume_reply(receiver: Receiver | _CopyingReceiver, size: int) -> None:
+    """
+    Consumes a single bulk string reply, receiving more bytes whenever they are missing.
+    """
+    consumers = (
+        receiver.consume_crlf,
+        lambda: receiver.consume(size),
+        lambda: receiver.consume(len(core.CRLF)))
+    for consume in consumers:
+        while True:
+            try:
+                consume()
+                break
+            except core.PartialResponseError:
+                receiver.recv(_CHUNK_SIZE)
+
+def _run(receiver_cls: type, size: int) -> tuple[float, float]:
+    """
+    Receives `_ROUNDS` replies from a local socket, fed by another thread.
+    The first reply warms the buffers up and is not measured.
+
+    Returns:
+        float: The bytes allocated per byte received.
+        float: The received megabytes per second.
+    """
+    reply = _bulk_reply(size)
+    writer, reader = socket.socketpair()
+    feeder = threading.Thread(target=lambda: [writer.sendall(reply) for _ in range(_ROUNDS + 1)])
+    feeder.start()
+
+    receiver = receiver_cls(reader)
+    _consume_reply(receiver, size)
+
+    allocated = 0
+    original_recv = receiver.recv
+    original_consume = receiver.consume
+    def measure(call):
+        def measured(*args):
+            nonlocal allocated
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            result = call(*args)
+            _, peak = tracemalloc.get_traced_memory()
+            allocated += peak - before
+            return result
+        return measured
+
+    # The allocations are measured separately, since tracing slows everything down.
+    receiver.recv = measure(original_recv)
+    receiver.consume = measure(original_consume)
+    tracemalloc.start()
+    _consume_reply(receiver, size)
+    tracemalloc.stop()
+    receiver.recv = original_recv
+    receiver.consume = original_consume
+
+    start = time.perf_counter()
+    for _ in range(_ROUNDS - 1):
+        _consume_reply(receiver, size)
+    elapsed = time.perf_counter() - start
+
+    feeder.join()
+    writer.close()
+    reader.close()
+    return allocated / len(reply), (_ROUNDS - 1) * len(reply) / elapsed / (1 << 20)
+
+def main() -> None:
+    _common.disable_logs()
+    print(f"{'payload':>10} {'receiver':>10} {'alloc/byte':>12} {'MB/s':>10}")
+    for size in _PAYLOAD_SIZES:
+        for name, receiver_cls in (("copying", _CopyingReceiver), ("zero-copy", Receiver)):
+            allocated, throughput = _run(receiver_cls, size)
+            print(f"{size:>10} {name:>10} {allocated:>12.2f} {throughput:>10.1f}")
+
+if __name__ == "__main__":
+    main()
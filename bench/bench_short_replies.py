@@ -0,0 +1,92 @@
+"""
+Benchmarks the decoding of a stream of short replies, such as the replies to pipelined `SET` commands.
+
+A million replies are received from a local socket in chunks, and decoded one after the other.
+The current `Decoder` matches the raw header lines, and shares the outputs of the most common ones.
+The previous releases decoded every line into a string, looked its symbol and its data type up,
+and built a new output; that header path is reproduced below.
+
+Usage: PYTHONPATH=src python3 bench/bench_short_replies.py
+"""
+import socket
+import threading
+import time
+from frozendict import frozendict
+
+import _common
+import core
+from network import Receiver
+from protocol import Decoder, OutputStr
+from protocol.constants_resp import RespDataType, SYMB_TYPE
+
+_REPLIES: int = 1_000_000
+"""
+How many replies the stream is made of.
+"""
+
+_CHUNK_SIZE: int = 1 << 16
+"""
+How many bytes a single `recv()` call reads.
+"""
+
+_STREAMS: dict[str, bytes] = {
+    "+OK": b"+OK\r\n" * _REPLIES,
+    ":42": b":42\r\n" * _REPLIES,
+}
+"""
+The benchmarked streams mapped by their names; `:42` is not a shared output.
+"""
+
+# The header path of the previous releases, for simple strings and integers.
+_PREVIOUS_HANDLERS = frozendict({
+    RespDataType.SIMPLE_STRINGS: lambda decoder, data_type, content: OutputStr(content),
+    RespDataType.INTEGERS: lambda decoder, data_type, content: OutputStr(content),
+})
+
+class _PreviousDecoder(Decoder):
+    def _decode_header(self):
+        line = self._receiver.consume_crlf()
+        symb = line[:core.STR_TRAVERSAL_STRIDE]
+        data_type = SYMB_TYPE[symb]
+        handler = _PREVIOUS_HANDLERS[data_type]
+        return handler(self, data_type, line[core.STR_TRAVERSAL_STRIDE:])
+
+def _receive(decoder_cls: type, stream: bytes) -> float:
+    """
+    Returns:
+        float: The replies decoded per second.
+    """
+    reader, writer = socket.socketpair()
+    sender = threading.Thread(target=writer.sendall, args=(stream,))
+    sender.start()
+
+    receiver = Receiver(reader)
+    decoder = decoder_cls(receiver)
+    decoded = 0
+    start = time.perf_counter()
+    while decoded < _REPLIES:
+        receiver.recv(_CHUNK_SIZE)
+        try:
+            while True:
+                decoder.decode()
+                decoded += 1
+        except core.PartialResponseError:
+            continue
+    elapsed = time.perf_counter() - start
+
+    sender.join()
+    reader.close()
+    writer.close()
+    return _REPLIES / elapsed
+
+def main() -> None:
+    _common.disable_logs()
+
+    print(f"{'reply':>6} {'previous (replies/s)':>21} {'current (replies/s)':>20}")
+    for name, stream in _STREAMS.items():
+        previous = _receive(_PreviousDecoder, stream)
+        current = _receive(Decoder, stream)
+        print(f"{name:>6} {previous:>21,.0f} {current:>20,.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Benchmarks the peak memory of formatting a large `KEYS *` reply at once, and lazily.
+
+A reply of a million keys is decoded by the `Decoder`, then formatted into a single string by `formatter()`,
+and line by line by `formatter_lines()`, whose lines are consumed and dropped, as a display or an export would.
+The peak of the memory allocated while formatting, and the time to format, are reported.
+
+Usage: PYTHONPATH=src python3 bench/bench_stream.py
+"""
+import time
+import tracemalloc
+from collections.abc import Callable
+
+import _common
+from protocol import Decoder, formatter, formatter_lines, formatter_chunks
+
+_KEYS: int = 1_000_000
+"""
+How many keys the reply is made of.
+"""
+
+_REPLY: bytes = f"*{_KEYS}\r\n".encode() + b"".join(f"$14\r\nkey:{idx:010d}\r\n".encode() for idx in range(_KEYS))
+"""
+The benchmarked reply.
+"""
+
+def _consume(lines) -> None:
+    for _ in lines:
+        pass
+
+def _measure(call: Callable[[], object]) -> tuple[float, float]:
+    """
+    Returns:
+        float: The peak of the memory allocated by the call, in MB.
+        float: The seconds spent by the call, untraced.
+    """
+    start = time.perf_counter()
+    call()
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    call()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / (1 << 20), elapsed
+
+def main() -> None:
+    _common.disable_logs()
+    output = Decoder(_common.BytesReceiver(_REPLY)).decode()
+
+    print(f"{'formatter':>18} {'peak (MB)':>10} {'time (s)':>9}")
+    for name, call in (("formatter", lambda: formatter(output)),
+                       ("formatter_lines", lambda: _consume(formatter_lines(output))),
+                       ("formatter_chunks", lambda: _consume(formatter_chunks(output)))):
+        peak, elapsed = _measure(call)
+        print(f"{name:>18} {peak:>10.1f} {elapsed:>9.3f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Benchmarks the flat tape against the output tree, on a large `ZRANGE ... WITHSCORES` reply.
+
+The RESP3 reply, an array of member-score pairs, is received from a local socket in chunks,
+and decoded as it arrives, by the `Decoder` and by the `TapeDecoder`.
+The time to decode it, the bytes still allocated by the decoded reply, and the time to format it are reported.
+
+Usage: PYTHONPATH=src python3 bench/bench_tape.py
+"""
+import socket
+import threading
+import time
+import tracemalloc
+
+import _common
+import core
+from network import Receiver
+from protocol import Decoder, TapeDecoder, formatter
+
+_PAIRS: int = 500_000
+"""
+How many member-score pairs the reply is made of; each pair counts as two elements.
+"""
+
+_CHUNK_SIZE: int = 1 << 16
+"""
+How many bytes a single `recv()` call reads.
+"""
+
+_REPLY: bytes = f"*{_PAIRS}\r\n".encode() + b"".join(
+    f"*2\r\n$16\r\nmember{idx:010d}\r\n,{idx}.5\r\n".encode() for idx in range(_PAIRS))
+"""
+The benchmarked reply.
+"""
+
+def _receive(decoder_cls: type, trace: bool) -> tuple[float, float, object]:
+    """
+    Returns:
+        float: The seconds spent receiving and decoding the reply.
+        float: The bytes still allocated by the decoded reply, per element, if traced.
+        obj: The decoded reply.
+    """
+    reader, writer = socket.socketpair()
+    sender = threading.Thread(target=writer.sendall, args=(_REPLY,))
+    sender.start()
+
+    receiver = Receiver(reader)
+    decoder = decoder_cls(receiver)
+    if trace:
+        tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    start = time.perf_counter()
+    while True:
+        receiver.recv(_CHUNK_SIZE)
+        try:
+            output = decoder.decode()
+            break
+        except core.PartialResponseError:
+            continue
+    elapsed = time.perf_counter() - start
+    # The receive buffer is not part of the decoded reply.
+    receiver.cleanup()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    sender.join()
+    reader.close()
+    writer.close()
+    return elapsed, (after - before) / (_PAIRS * 2), output
+
+def main() -> None:
+    _common.disable_logs()
+
+    print(f"{'decoded':>8} {'decode (s)':>11} {'bytes/elem':>11} {'format (s)':>11}")
+    formatted = {}
+    for name, decoder_cls in (("tree", Decoder), ("tape", TapeDecoder)):
+        elapsed, _, output = _receive(decoder_cls, trace=False)
+        start = time.perf_counter()
+        formatted[name] = formatter(output)
+        format_time = time.perf_counter() - start
+        del output
+
+        _, held, output = _receive(decoder_cls, trace=True)
+        del output
+        print(f"{name:>8} {elapsed:>11.3f} {held:>11.1f} {format_time:>11.3f}")
+    assert formatted["tree"] == formatted["tape"]
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Benchmarks the validation of commands against their syntax.
+
+Every command of the predefined tables is validated in several forms:
+without its optional sections, and with all of them, once for each option of its option sets.
+The compilation of the tables, done once at startup, is measured as well.
+
+Usage: PYTHONPATH=src python3 bench/bench_validator.py
+"""
+import time
+import timeit
+
+import _common
+from protocol import parser, validator
+from protocol.cmds import CMDS, ArgInt, ArgFlt, ArgStr, ArgSet, VariadicKey, \
+                          Vitals, OptSet, Opts, KeyedVariadic
+from protocol.cmds_compiler import compile_families
+
+_MIN_SECONDS: float = 0.2
+"""
+How long a single measurement runs, at least.
+"""
+
+_SLOWEST_NUMBER: int = 1000
+"""
+How many times each form is validated, when looking for the slowest one.
+"""
+
+def _sample(item, full: bool, choice: int) -> list[str]:
+    """
+    Returns:
+        list[str]: Arguments matching the item; optional sections are only included if `full` is set.
+    """
+    if isinstance(item, (tuple, Vitals)):
+        items = item.patterns if isinstance(item, Vitals) else item
+        return [arg for sub in items for arg in _sample(sub, full, choice)]
+    if isinstance(item, OptSet):
+        if not full:
+            return []
+        options = sorted(item.patterns, key=lambda option: " ".join(_sample(option, full, choice)))
+        return _sample(options[choice % len(options)], full, choice)
+    if isinstance(item, KeyedVariadic):
+        return _sample(item.key, full, choice) + _sample(item.patterns, full, choice) if full else []
+    if isinstance(item, Opts):
+        # Variadic sections are repeated once.
+        return _sample(item.patterns, full, choice) if full else []
+    if isinstance(item, VariadicKey):
+        return _sample(item.pattern, full, choice)
+    if isinstance(item, ArgSet):
+        return [min(member.pattern for member in item.patterns)]
+    if isinstance(item, ArgStr):
+        return [item.pattern]
+    if isinstance(item, ArgFlt):
+        return ["1.5"]
+    if isinstance(item, ArgInt):
+        return ["1"]
+    return ["value"]
+
+def _max_choices(item) -> int:
+    if isinstance(item, OptSet):
+        return max(len(item.patterns), *map(_max_choices, item.patterns))
+    if isinstance(item, tuple):
+        return max(map(_max_choices, item), default=1)
+    if isinstance(item, (Vitals, Opts)):
+        return _max_choices(item.patterns)
+    return 1
+
+def _forms() -> list[str]:
+    """
+    Returns:
+        list[str]: Every benchmarked input.
+    """
+    forms: list[str] = []
+    for cmd_dict in CMDS:
+        for name, sections in cmd_dict.items():
+            if not isinstance(sections, tuple):
+                sections = (sections,)
+            inputs = {" ".join([name] + _sample(sections, False, 0))}
+            for choice in range(_max_choices(sections)):
+                inputs.add(" ".join([name] + _sample(sections, True, choice)))
+            forms.extend(sorted(inputs))
+    return forms
+
+def _measure(call) -> float:
+    """
+    Returns:
+        float: The average seconds spent by a single call.
+    """
+    timer = timeit.Timer(call)
+    number, elapsed = timer.autorange()
+    while elapsed < _MIN_SECONDS:
+        number *= 2
+        elapsed = timer.timeit(number)
+    return elapsed / number
+
+def main() -> None:
+    _common.disable_logs()
+
+    start = time.perf_counter()
+    families = compile_families()
+    compile_time = time.perf_counter() - start
+    compiled = [data for family in families.values() for data in family.values()]
+    states = sum(len(transitions) for _, _, transitions, _ in compiled)
+    print(f"Compiled {len(compiled)} commands into {states} states in {compile_time * 1e3:.2f} ms.")
+
+    raw_forms = _forms()
+    forms = [parser(form) for form in raw_forms]
+
+    def validate_all() -> None:
+        for cmd, argv in forms:
+            validator(cmd, argv)
+
+    def parse_all() -> None:
+        for form in raw_forms:
+            parser(form)
+
+    validation = _measure(validate_all) / len(forms)
+    parsing = _measure(parse_all) / len(forms)
+    print(f"{'forms':>8} {'validate (us)':>15} {'parse (us)':>12}")
+    print(f"{len(forms):>8} {validation * 1e6:>15.2f} {parsing * 1e6:>12.2f}")
+
+    slowest_time, slowest = max((timeit.timeit(lambda: validator(cmd, argv), number=_SLOWEST_NUMBER), form)
+                                for form, (cmd, argv) in zip(raw_forms, forms))
+    print(f"Slowest form ({slowest_time / _SLOWEST_NUMBER * 1e6:.2f} us): {slowest}")
+
+if __name__ == "__main__":
+    main()
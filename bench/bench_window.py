@@ -0,0 +1,84 @@
+"""
+Benchmarks the time to display the first page of a large `KEYS *` reply.
+
+A reply of four million keys is received from a local socket in chunks,
+and decoded by the `Decoder`, as a tree, and by the `TapeDecoder`, as a tape.
+Both are formatted whole by `formatter()`, as every response was before being displayed,
+and by `formatter_window()`, which only formats a page of the reply:
+the first page, displayed by the chat, and a page from the middle of the reply.
+
+Usage: PYTHONPATH=src python3 bench/bench_window.py
+"""
+import socket
+import threading
+import timeit
+
+import _common
+import core
+from network import Receiver
+from protocol import Decoder, TapeDecoder, formatter, formatter_window
+
+_KEYS: int = 4_000_000
+"""
+How many keys the reply is made of.
+"""
+
+_PAGE_SIZE: int = 200
+"""
+How many keys a page is made of, as displayed by the chat.
+"""
+
+_CHUNK_SIZE: int = 1 << 16
+"""
+How many bytes a single `recv()` call reads.
+"""
+
+_REPLY: bytes = f"*{_KEYS}\r\n".encode() + b"".join(f"$14\r\nkey:{idx:010d}\r\n".encode() for idx in range(_KEYS))
+"""
+The benchmarked reply.
+"""
+
+def _receive(decoder_cls: type) -> object:
+    """
+    Returns:
+        obj: The decoded reply.
+    """
+    reader, writer = socket.socketpair()
+    sender = threading.Thread(target=writer.sendall, args=(_REPLY,))
+    sender.start()
+
+    receiver = Receiver(reader)
+    decoder = decoder_cls(receiver)
+    while True:
+        receiver.recv(_CHUNK_SIZE)
+        try:
+            output = decoder.decode()
+            break
+        except core.PartialResponseError:
+            continue
+
+    sender.join()
+    reader.close()
+    writer.close()
+    return output
+
+def _ms(call) -> float:
+    """
+    Returns:
+        float: The milliseconds spent by the fastest of a few calls.
+    """
+    return min(timeit.repeat(call, number=1, repeat=3)) * 1e3
+
+def main() -> None:
+    _common.disable_logs()
+
+    print(f"{'reply':>6} {'formatter (ms)':>15} {'first page (ms)':>16} {'middle page (ms)':>17}")
+    for name, decoder_cls in (("tree", Decoder), ("tape", TapeDecoder)):
+        output = _receive(decoder_cls)
+        whole = _ms(lambda: formatter(output))
+        first = _ms(lambda: formatter_window(output, 0, _PAGE_SIZE))
+        middle = _ms(lambda: formatter_window(output, _KEYS // 2, _PAGE_SIZE))
+        print(f"{name:>6} {whole:>15.1f} {first:>16.3f} {middle:>17.3f}")
+
+if __name__ == "__main__":
+    main()
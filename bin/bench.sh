@@ -0,0 +1,13 @@
+#!/bin/bash
+
+# Ensure that the virtual environment is activated.
+source ./.venv/bin/activate
+
+# The benchmarks import the application packages the same way the application does.
+export PYTHONPATH=src
+
+for bench in ./bench/bench_*.py; do
+    echo "Running $bench..."
+    python3 "$bench"
+    echo
+done
@@ -10,4 +10,7 @@ which python
 
 python3 -m pip install -r requirements.txt
 
+# Compile the syntax of the predefined commands ahead of the first run.
+PYTHONPATH=src python3 -m protocol.cmds_cache
+
 echo "Environment setup complete."
@@ -17,5 +17,9 @@ __all__ = ["Addr", "StageEnum", "Immutable",
            "RCError", "AssignmentError", "NetworkError",
            "PartialResponseError", "PartialRequestError", "ConnectionCountError",
            "IS_CLI", "STAGE", "TLS_ENFORCED", "MAX_CONNECTIONS",
+           "PIPELINE_DEPTH", "RECV_BUF_HIGH_WATER", "READ_BUDGET",
+           "RECV_BUFSIZE_MIN", "RECV_BUFSIZE_MAX", "SET_SO_RCVBUF",
+           "VALIDATE_CMDS", "DECODE_TAPE", "FORMAT_WORKERS",
+           "FORMAT_CACHE_BYTES",
            "FILE_HANDLER", "STDOUT_HANDLER", "STDERR_HANDLER",
            "get_logger"]
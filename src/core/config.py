@@ -13,11 +13,61 @@ from .constants import StageEnum
 from .util import LogCompressor
 
 __all__ = ["IS_CLI", "STAGE", "TLS_ENFORCED", "MAX_CONNECTIONS",
-           "FILE_HANDLER", "STDOUT_HANDLER", "STDERR_HANDLER"]
+           "PIPELINE_DEPTH", "RECV_BUF_HIGH_WATER", "READ_BUDGET",
+           "RECV_BUFSIZE_MIN", "RECV_BUFSIZE_MAX", "SET_SO_RCVBUF",
+           "VALIDATE_CMDS", "DECODE_TAPE", "FORMAT_WORKERS",
+           "FORMAT_CACHE_BYTES", "FILE_HANDLER", "STDOUT_HANDLER", "STDERR_HANDLER"]
 
 _dotenv_dict = dotenv_values()
 _found_invalid = False
 
+def _get_bounded_int(key: str, minimum: int, maximum: int, default: int) -> int:
+    """
+    Internal method.
+
+    Reads an integer setting from the ".env" file.
+
+    Returns:
+        int: The provided value, or the default one if it is missing, invalid or out of bounds.
+    """
+    global _found_invalid
+    value_str = _dotenv_dict.get(key)
+    if value_str is None:
+        return default
+    
+    try:
+        value = int(value_str)
+    except ValueError:
+        _found_invalid = True
+        return default
+    
+    if not minimum <= value <= maximum:
+        _found_invalid = True
+        return default
+    return value
+
+def _get_bool(key: str, default: bool) -> bool:
+    """
+    Internal method.
+
+    Reads a case-insensitive boolean setting ("True"/"False") from the ".env" file.
+
+    Returns:
+        bool: The provided value, or the default one if it is missing or invalid.
+    """
+    global _found_invalid
+    value_str = _dotenv_dict.get(key)
+    if value_str is None:
+        return default
+    
+    value_str = value_str.upper()
+    if value_str == "TRUE":
+        return True
+    if value_str == "FALSE":
+        return False
+    _found_invalid = True
+    return default
+
 # ------------------------------------------------------------
 # -------------------------- IS_CLI --------------------------
 # ------------------------------------------------------------
@@ -95,6 +145,209 @@ MAX_CONNECTIONS = _max_connections
 Maximum allowed concurrent connections.
 """
 
+# ------------------------------------------------------------
+# ---------------------- PIPELINE_DEPTH ----------------------
+# ------------------------------------------------------------
+
+_MIN_PIPELINE_DEPTH = 1
+"""
+Minimum number of commands in flight; no pipelining at all.
+"""
+_MAX_PIPELINE_DEPTH = 1024
+"""
+Maximum number of commands in flight.
+"""
+_DEFAULT_PIPELINE_DEPTH = 16
+"""
+Default number of commands in flight.
+"""
+
+PIPELINE_DEPTH = _get_bounded_int("PIPELINE_DEPTH",
+                                  _MIN_PIPELINE_DEPTH,
+                                  _MAX_PIPELINE_DEPTH,
+                                  _DEFAULT_PIPELINE_DEPTH)
+"""
+Default maximum number of commands sent on a connection before receiving their results.
+"""
+
+# ------------------------------------------------------------
+# ------------------- RECV_BUF_HIGH_WATER --------------------
+# ------------------------------------------------------------
+
+_MIN_RECV_BUF_HIGH_WATER = 0
+"""
+Minimum high-water mark; the consumed bytes are discarded as soon as possible.
+"""
+_MAX_RECV_BUF_HIGH_WATER = 1 << 30
+"""
+Maximum high-water mark (1GB).
+"""
+_DEFAULT_RECV_BUF_HIGH_WATER = 1 << 16
+"""
+Default high-water mark (64KB).
+"""
+
+RECV_BUF_HIGH_WATER = _get_bounded_int("RECV_BUF_HIGH_WATER",
+                                       _MIN_RECV_BUF_HIGH_WATER,
+                                       _MAX_RECV_BUF_HIGH_WATER,
+                                       _DEFAULT_RECV_BUF_HIGH_WATER)
+"""
+How many consumed bytes a receive buffer may keep before compacting itself.
+"""
+
+# ------------------------------------------------------------
+# ----------------------- READ_BUDGET ------------------------
+# ------------------------------------------------------------
+
+_MIN_READ_BUDGET = 1
+"""
+Minimum number of bytes read per readable event.
+"""
+_MAX_READ_BUDGET = 1 << 30
+"""
+Maximum number of bytes read per readable event (1GB).
+"""
+_DEFAULT_READ_BUDGET = 1 << 18
+"""
+Default number of bytes read per readable event (256KB).
+"""
+
+READ_BUDGET = _get_bounded_int("READ_BUDGET",
+                               _MIN_READ_BUDGET,
+                               _MAX_READ_BUDGET,
+                               _DEFAULT_READ_BUDGET)
+"""
+How many bytes a connection may read before the other ready connections are served.
+"""
+
+# ------------------------------------------------------------
+# --------------------- RECV_BUFSIZE_MIN ---------------------
+# --------------------- RECV_BUFSIZE_MAX ---------------------
+# ------------------------------------------------------------
+
+_MIN_RECV_BUFSIZE = 1 << 9
+"""
+Lower bound of both read size limits (512B).
+"""
+_MAX_RECV_BUFSIZE = 1 << 26
+"""
+Upper bound of both read size limits (64MB).
+"""
+_DEFAULT_RECV_BUFSIZE_MIN = 1 << 12
+"""
+Default smallest read size (4KB).
+"""
+_DEFAULT_RECV_BUFSIZE_MAX = 1 << 20
+"""
+Default largest read size (1MB).
+"""
+
+_recv_bufsize_min = _get_bounded_int("RECV_BUFSIZE_MIN",
+                                     _MIN_RECV_BUFSIZE,
+                                     _MAX_RECV_BUFSIZE,
+                                     _DEFAULT_RECV_BUFSIZE_MIN)
+_recv_bufsize_max = _get_bounded_int("RECV_BUFSIZE_MAX",
+                                     _MIN_RECV_BUFSIZE,
+                                     _MAX_RECV_BUFSIZE,
+                                     _DEFAULT_RECV_BUFSIZE_MAX)
+if _recv_bufsize_min > _recv_bufsize_max:
+    _found_invalid = True
+    _recv_bufsize_min = _DEFAULT_RECV_BUFSIZE_MIN
+    _recv_bufsize_max = _DEFAULT_RECV_BUFSIZE_MAX
+
+RECV_BUFSIZE_MIN = _recv_bufsize_min
+"""
+How many bytes a single read requests, at least; the read size of small replies.
+"""
+RECV_BUFSIZE_MAX = _recv_bufsize_max
+"""
+How many bytes a single read requests, at most; the read size of large replies.
+"""
+
+# ------------------------------------------------------------
+# ---------------------- SET_SO_RCVBUF -----------------------
+# ------------------------------------------------------------
+
+SET_SO_RCVBUF = _get_bool("SET_SO_RCVBUF", False)
+"""
+Whether the kernel receive buffer of a socket (SO_RCVBUF) is sized to hold the largest read.
+Otherwise, the operating system's default (and autotuning) is kept.
+"""
+
+# ------------------------------------------------------------
+# ---------------------- VALIDATE_CMDS -----------------------
+# ------------------------------------------------------------
+
+VALIDATE_CMDS = _get_bool("VALIDATE_CMDS", True)
+"""
+Whether the syntax of a known command is checked before it is sent.
+Otherwise, malformed commands are only rejected by the server.
+"""
+
+# ------------------------------------------------------------
+# ----------------------- DECODE_TAPE ------------------------
+# ------------------------------------------------------------
+
+DECODE_TAPE = _get_bool("DECODE_TAPE", False)
+"""
+Whether responses are decoded into flat tapes, viewed as outputs.
+Otherwise, responses are decoded into trees of output objects.
+
+A tape is decoded faster and holds less memory than a tree,
+but the leaves of a tape are decoded again whenever they are formatted;
+formatting a tape may take longer than formatting the same tree.
+"""
+
+# ------------------------------------------------------------
+# ---------------------- FORMAT_WORKERS ----------------------
+# ------------------------------------------------------------
+
+_MIN_FORMAT_WORKERS = 0
+"""
+Minimum number of formatting workers; the responses are formatted by the multiplexing loop.
+"""
+_MAX_FORMAT_WORKERS = 64
+"""
+Maximum number of formatting workers.
+"""
+_DEFAULT_FORMAT_WORKERS = 2
+"""
+Default number of formatting workers.
+"""
+
+FORMAT_WORKERS = _get_bounded_int("FORMAT_WORKERS",
+                                  _MIN_FORMAT_WORKERS,
+                                  _MAX_FORMAT_WORKERS,
+                                  _DEFAULT_FORMAT_WORKERS)
+"""
+How many workers format the responses off the multiplexing loop thread.
+"""
+
+# ------------------------------------------------------------
+# -------------------- FORMAT_CACHE_BYTES --------------------
+# ------------------------------------------------------------
+
+_MIN_FORMAT_CACHE_BYTES = 0
+"""
+Minimum size of the formatted outputs cache; the cache is disabled.
+"""
+_MAX_FORMAT_CACHE_BYTES = 1 << 30
+"""
+Maximum size of the formatted outputs cache (1GB).
+"""
+_DEFAULT_FORMAT_CACHE_BYTES = 1 << 22
+"""
+Default size of the formatted outputs cache (4MB).
+"""
+
+FORMAT_CACHE_BYTES = _get_bounded_int("FORMAT_CACHE_BYTES",
+                                      _MIN_FORMAT_CACHE_BYTES,
+                                      _MAX_FORMAT_CACHE_BYTES,
+                                      _DEFAULT_FORMAT_CACHE_BYTES)
+"""
+How many bytes of formatted text are cached, at most, for the outputs formatted again.
+"""
+
 # ------------------------------------------------------------
 # ---------------------- LOG FORMATTERS ----------------------
 # ------------------------------------------------------------
@@ -200,6 +453,15 @@ logger.debug("Configuration initialized.")
 logger.debug("Stage: %s", STAGE.name)
 logger.debug("TLS enforced: %s", TLS_ENFORCED)
 logger.debug("Max connections: %s", MAX_CONNECTIONS)
+logger.debug("Pipeline depth: %s", PIPELINE_DEPTH)
+logger.debug("Receive buffer high-water mark: %s", RECV_BUF_HIGH_WATER)
+logger.debug("Read budget: %s", READ_BUDGET)
+logger.debug("Read size bounds: %s - %s", RECV_BUFSIZE_MIN, RECV_BUFSIZE_MAX)
+logger.debug("Set SO_RCVBUF: %s", SET_SO_RCVBUF)
+logger.debug("Validate commands: %s", VALIDATE_CMDS)
+logger.debug("Decode tape: %s", DECODE_TAPE)
+logger.debug("Format workers: %s", FORMAT_WORKERS)
+logger.debug("Format cache bytes: %s", FORMAT_CACHE_BYTES)
 logger.debug("File handler: %s", FILE_HANDLER)
 logger.debug("Stdout handler: %s", STDOUT_HANDLER)
 logger.debug("Stderr handler: %s", STDERR_HANDLER)
@@ -20,6 +20,12 @@ ASCII_ENC = "ascii"
 https://redis.io/docs/latest/develop/reference/protocol-spec/
 """
 
+UTF8_ENC = "utf-8"
+"""
+The encoding of the user's input and of the received strings.
+RESP bulk strings are binary-safe, so their lengths are counted in UTF-8 bytes.
+"""
+
 CRLF = "\r\n"
 """
 Standard RESP encoded data suffix.
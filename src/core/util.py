@@ -62,6 +62,13 @@ class LogCompressor(Formatter):
 
         return super().format(record)
 
+_UNSET = object()
+"""
+Internal constant.
+
+Stands for an attribute that was never assigned.
+"""
+
 class Immutable:
     """
     A base class that enforces write-once immutability for its attributes.
@@ -70,6 +77,10 @@ class Immutable:
     set once (during initialization).
     Any attempt to modify an existing attribute will raise an exception.
 
+    The class declares no instance storage (`__slots__`).
+    Subclasses declaring their own `__slots__` carry no per-instance `__dict__`;
+    the others keep one, and behave the same.
+
     Usage:
         Inherit from this class to make your objects immutable after 
         their `__init__` method completes.
@@ -86,6 +97,7 @@ class Immutable:
         >>> p.x = 3
         Immutable Exception: Cannot modify 'x'.
     """
+    __slots__ = ()
 
     def __setattr__(self, name: str, value: Any) -> None:
         """
@@ -94,13 +106,8 @@ class Immutable:
         Raises:
             AssignmentError: If the attribute `name` already exists on the instance.
         """
-        try:
-            # Should throw AttributeError when initializing.
-            _ = self.__getattribute__(name)
-            # If the attribute already exists (was created by constructor),
-            # then the immutability property tried to be violated.
+        # A missing attribute (an empty slot included) reads as the default,
+        # without raising an exception through the interpreter.
+        if getattr(self, name, _UNSET) is not _UNSET:
             raise AssignmentError(f"Cannot modify '{name}'")
-        except AttributeError:
-            # If __getattribute__ raises AttributeError, the attribute is missing.
-            # Therefore allow the construction of the object.
-            super().__setattr__(name, value)
+        object.__setattr__(self, name, value)
@@ -0,0 +1,191 @@
+"""
+This module formats the decoded responses off the multiplexing loop thread.
+
+Formatting a large response may take far longer than receiving it;
+on the loop thread, it would stall the I/O of every connection.
+The responses are handed to a bounded pool of worker threads,
+and delivered to the client once formatted, in the order they were received on each connection.
+"""
+from collections import deque
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from threading import Lock
+from typing import Callable
+
+import core
+from network import Connection
+from protocol import Output, format_cache, formatter_window
+
+logger = core.get_logger(__name__)
+
+PAGE_SIZE: int = 200
+"""
+How many top-level elements of a response are formatted at once.
+The first page is formatted by the pool; the next ones on demand.
+"""
+
+@dataclass(frozen=True, slots=True)
+class Response:
+    """
+    A decoded response, along with its first formatted page.
+
+    Attributes:
+        output (obj): The decoded response.
+        text (str): The formatted first page of the response.
+        total (int): How many top-level elements the response is made of.
+    """
+    output: Output
+    text: str
+    total: int
+
+def submit(connection: Connection, output: Output, on_response: Callable[[Response], None]) -> None:
+    """
+    Formats the first page of a response, then delivers it to the client.
+    A response is delivered only after the previous responses of its connection.
+
+    Without workers, or once they are stopped, the response is formatted and delivered at once,
+    by the calling thread.
+
+    Args:
+        connection (obj): The connection which received the response.
+        output (obj): The decoded response.
+        on_response (lambda): The callback function to be called with the formatted response.
+    """
+    executor = _get_executor()
+    future = None
+    if executor is not None:
+        try:
+            future = executor.submit(_format_page, output)
+        except RuntimeError:
+            # The workers were stopped meanwhile.
+            pass
+    if future is None:
+        text, total = _format_page(output)
+        on_response(Response(output, text, total))
+        return
+
+    with _lock:
+        _pending.setdefault(connection, deque()).append((future, output, on_response))
+    # Runs at once if the response is already formatted.
+    future.add_done_callback(lambda _: _deliver(connection))
+
+def discard(connection: Connection) -> None:
+    """
+    Drops the responses of a connection which are not delivered yet.
+
+    Args:
+        connection (obj): The removed connection.
+    """
+    with _lock:
+        pending = _pending.pop(connection, ())
+    for future, _, _ in pending:
+        future.cancel()
+
+def shutdown() -> None:
+    """
+    Stops the workers, once the responses being formatted are done.
+    The responses still waiting for a worker are dropped;
+    the responses submitted afterwards are formatted by the calling thread.
+    """
+    global _executor, _closed
+    with _lock:
+        executor, _executor = _executor, None
+        _closed = True
+        _pending.clear()
+    if executor is not None:
+        executor.shutdown(wait=True, cancel_futures=True)
+        logger.info("Formatting workers stopped.")
+    logger.info(f"Format cache: {format_cache.hits} hits, {format_cache.misses} misses, "
+                f"{format_cache.evictions} evictions.")
+
+def _get_executor() -> Executor | None:
+    """
+    Internal method.
+
+    Starts the workers on the first use; they are never started again once stopped.
+
+    Returns:
+        obj: The pool of workers, or None if there are no workers.
+    """
+    global _executor
+    if _executor is None and not _closed and core.FORMAT_WORKERS > 0:
+        with _lock:
+            if _executor is None and not _closed:
+                _executor = ThreadPoolExecutor(max_workers=core.FORMAT_WORKERS)
+                logger.info(f"Started {core.FORMAT_WORKERS} formatting workers.")
+    return _executor
+
+def _format_page(output: Output) -> tuple[str, int]:
+    """
+    Internal method.
+
+    Formats the first page of a response; run by the workers.
+    """
+    return formatter_window(output, 0, PAGE_SIZE)
+
+def _deliver(connection: Connection) -> None:
+    """
+    Internal method.
+
+    Delivers the formatted responses at the head of the queue of a connection.
+    A single thread delivers the responses of a connection at a time, in order;
+    the callbacks are called without the lock, so they may submit other responses.
+    """
+    with _lock:
+        if connection in _delivering:
+            # The delivering thread picks the response up once it is done with the previous ones.
+            return
+        _delivering.add(connection)
+
+    while True:
+        with _lock:
+            ready = _pop_ready(connection)
+            if not ready:
+                _delivering.discard(connection)
+                return
+
+        for future, output, on_response in ready:
+            try:
+                text, total = future.result()
+            except Exception as e:
+                logger.error(f"Failed to format a response of {connection.addr}: {e}.", exc_info=True)
+                text, total = f"Failed to format the response: {e}", 1
+            try:
+                on_response(Response(output, text, total))
+            except Exception as e:
+                logger.error(f"Failed to deliver a response of {connection.addr}: {e}.", exc_info=True)
+
+def _pop_ready(connection: Connection) -> list[tuple[Future, Output, Callable[[Response], None]]]:
+    """
+    Internal method.
+
+    Dequeues the formatted responses at the head of the queue of a connection; called under the lock.
+    """
+    pending = _pending.get(connection)
+    ready = []
+    while pending and pending[0][0].done():
+        ready.append(pending.popleft())
+    if pending is not None and not pending:
+        _pending.pop(connection)
+    return ready
+
+_executor: Executor | None = None
+"""
+The pool of formatting workers, started on the first use.
+"""
+_closed: bool = False
+"""
+Whether the pool of workers was stopped.
+"""
+_lock: Lock = Lock()
+"""
+Guards the pool and the queues of the responses being formatted.
+"""
+_pending: dict[Connection, deque[tuple[Future, Output, Callable[[Response], None]]]] = {}
+"""
+The responses being formatted, queued by their connections in the order they were received.
+"""
+_delivering: set[Connection] = set()
+"""
+The connections whose responses are being delivered by a thread.
+"""
@@ -2,6 +2,8 @@ import flet as ft
 from typing import Callable
 
 import core
+from formatting import PAGE_SIZE, Response
+from protocol import OutputMap, formatter_window
 
 from .interfaces import PresenceChangeable
 
@@ -84,31 +86,65 @@ class Chat(ft.Container, PresenceChangeable):
         self.history_box.controls.append(bubble)
         logger.debug("Request printed.")
 
-    def on_response(self, res: str) -> None:
+    def on_response(self, res: Response) -> None:
         """
-        Called by the reactor to display a server response.
+        Called by the formatting workers to display a server response.
         Updates the UI thread-safely.
 
         Args:
-            res (str): The response string from the server.
+            res (obj): The response from the server, along with its first formatted page.
         """
         self.page.run_task(self._auto_add_res, res)
 
-    async def _auto_add_res(self, res: str) -> None:
+    async def _auto_add_res(self, res: Response) -> None:
         """
         Adds a response to the chat history box automaticallly when it is ready.
+        Only the first page of the response is displayed;
+        the next ones are loaded on demand.
 
         Args:
-            res (str): The response string from the server.
+            res (obj): The response from the server, along with its first formatted page.
         """
-        logger.debug(f"Frontend printing of the response: {res}.")
+        logger.debug(f"Frontend printing of the response: {res.text}.")
 
-        bubble = self._add_msg_bubble(res, ft.MainAxisAlignment.START, ft.Colors.BLUE_GREY_700)
+        bubble = self._add_msg_bubble(res.text, ft.MainAxisAlignment.START, ft.Colors.BLUE_GREY_700)
+        if res.total > PAGE_SIZE:
+            self._add_load_more(bubble, res)
         self.history_box.controls.append(bubble)
         self.history_box.update()
         
         logger.debug("Response printed.")
 
+    def _add_load_more(self, bubble: ft.Row, res: Response) -> None:
+        """
+        Adds a control to a response bubble, which loads the next page of the response.
+        Each page is displayed by a text of its own, so the loaded pages are never copied again.
+        The control is hidden once the whole response is displayed.
+
+        Args:
+            bubble (obj): The message bubble displaying the first page of the response.
+            res (obj): The response from the server, along with its first formatted page.
+        """
+        container = bubble.controls[0]
+        text = container.content
+        total = res.total
+        shown = PAGE_SIZE
+        # The pairs of a map are numbered by their keys and values.
+        numbers = _PAIR_SIZE if isinstance(res.output, OutputMap) else 1
+
+        def on_load_more() -> None:
+            nonlocal shown
+            page, _ = formatter_window(res.output, shown, PAGE_SIZE)
+            pages.controls.insert(-1, ft.Text(page, color=text.color, selectable=True))
+            shown = min(shown + PAGE_SIZE, total)
+            load_more.content = _load_more_label(shown * numbers, total * numbers)
+            load_more.visible = shown < total
+            container.update()
+
+        load_more = ft.TextButton(_load_more_label(shown * numbers, total * numbers), on_click=on_load_more)
+        pages = ft.Column([text, load_more], spacing=0)
+        container.content = pages
+
     def _add_msg_bubble(self, text: str, alignment: ft.MainAxisAlignment, bgcolor: ft.Colors) -> ft.Row:
         """
         Creates a message bubble for client requests or server responses.
@@ -136,3 +172,23 @@ class Chat(ft.Container, PresenceChangeable):
             ],
             alignment=alignment,
         )
+
+_PAIR_SIZE: int = 2
+"""
+Internal constant.
+
+How many numbered lines a pair of a map is displayed by.
+"""
+
+def _load_more_label(shown: int, total: int) -> str:
+    """
+    Internal method.
+
+    Args:
+        shown (int): How many numbered lines of a response are displayed.
+        total (int): How many numbered lines the response is made of.
+
+    Returns:
+        str: The label of the control loading the next page of a response.
+    """
+    return f"Load more (1-{shown} of {total:,})"
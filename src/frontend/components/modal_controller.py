@@ -3,7 +3,7 @@ from typing import Callable
 
 import core
 from network import Connection
-from reactor import enque_new_connection, enque_close_connection
+from reactor import enque_new_connection, enque_close_connection, enque_pending_input
 
 from .members import Chat, ConnectionBox, PresenceChangeable
 from .modals import ManualConnect, UrlConnect
@@ -53,7 +53,7 @@ class _ControllerBase:
         
         chat = Chat(
             text=str(connection.addr),
-            on_enter=connection.sender.add_pending)
+            on_enter=lambda pending: enque_pending_input(connection, pending))
         self._on_chat_sel(chat)
 
         def on_connection_close():
@@ -5,6 +5,7 @@ import core
 from frontend import Layout
 
 from multiplexing import loop_multiplexing
+import reactor
 from util import uninterruptible
 
 logger = core.get_logger(__name__)
@@ -14,6 +15,8 @@ async def close_page(multiplexing_event: Event, page: ft.Page) -> None:
     logger.info("Closing application...")
     try:
         multiplexing_event.clear()
+        # The loop blocks while idle; interrupt it to notice the cleared event.
+        reactor.wakeup()
     except BaseException as e:
         logger.error(f"Application failed: {e}.", exc_info=True)
     finally:
@@ -4,20 +4,95 @@ This module contains all the logic related to I/O multiplexing.
 It is based on a central loop method supposed to run a on parallel thread.
 This method selects the sockets ready for either reading/writing and dispatches them to their corresponding handlers.
 """
+from dataclasses import dataclass
 from selectors import EVENT_READ, EVENT_WRITE
 from threading import Event
-from time import sleep
+import time
 from typing import Callable
 
 import core
 from network import Connection
+from protocol import OutputErr
 import transmission
 
+import formatting
 import reactor
 from util import uninterruptible
 
 logger = core.get_logger(__name__)
 
+STALL_THRESHOLD: float = 0.05
+"""
+How many seconds of dispatching make an iteration of the loop count as a stall.
+Meanwhile, no other connection is served.
+"""
+
+@dataclass
+class LoopStats:
+    """
+    Counters describing the activity of the multiplexing loop.
+
+    Attributes:
+        iterations (int): How many times the loop polled for events.
+        idle_iterations (int): Iterations which returned no events.
+        events (int): The number of dispatched ready connections.
+        wakeups (int): How many times the wakeup channel interrupted the polling.
+        sent_count (int): The number of completely sent inputs.
+        latency_total (float): Summed enqueue-to-send latency of all sent inputs, in seconds.
+        latency_max (float): The highest enqueue-to-send latency, in seconds.
+        dispatch_total (float): Summed time spent dispatching the events of the iterations, in seconds.
+        dispatch_max (float): The longest time spent dispatching the events of an iteration, in seconds.
+        stalls (int): Iterations which spent more than `STALL_THRESHOLD` dispatching their events.
+    """
+    iterations: int = 0
+    idle_iterations: int = 0
+    events: int = 0
+    wakeups: int = 0
+    sent_count: int = 0
+    latency_total: float = 0.0
+    latency_max: float = 0.0
+    dispatch_total: float = 0.0
+    dispatch_max: float = 0.0
+    stalls: int = 0
+
+    @property
+    def latency_avg(self) -> float:
+        """
+        The average enqueue-to-send latency, in seconds.
+        """
+        if self.sent_count == core.EMPTY_LEN:
+            return 0.0
+        return self.latency_total / self.sent_count
+
+    def record_latency(self, latency: float) -> None:
+        """
+        Accounts for the enqueue-to-send latency of a completely sent input.
+
+        Args:
+            latency (float): The elapsed seconds since the input was enqueued.
+        """
+        self.sent_count += 1
+        self.latency_total += latency
+        self.latency_max = max(self.latency_max, latency)
+
+    def record_dispatch(self, elapsed: float) -> None:
+        """
+        Accounts for the time an iteration spent dispatching its events,
+        during which the loop served none of the other connections.
+
+        Args:
+            elapsed (float): The elapsed seconds since the events were selected.
+        """
+        self.dispatch_total += elapsed
+        self.dispatch_max = max(self.dispatch_max, elapsed)
+        if elapsed > STALL_THRESHOLD:
+            self.stalls += 1
+
+loop_stats = LoopStats()
+"""
+The statistics of the application's multiplexing loop.
+"""
+
 @uninterruptible
 def loop_multiplexing(stay_alive: Event) -> None:
     """
@@ -28,6 +103,8 @@ def loop_multiplexing(stay_alive: Event) -> None:
 
     Args:
         stay_alive (obj): The event to signal the loop to continue/stop.
+                          After clearing it, `reactor.wakeup()` must be called
+                          to interrupt a blocking selection.
     """
     while stay_alive.is_set():
         try:
@@ -39,6 +116,9 @@ def loop_multiplexing(stay_alive: Event) -> None:
     # Handle any remaining connections.
     _handle_connection_queues()
     reactor.close_resources()
+    formatting.shutdown()
+    logger.info(f"Multiplexing loop stopped; {loop_stats.stalls} stalls, "
+                f"the longest of {loop_stats.dispatch_max:.3f}s.")
 
 def _handle_connection_queues() -> None:
     """
@@ -51,13 +131,12 @@ def _handle_connection_queues() -> None:
     while reactor._connections_to_rem:
         connection = reactor._connections_to_rem.popleft()
         reactor.rem_connection(connection)
+    
+    while reactor._connections_to_arm:
+        connection = reactor._connections_to_arm.popleft()
+        reactor.sync_write_interest(connection)
 
-_DEFAULT_TIMEOUT: float = 1
-"""
-The default timeout for the event loop.
-"""
-
-def _sel_and_dispatch(timeout: float = _DEFAULT_TIMEOUT) -> None:
+def _sel_and_dispatch(timeout: float | None = None) -> None:
     """
     Polls for I/O events and dispatches them to the registered handlers.
     
@@ -65,18 +144,24 @@ def _sel_and_dispatch(timeout: float = _DEFAULT_TIMEOUT) -> None:
 
     Args:
         timeout: The maximum time to wait for events.
+                 By default, it blocks until either a socket is ready or the wakeup channel is signaled.
     """
-    # No need to run `select()` if there are no connections.
-    if not reactor._selector.get_map():
-        # Wait for a second, hoping that a client will enqueue a connection.
-        # This was arbitrarily chosen.
-        sleep(_DEFAULT_TIMEOUT)
-        return
-
+    loop_stats.iterations += 1
     events = reactor._selector.select(timeout)
+    if not events:
+        loop_stats.idle_iterations += 1
+        return
+    
+    dispatch_start = time.perf_counter()
     for key, mask in events:
+        if reactor.is_wakeup(key.fileobj):
+            loop_stats.wakeups += 1
+            reactor.drain_wakeup()
+            continue
+        
+        loop_stats.events += 1
+        connection = key.fileobj
         try:
-            connection = key.fileobj
             assert isinstance(connection, Connection)
             response_lambda = reactor._response_lambdas[connection]
             
@@ -92,9 +177,12 @@ def _sel_and_dispatch(timeout: float = _DEFAULT_TIMEOUT) -> None:
             continue
         except Exception as e:
             logger.error(f"Failed to handle event for connection {connection.addr}: {e}.", exc_info=True)
-            continue
+        
+        # Both sending and receiving may change what the connection waits for.
+        reactor.sync_write_interest(connection)
+    loop_stats.record_dispatch(time.perf_counter() - dispatch_start)
 
-def _sel_readable(connection: Connection, response_lambda: Callable[[str], None]) -> None:
+def _sel_readable(connection: Connection, response_lambda: Callable[[formatting.Response], None]) -> None:
     """
     Handles and processes readable sockets.
 
@@ -105,15 +193,15 @@ def _sel_readable(connection: Connection, response_lambda: Callable[[str], None]
     Args:
         connection (obj): The connection to handle.
         response_lambda (lambda): The lambda function to forward the response to the client.
+                                  The responses are formatted off the loop thread, by the formatting workers.
     """
     try:
-        output_str = transmission.handle_read(
+        transmission.handle_read(
             connection.addr,
             connection.receiver,
-            connection.synchronizer.last_raw_input,
-            connection.synchronizer.all_sent)
-        response_lambda(output_str)
-        connection.synchronizer.all_recv = True
+            connection.decoder,
+            connection.synchronizer,
+            lambda output: formatting.submit(connection, output, response_lambda))
     
     except core.PartialResponseError:
         logger.debug("The response is not completely received.")
@@ -126,7 +214,7 @@ def _sel_readable(connection: Connection, response_lambda: Callable[[str], None]
                              connection.initial_pasw,
                              core.RespVer.RESP2)
 
-def _sel_writable(connection: Connection, response_lambda: Callable[[str], None]) -> None:
+def _sel_writable(connection: Connection, response_lambda: Callable[[formatting.Response], None]) -> None:
     """
     Handles and processes writable sockets and manages invalid input and partial response issues.
     
@@ -135,13 +223,15 @@ def _sel_writable(connection: Connection, response_lambda: Callable[[str], None]
         response_lambda (lambda): The lambda function to forward potential input errors to the client.
     """
     try:
-        transmission.handle_write(
+        latencies = transmission.handle_write(
             connection.addr,
             connection.sender,
             connection.synchronizer)
+        for latency in latencies:
+            loop_stats.record_latency(latency)
     except core.PartialResponseError:
         logger.debug("The last result was not completely received.")
     except ValueError as e:
         # If the user makes an error, the error is both logged and printed on his screen as a response.
-        response_lambda(str(e))
+        formatting.submit(connection, OutputErr(str(e)), response_lambda)
         logger.error(f"Error when encoding data to {connection.addr}: {e}.", exc_info=True)
@@ -19,13 +19,48 @@ class Connection(DatabaseLink):
     
     # Host and port are internally converted into an Addr object.
     # Clients might be interested in typing them manually, so they are kept as separated parameters.
-    def __init__(self, host: str, port: str, user: str, pasw: str, db_idx: str) -> None:
+    def __init__(self, host: str, port: str, user: str, pasw: str, db_idx: str,
+                 pipeline_depth: int = core.PIPELINE_DEPTH) -> None:
+        """
+        Args:
+            pipeline_depth (int): The maximum number of commands sent before receiving their results.
+        """
         if core.MAX_CONNECTIONS <= Connection.count:
             raise core.ConnectionCountError("Maximum number of connections reached.")
         
         logger.info(f"Initializing connection pipeline for {host}:{port}.")
-        super().__init__(host, port, user, pasw, db_idx)
+        super().__init__(host, port, user, pasw, db_idx, pipeline_depth)
         Connection.count += 1
+
+    @staticmethod
+    def is_init_input(pending: str) -> bool:
+        """
+        Checks if the raw input ran at the connection initialization (HELLO and SELECT).
+        
+        These inputs are never pipelined,
+        since the following ones depend on the negotiated protocol, authentication and database.
+
+        Args:
+            pending (str): The raw input string.
+        """
+        return Connection.SELECT_CMD in pending or Connection.HELLO_CMD in pending
+
+    def wants_write(self) -> bool:
+        """
+        Checks if the connection has something that can be sent right now.
+
+        Staged commands, like the leftovers of a partial send, are always sendable.
+        A new command waits until the pipeline has room for it.
+
+        Returns:
+            bool: True if the socket should be watched for writability, False otherwise.
+        """
+        if self.sender.has_outgoing():
+            return True
+        pending = self.sender.get_first_pending()
+        if pending is None:
+            return False
+        return self.synchronizer.can_sync(Connection.is_init_input(pending))
     
     def close(self) -> None:
         self.sock.close()
@@ -24,8 +24,9 @@ class DatabaseLink(Identification):
     used for selecting the provided logical database of a Redis server.
     """
 
-    def __init__(self, host: str, port: str, user: str, pasw: str, db_idx: str) -> None:
-        super().__init__(host, port, user, pasw)
+    def __init__(self, host: str, port: str, user: str, pasw: str, db_idx: str,
+                 pipeline_depth: int = core.PIPELINE_DEPTH) -> None:
+        super().__init__(host, port, user, pasw, pipeline_depth)
         if db_idx != DatabaseLink.DEFAULT_DB and db_idx != core.EMPTY_STR:
             self._say_select(db_idx)
 
@@ -34,7 +34,8 @@ class Identification(Transmitter):
     The authentication argument for the HELLO command.
     """
     
-    def __init__(self, host: str, port: str, user: str, pasw: str) -> None:
+    def __init__(self, host: str, port: str, user: str, pasw: str,
+                 pipeline_depth: int = core.PIPELINE_DEPTH) -> None:
         """
         Saves the initial username and password a client tried to connect with.
         If the initial hello command does not succed,
@@ -49,7 +50,7 @@ class Identification(Transmitter):
         initial_user = Identification.DEFAULT_USER if user == core.EMPTY_STR else user
         initial_pasw = pasw
         
-        super().__init__(addr)
+        super().__init__(addr, pipeline_depth)
         self.say_hello(initial_user, initial_pasw)
         self.initial_user = initial_user
         self.initial_pasw = initial_pasw
@@ -1,4 +1,5 @@
 import core
+from protocol import Decoder, TapeDecoder
 
 from .transport import Receiver, Sender, Sock, Synchronizer
 
@@ -12,18 +13,35 @@ class Transmitter:
         receiver (obj): Receives data from the remote server.
         sender (obj): Sends data to the remote server.
         synchronizer (obj): Manages the state of receival and sending.
+        decoder (obj): Decodes the received data, keeping the progress of partial responses.
     """
     
-    def __init__(self, addr: core.Addr) -> None:
-        self.sock = Sock(addr)
+    def __init__(self, addr: core.Addr, pipeline_depth: int = core.PIPELINE_DEPTH) -> None:
+        rcvbuf = core.RECV_BUFSIZE_MAX if core.SET_SO_RCVBUF else None
+        self.sock = Sock(addr, rcvbuf)
         self.receiver = Receiver(self.sock._socket)
         self.sender = Sender(self.sock._socket)
-        self.synchronizer = Synchronizer()
+        self.synchronizer = Synchronizer(pipeline_depth)
+        self.decoder = TapeDecoder(self.receiver) if core.DECODE_TAPE else Decoder(self.receiver)
     
     @property
     def addr(self) -> core.Addr:
         return self.sock.addr
 
+    def stats(self) -> dict[str, int]:
+        """
+        Collects statistics about the connection's buffers.
+
+        Returns:
+            dict: The statistics mapped by their names.
+        """
+        return {
+            "recv_buf_size": self.receiver.buf_size,
+            "recv_buf_peak": self.receiver.peak_buf_size,
+            "recv_buf_capacity": self.receiver.buf_capacity,
+            "recv_size": self.receiver.recv_size,
+        }
+
     def close(self) -> None:
         self.sock.close()
     
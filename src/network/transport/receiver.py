@@ -9,6 +9,25 @@ logger = core.get_logger(__name__)
 class Receiver(Communicator):
     """
     Performs buffered reads from the socket and manages the output buffer.
+
+    The socket fills a preallocated buffer in place (`recv_into`).
+    The consumed data is decoded straight out of the buffer through memoryview slices,
+    so the only copy of a received byte is the decoded string itself.
+
+    The consumed bytes are discarded (compaction) once the whole buffer was consumed,
+    or once they exceed the high-water mark.
+
+    The size of a single read adapts to the replies:
+    it doubles after a read returns every requested byte,
+    and halves after a drain returns far less than a single read could.
+
+    Attributes:
+        high_water (int): How many consumed bytes the buffer may keep.
+        read_budget (int): How many bytes a single `drain()` may read.
+        recv_size (int): How many bytes the next read of `drain()` requests.
+        recv_size_min (int): The smallest read size.
+        recv_size_max (int): The largest read size.
+        peak_buf_size (int): The largest size the buffer ever had.
     """
     
     _4KB_BUFSIZE: int = 4096
@@ -16,10 +35,64 @@ class Receiver(Communicator):
     Default buffer size for read operations (4KB).
     """
 
-    def __init__(self, socket: socket) -> None:
+    _GROWTH_FACTOR: int = 2
+    """
+    Internal constant.
+
+    How many times the capacity of the buffer is multiplied when it is too small.
+    """
+
+    _SHRINK_RATIO: int = 4
+    """
+    Internal constant.
+
+    The read size halves once a drain returns less than this fraction of it.
+    """
+
+    _CRLF_BYTES: bytes = core.CRLF.encode(core.ASCII_ENC)
+    """
+    Internal constant.
+
+    The encoded line terminator.
+    """
+
+    def __init__(self,
+                 socket: socket,
+                 high_water: int = core.RECV_BUF_HIGH_WATER,
+                 read_budget: int = core.READ_BUDGET,
+                 recv_size_min: int = core.RECV_BUFSIZE_MIN,
+                 recv_size_max: int = core.RECV_BUFSIZE_MAX) -> None:
         self._socket = socket
-        self._buf = bytearray()
+        # Only the first `_end` bytes of the buffer were received.
+        # The rest is the spare capacity filled by the next `recv()`.
+        self._buf = bytearray(recv_size_min)
+        # A single view of the buffer is kept, since slicing it does not copy.
+        self._view = memoryview(self._buf)
+        self._end = 0
         self._idx = 0
+        self.high_water = high_water
+        self.read_budget = read_budget
+        self.recv_size_min = recv_size_min
+        self.recv_size_max = recv_size_max
+        self.recv_size = recv_size_min
+        self.peak_buf_size = 0
+        # Where the search for the next CRLF continues.
+        # The bytes of an incomplete line are scanned only once.
+        self._scan_idx = 0
+
+    @property
+    def buf_size(self) -> int:
+        """
+        The current size of the buffer, including consumed bytes.
+        """
+        return self._end
+
+    @property
+    def buf_capacity(self) -> int:
+        """
+        How many bytes the buffer can hold without growing.
+        """
+        return len(self._buf)
 
     def empty_buf(self) -> bool:
         """
@@ -28,7 +101,7 @@ class Receiver(Communicator):
         Returns:
             bool: True if buffer is empty, False otherwise.
         """
-        return self._idx >= len(self._buf)
+        return self._idx >= self._end
 
     def consume(self, bufsize: int) -> str:
         """
@@ -44,14 +117,85 @@ class Receiver(Communicator):
         Raises:
             PartialResponseError: If there are insufficient bytes in the buffer.
         """
-        if self._idx + bufsize > len(self._buf):
-            raise core.PartialResponseError(f"Insufficient buffer bytes: {len(self._buf) - self._idx}. Needed: {bufsize}")
+        self.ensure(bufsize)
+        data = self._decode(self._idx, self._idx + bufsize)
+        self._idx += bufsize
+        
+        logger.debug(f"Consumed {bufsize} bytes from buffer. Remaining: {self._end - self._idx}.")
+        return data
+
+    def consume_bytes(self, bufsize: int) -> bytes:
+        """
+        Consumes a specific number of bytes from the buffer, without decoding them.
+
+        Args:
+            bufsize (int): The number of bytes to consume.
+
+        Returns:
+            bytes: The consumed data.
         
-        data = self._buf[self._idx : self._idx + bufsize]
+        Raises:
+            PartialResponseError: If there are insufficient bytes in the buffer.
+        """
+        self.ensure(bufsize)
+        data = bytes(self._view[self._idx : self._idx + bufsize])
         self._idx += bufsize
         
-        logger.debug(f"Consumed {bufsize} bytes from buffer. Remaining: {len(self._buf) - self._idx}.")
-        return data.decode()
+        logger.debug(f"Consumed {bufsize} bytes from buffer. Remaining: {self._end - self._idx}.")
+        return data
+
+    def ensure(self, bufsize: int) -> None:
+        """
+        Checks that a specific number of unconsumed bytes were received.
+
+        Args:
+            bufsize (int): The number of bytes needed.
+
+        Raises:
+            PartialResponseError: If there are insufficient bytes in the buffer.
+        """
+        if self._idx + bufsize > self._end:
+            # The missing bytes are received straight into place, without growing the buffer step by step.
+            # The room for one more read keeps the last reads of the payload from growing it again.
+            self._reserve(self._idx + bufsize - self._end + self.recv_size)
+            raise core.PartialResponseError(f"Insufficient buffer bytes: {self._end - self._idx}. Needed: {bufsize}")
+
+    def find_crlf(self, start: int) -> int:
+        """
+        Finds the next CRLF, without consuming anything.
+        Positions are relative to the first unconsumed byte.
+
+        Args:
+            start (int): Where the search starts.
+
+        Returns:
+            int: The position of the CRLF.
+
+        Raises:
+            PartialResponseError: If the buffer does not contain a CRLF after `start`.
+        """
+        try:
+            return self._buf.index(Receiver._CRLF_BYTES, self._idx + start, self._end) - self._idx
+        except ValueError:
+            raise core.PartialResponseError("Buffer does not contain a CRLF")
+
+    def peek(self, start: int, end: int) -> bytearray:
+        """
+        Copies a region of the unconsumed bytes, without consuming anything.
+        Positions are relative to the first unconsumed byte.
+
+        Args:
+            start (int): The first byte of the region.
+            end (int): The byte after the region.
+
+        Returns:
+            bytearray: The copied region.
+
+        Raises:
+            PartialResponseError: If the region was not completely received.
+        """
+        self.ensure(end)
+        return self._buf[self._idx + start : self._idx + end]
 
     def consume_crlf(self) -> str:
         """
@@ -64,20 +208,32 @@ class Receiver(Communicator):
         Raises:
             PartialResponseError: If the buffer does not contain a CRLF.
         """
-        ASCII_CRLF = core.CRLF.encode()
-        try:
-            # Search for CRLF starting from current index.
-            end_idx = self._buf.index(ASCII_CRLF, self._idx)
-        except ValueError:
-            raise core.PartialResponseError("Buffer does not contain a CRLF")
-        
+        end_idx = self._line_end()
         # Here we want to consume CRLF but not include it the returned string.
-        data = self._buf[self._idx : end_idx]
-        end_idx += len(ASCII_CRLF)
+        data = self._decode(self._idx, end_idx)
+        end_idx += len(Receiver._CRLF_BYTES)
         
-        logger.debug(f"Consumed {end_idx - self._idx} bytes from buffer. Remaining: {len(self._buf) - end_idx}.")
+        logger.debug(f"Consumed {end_idx - self._idx} bytes from buffer. Remaining: {self._end - end_idx}.")
         self._idx = end_idx
-        return data.decode()
+        return data
+
+    def consume_line(self) -> bytes:
+        """
+        Consumes a line from the buffer, ending with CRLF, without decoding it.
+
+        The raw line can be matched against known lines before anything is decoded.
+        It is called once per received element, so it is not logged.
+
+        Returns:
+            bytes: The consumed line, NOT including CRLF.
+        
+        Raises:
+            PartialResponseError: If the buffer does not contain a CRLF.
+        """
+        end_idx = self._line_end()
+        data = bytes(self._view[self._idx : end_idx])
+        self._idx = end_idx + len(Receiver._CRLF_BYTES)
+        return data
 
     def restore_buf(self, idx: int) -> None:
         """
@@ -94,10 +250,11 @@ class Receiver(Communicator):
         
         logger.debug(f"Restore {self._idx - idx} bytes.")
         self._idx = idx
+        self._scan_idx = idx
 
     def recv(self, bufsize: int = _4KB_BUFSIZE) -> int:
         """
-        Reads data from the socket extending the buffer.
+        Reads data from the socket directly into the spare capacity of the buffer.
 
         Args:
             bufsize (int): The maximum number of bytes to read.
@@ -109,14 +266,82 @@ class Receiver(Communicator):
             BlockingIOError: If the socket is not ready for reading.
             ConnectionError: If the socket is closed by the peer.
         """
-        data = self._socket.recv(bufsize)
-        if len(data) == core.EMPTY_LEN:
+        # The decoder never goes back to consumed bytes,
+        # even in the middle of a partial response.
+        self.compact()
+        self._reserve(bufsize)
+        nbytes = self._socket.recv_into(self._view[self._end:], bufsize)
+        if nbytes == core.EMPTY_LEN:
             raise ConnectionError("Socket closed by peer")
 
-        self._buf.extend(data)
-        logger.debug(f"Received {len(data)} bytes from socket. Available: {len(self._buf) - self._idx}.")
-        return len(data)
+        self._end += nbytes
+        self.peak_buf_size = max(self.peak_buf_size, self._end)
+        logger.debug(f"Received {nbytes} bytes from socket. Available: {self._end - self._idx}.")
+        return nbytes
     
+    def drain(self) -> int:
+        """
+        Reads data from the socket until it would block, or until the read budget is exhausted.
+
+        The budget keeps a busy connection from starving the other ones;
+        the bytes left in the socket are read on the next readable event.
+        Every read requests `recv_size` bytes, adapting it along the way.
+
+        Returns:
+            int: The number of bytes read.
+
+        Raises:
+            ConnectionError: If the socket is closed by the peer.
+        """
+        received = 0
+        while received < self.read_budget:
+            bufsize = min(self.recv_size, self.read_budget - received)
+            try:
+                nbytes = self.recv(bufsize)
+            except BlockingIOError:
+                break
+            received += nbytes
+
+            # A short read emptied the socket.
+            # Another read would only fail with EAGAIN.
+            if nbytes < bufsize:
+                break
+            if bufsize == self.recv_size:
+                self.recv_size = min(self.recv_size * Receiver._GROWTH_FACTOR, self.recv_size_max)
+
+        if received < self.recv_size // Receiver._SHRINK_RATIO:
+            self.recv_size = max(self.recv_size // Receiver._GROWTH_FACTOR, self.recv_size_min)
+        return received
+
+    def compact(self, force: bool = False) -> None:
+        """
+        Discards the consumed part of the buffer, if it is worth it.
+
+        A completely consumed buffer is always emptied.
+        Otherwise the unconsumed bytes must be moved,
+        so it only happens once the consumed bytes exceed the high-water mark.
+
+        Args:
+            force (bool): Whether to discard the consumed bytes regardless of the high-water mark.
+        """
+        if self._idx == core.EMPTY_LEN:
+            return
+        if self.empty_buf():
+            self._end = 0
+            # A capacity grown for a large response is not kept forever.
+            if len(self._buf) > max(self.high_water, self.recv_size):
+                self._replace_buf(bytearray(self.recv_size))
+        elif force or self._idx >= self.high_water:
+            remaining = self._end - self._idx
+            self._view[:remaining] = self._view[self._idx : self._end]
+            self._end = remaining
+        else:
+            return
+
+        logger.debug(f"Compacted {self._idx} bytes from buffer. Remaining: {self._end}.")
+        self._scan_idx = max(core.EMPTY_LEN, self._scan_idx - self._idx)
+        self._idx = 0
+
     def cleanup(self) -> None:
         """
         Discards the consumed part of the buffer.
@@ -127,6 +352,57 @@ class Receiver(Communicator):
         Raises:
             AssertionError: If the buffer is not empty after cleanup.
         """
-        self._buf = self._buf[self._idx:]
-        self._idx = 0
+        self.compact(force=True)
+        self._scan_idx = 0
         assert self.empty_buf()
+
+    def _reserve(self, bufsize: int) -> None:
+        """
+        Internal method.
+
+        Grows the buffer so that `bufsize` more bytes fit after the received ones.
+        """
+        needed = self._end + bufsize
+        if needed <= len(self._buf):
+            return
+
+        capacity = max(needed, len(self._buf) * Receiver._GROWTH_FACTOR)
+        buf = bytearray(capacity)
+        buf[:self._end] = self._view[:self._end]
+        self._replace_buf(buf)
+        logger.debug(f"Grew buffer to {capacity} bytes.")
+
+    def _replace_buf(self, buf: bytearray) -> None:
+        """
+        Internal method.
+
+        Swaps the buffer, along with its view.
+        """
+        self._view.release()
+        self._buf = buf
+        self._view = memoryview(buf)
+
+    def _line_end(self) -> int:
+        """
+        Internal method.
+
+        Finds the CRLF ending the first unconsumed line.
+
+        Raises:
+            PartialResponseError: If the buffer does not contain a CRLF.
+        """
+        try:
+            # Search for CRLF starting from the first byte not yet scanned.
+            return self._buf.index(Receiver._CRLF_BYTES, max(self._idx, self._scan_idx), self._end)
+        except ValueError:
+            # The last byte might be the first half of a CRLF.
+            self._scan_idx = max(self._idx, self._end - len(Receiver._CRLF_BYTES) + 1)
+            raise core.PartialResponseError("Buffer does not contain a CRLF")
+
+    def _decode(self, start: int, end: int) -> str:
+        """
+        Internal method.
+
+        Decodes a region of the buffer without copying it into an intermediate bytes object.
+        """
+        return str(self._view[start:end], core.UTF8_ENC)
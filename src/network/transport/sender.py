@@ -1,5 +1,7 @@
 from socket import socket
 from collections import deque
+from itertools import islice
+from time import perf_counter
 
 import core
 
@@ -10,11 +12,36 @@ logger = core.get_logger(__name__)
 class Sender(Communicator):
     """
     Enqueues and buffers commands for sending to the socket.
+
+    A raw input waits in the pending queue until it is encoded and staged.
+    The staged inputs are sent together by a single gathering `sendmsg()` call.
+    Partial sends are tracked by slicing memoryviews, without copying the remaining bytes.
+    """
+
+    _MAX_BUFFERS: int = 1024
+    """
+    Internal constant.
+
+    How many buffers a single `sendmsg()` call gathers (the usual IOV_MAX).
+    """
+
+    _SENDMSG_SUPPORTED: bool = hasattr(socket, "sendmsg")
+    """
+    Internal constant.
+
+    Whether the platform supports gathering sends (e.g.: Windows does not).
+    Otherwise the staged buffers are joined before a regular `send()` call.
     """
         
     def __init__(self, socket: socket) -> None:
         self._socket = socket
-        self._pending_inputs: deque[str | bytes] = deque()
+        self._pending_inputs: deque[str] = deque()
+        # The moments the pending inputs were enqueued.
+        # Used to measure the enqueue-to-send latency.
+        self._pending_stamps: deque[float] = deque()
+        # The encoded inputs not yet completely sent, along with their stamps.
+        self._outgoing: deque[memoryview] = deque()
+        self._outgoing_stamps: deque[float] = deque()
 
     def add_pending(self, pending: str) -> None:
         """
@@ -23,6 +50,8 @@ class Sender(Communicator):
         Args:
             pending (str): The command to add.
         """
+        # The stamp is appended first. Another thread only checks the inputs queue.
+        self._pending_stamps.append(perf_counter())
         self._pending_inputs.append(pending)
         logger.debug(f"Added pending raw command: {pending}.")
 
@@ -35,58 +64,86 @@ class Sender(Communicator):
         """
         return len(self._pending_inputs) > core.EMPTY_LEN
 
-    def get_first_pending(self) -> str | bytes | None:
+    def has_outgoing(self) -> bool:
+        """
+        Checks if there are staged commands not yet completely sent.
+
+        Returns:
+            bool: True if there are staged commands, False otherwise.
+        """
+        return len(self._outgoing) > core.EMPTY_LEN
+
+    def get_first_pending(self) -> str | None:
         """
         Retrieves the first pending command without removing it.
 
         Returns:
             str: The first pending command.
-            bytes: The encoded leftover of the first pending command.
             None: If queue is empty.
         """
         if not self.has_pending():
             return None
         return self._pending_inputs[0]
 
-    def rem_first_pending(self) -> None:
+    def rem_first_pending(self) -> float:
         """
         Removes the first pending command from the queue.
 
+        Returns:
+            float: The elapsed seconds since the command was enqueued.
+
         Raises:
             AssertionError: If there are no pending commands.
         """
         assert self.has_pending()
         cmd = self._pending_inputs.popleft()
+        latency = perf_counter() - self._pending_stamps.popleft()
         logger.debug(f"Removed first pending command: {cmd}.")
+        return latency
 
-    def shrink_first_pending(self, remaining: bytes) -> None:
+    def stage_first_pending(self, encoded: bytes) -> None:
         """
-        Updates the first pending command with the remaining bytes after a partial send.
+        Replaces the first pending command with its encoding, which is sent by the next `flush()`.
 
         Args:
-            remaining (bytes): The bytes that were not sent.
+            encoded (bytes): The encoded command.
 
         Raises:
             AssertionError: If there are no pending commands.
         """
         assert self.has_pending()
-        cmd = self._pending_inputs[0]
-        
-        logger.debug(f"Shrinking first pending command from {cmd} to {remaining}.")
-        self._pending_inputs[0] = remaining
+        cmd = self._pending_inputs.popleft()
+        self._outgoing.append(memoryview(encoded))
+        self._outgoing_stamps.append(self._pending_stamps.popleft())
+        logger.debug(f"Staged pending command: {cmd}.")
 
-    def send(self, data: bytes) -> int:
+    def flush(self) -> list[float]:
         """
-        Sends raw bytes to the socket.
-
-        Args:
-            data (bytes): The data to send.
+        Sends as many staged commands as possible with a single system call.
 
         Returns:
-            int: The number of bytes sent.
+            list[float]: The enqueue-to-send latencies of the completely sent commands, in order.
 
         Raises:
             BlockingIOError: If the socket is not ready for writing.
             ConnectionError: If the socket is closed by the peer.
         """
-        return self._socket.send(data)
+        buffers = list(islice(self._outgoing, Sender._MAX_BUFFERS))
+        if Sender._SENDMSG_SUPPORTED:
+            sent_count = self._socket.sendmsg(buffers)
+        else:
+            sent_count = self._socket.send(b"".join(buffers))
+        logger.debug(f"Sent {sent_count} bytes of {len(buffers)} staged commands.")
+
+        latencies: list[float] = []
+        while sent_count > core.EMPTY_LEN:
+            head = self._outgoing[0]
+            if sent_count < len(head):
+                # The command was not sent in one go.
+                self._outgoing[0] = head[sent_count:]
+                break
+
+            sent_count -= len(head)
+            self._outgoing.popleft()
+            latencies.append(perf_counter() - self._outgoing_stamps.popleft())
+        return latencies
@@ -14,7 +14,7 @@ class Sock:
     Default integer value to enable socket options.
     """
     
-    def __init__(self, addr: core.Addr) -> None:
+    def __init__(self, addr: core.Addr, rcvbuf: int | None = None) -> None:
         """
         Iterates through the available address families (IPv4/IPv6) returned 
         by DNS resolution and attempts to connect to the first one available. 
@@ -23,6 +23,8 @@ class Sock:
 
         Args:
             addr (obj): The address (host, port) to connect to.
+            rcvbuf (int): The size of the kernel receive buffer (SO_RCVBUF).
+                          By default, the operating system chooses it.
 
         Raises:
             ConnectionError: If DNS resolution fails or
@@ -46,6 +48,10 @@ class Sock:
                 sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, Sock._DEFAULT_OPT_VALUE)
                 # Disables Nagle's algorithm to ensure small latency.
                 sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, Sock._DEFAULT_OPT_VALUE)
+                # The TCP window is negotiated during the handshake,
+                # so the receive buffer must be sized before connecting.
+                if rcvbuf is not None:
+                    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, rcvbuf)
                 
                 logger.debug(f"Connecting to {sockaddr}...")
                 sock.connect(sockaddr)
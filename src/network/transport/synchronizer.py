@@ -1,36 +1,151 @@
+from collections import deque
+
+import core
+
 # The principal usecase is to prevent recv() method calls when a pending input is not all sent.
 # The secondary usecase is to debug client commands when handling output.
 # E.g.: RC-application automatically sends HELLO and SELECT commands when a connection is established.
 # It would be convenient to check their output. What if the remote server returns "HELLO - unkown command"?
+#
+# Redis answers the commands in the order they were received.
+# Therefore the inputs in flight are kept in a FIFO queue,
+# and each output is correlated with the oldest input in flight.
 class Synchronizer:
     """
     Socket I/O synchronization.
 
-    Another input should not be sent until the previous one is all received.
+    At most `depth` inputs can be sent before their outputs are received (pipelining).
+    An exclusive input is never pipelined: it is sent alone and nothing follows it until it is answered.
+
+    Several inputs can be synced before any of them is sent (gathering sends).
+    They are sent in order, so only the count of the newest unsent ones is kept.
+
+    Attributes:
+        depth (int): The maximum number of inputs in flight.
+        all_sent (bool): Whether every input in flight was completely sent.
+        all_recv (bool): Whether every input in flight was answered.
+    """
+
+    MIN_DEPTH: int = 1
+    """
+    The minimum pipeline depth; one input in flight at a time.
     """
 
-    def __init__(self) -> None:
-        self.last_raw_input: str | None = None
+    def __init__(self, depth: int = MIN_DEPTH) -> None:
+        """
+        Args:
+            depth (int): The maximum number of inputs in flight.
+
+        Raises:
+            ValueError: If the depth is smaller than the minimum one.
+        """
+        if depth < Synchronizer.MIN_DEPTH:
+            raise ValueError(f"Invalid pipeline depth: {depth}; must be at least {Synchronizer.MIN_DEPTH}")
+
+        self.depth = depth
+        self._in_flight: deque[str] = deque()
+        self._exclusive_in_flight = False
+        self._unsent = 0
         self.all_sent: bool | None = None
         self.all_recv: bool | None = None
-    
-    def sync_input(self, pending: str) -> None:
+
+    @property
+    def last_raw_input(self) -> str | None:
+        """
+        The oldest input in flight. The next received output belongs to it.
+        """
+        if not self._in_flight:
+            return None
+        return self._in_flight[0]
+
+    def in_flight_count(self) -> int:
+        """
+        Returns:
+            int: The number of inputs sent, but not yet answered.
+        """
+        return len(self._in_flight)
+
+    def can_sync(self, exclusive: bool = False) -> bool:
+        """
+        Checks if another input can be sent before the outputs in flight are received.
+
+        Args:
+            exclusive (bool): Whether the input must be the only one in flight.
+
+        Returns:
+            bool: True if the input can be sent, False otherwise.
+        """
+        if not self._in_flight:
+            return True
+        if exclusive or self._exclusive_in_flight:
+            return False
+        return len(self._in_flight) < self.depth
+
+    def head_sent(self) -> bool:
+        """
+        Checks if the oldest input in flight was completely sent.
+        Only then its output can be received.
+
+        Returns:
+            bool: True if the oldest input in flight was completely sent, False otherwise.
+        """
+        # Inputs are sent one after another.
+        # The unsent ones are always the newest.
+        return len(self._in_flight) > self._unsent
+
+    def sync_input(self, pending: str, exclusive: bool = False) -> None:
         """
         Syncs the input with the output.
-        
+
         Args:
             pending (str): The pending input to sync.
+            exclusive (bool): Whether the input must be the only one in flight.
         """
-        self.last_raw_input = pending
+        self._in_flight.append(pending)
+        self._exclusive_in_flight = exclusive
+        self._unsent += 1
         self.all_sent = False
         self.all_recv = False
 
+    def mark_sent(self) -> None:
+        """
+        Marks the oldest unsent input in flight as completely sent.
+        """
+        assert self._unsent > core.EMPTY_LEN
+        self._unsent -= 1
+        self.all_sent = self._unsent == core.EMPTY_LEN
+
+    def sync_output(self) -> str | None:
+        """
+        Marks the oldest input in flight as answered.
+
+        Returns:
+            str: The input the received output belongs to.
+            None: If no input was in flight.
+        """
+        if not self._in_flight:
+            return None
+
+        pending = self._in_flight.popleft()
+        if not self._in_flight:
+            self._exclusive_in_flight = False
+            self.all_recv = True
+        return pending
+
     def unsync(self) -> None:
         """
-        Unsyncs the input with the output.
+        Unsyncs the newest input with the output.
 
-        This should be called when an error occurs while processing the input.
+        This should be called when an error occurs while processing the input,
+        before it is sent.
         """
-        self.last_raw_input = None
-        self.all_sent = None
-        self.all_recv = None
+        if self._in_flight:
+            self._in_flight.pop()
+            self._unsent = max(self._unsent - 1, core.EMPTY_LEN)
+        self._exclusive_in_flight = False
+
+        if not self._in_flight:
+            self.all_sent = None
+            self.all_recv = None
+            return
+        self.all_sent = self._unsent == core.EMPTY_LEN
@@ -1,10 +1,17 @@
-from .parser import parser
+from .parser import parser, parse_encode
 from .encoder import encoder
-from .decoder import decoder
-from .formatter import formatter
-from .output import Output, OutputStr, OutputErr, OutputSeq, OutputMap, OutputAtt
-from .exceptions import ParserError, QuoteError, SpaceError
+from .validator import validator
+from .decoder import decoder, Decoder
+from .tape import Tape, TapeDecoder
+from .formatter import formatter, formatter_lines, formatter_chunks, formatter_window
+from .format_cache import FormatCache, format_cache
+from .output import Output, OutputStr, OutputErr, OutputInt, OutputDbl, OutputBool, OutputSeq, OutputVec, OutputMap, OutputAtt
+from .exceptions import ParserError, QuoteError, SpaceError, ValidatorError, ArityError, ArgumentError
 
-__all__ = ["parser", "encoder", "decoder", "formatter",
-           "Output", "OutputStr", "OutputErr", "OutputSeq", "OutputMap", "OutputAtt",
-           "ParserError", "QuoteError", "SpaceError"]
+__all__ = ["parser", "parse_encode", "encoder", "validator", "decoder", "Decoder", "Tape", "TapeDecoder",
+           "formatter", "formatter_lines", "formatter_chunks", "formatter_window",
+           "FormatCache", "format_cache",
+           "Output", "OutputStr", "OutputErr", "OutputInt", "OutputDbl", "OutputBool", "OutputSeq", "OutputVec",
+           "OutputMap", "OutputAtt",
+           "ParserError", "QuoteError", "SpaceError",
+           "ValidatorError", "ArityError", "ArgumentError"]
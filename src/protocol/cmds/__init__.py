@@ -1,3 +1,5 @@
+from frozendict import frozendict
+
 from .patterns import *
 from .connection_cmds import CONNECTION_CMDS
 from .generic_cmds import GENERIC_CMDS
@@ -14,6 +16,19 @@ CMDS = (CONNECTION_CMDS, GENERIC_CMDS,
 All comands in a single variable.
 """
 
+CMD_FAMILIES: frozendict[str, CmdDict] = frozendict({
+    "connection": CONNECTION_CMDS,
+    "generic": GENERIC_CMDS,
+    "string": STRING_CMDS,
+    "list": LIST_CMDS,
+    "set": SET_CMDS,
+    "hash": HASH_CMDS,
+    "sorted_set": SORTED_SET_CMDS,
+})
+"""
+All commands, grouped by the family (the data type) they belong to.
+"""
+
 __all__ = ["RequiredPattern", "OptionalPattern", "StrictPattern",
            "Argument",
            "ArgEzz", "ArgInt", "ArgFlt", "ArgStr", "ArgSet", "VariadicKey",
@@ -23,7 +38,7 @@ __all__ = ["RequiredPattern", "OptionalPattern", "StrictPattern",
            "OptionalSect", "Optionals", "OptSet",
            "Opts", "Variadic", "KeyedVariadic",
            
-           "CMDS",
+           "CmdDict", "CMDS", "CMD_FAMILIES",
            "STRING_CMDS", "LIST_CMDS",
            "SET_CMDS", "HASH_CMDS", "SORTED_SET_CMDS",
            "CONNECTION_CMDS", "GENERIC_CMDS"]
@@ -11,7 +11,6 @@ from .patterns import CmdDict, \
                       DB_ARG, \
                       REPLACE_ARG, \
                       COPY_ARG, \
-                      KEY_ARGS, \
                       KEYS_ARG, \
                       AUTH_ARG, \
                       AUTH2_ARG, \
@@ -40,7 +39,7 @@ GENERIC_CMDS: CmdDict = frozendict({
                   Opts(EXPIRE_ARGS)),
     "EXPIRETIME": Vitals(ArgEzz()),
     "KEYS": Vitals(ArgEzz()),
-    "MIGRATE": (Vitals(ArgEzz(), ArgInt(), KEY_ARGS, ArgEzz(), ArgInt()),
+    "MIGRATE": (Vitals(ArgEzz(), ArgInt(), ArgEzz(), ArgEzz(), ArgInt()),
                 Opts(COPY_ARG),
                 Opts(REPLACE_ARG),
                 OptSet(Opts(AUTH_ARG, ArgEzz()),
@@ -67,7 +67,7 @@ HASH_CMDS: CmdDict = frozendict({
               Opts(COUNT_ARG, ArgInt()),
               Opts(NOVALUES_ARG)),
     "HSET":  (Vitals(ArgEzz(), ArgEzz(), ArgEzz()),
-              Opts(ArgEzz(), ArgEzz())),
+              Variadic(ArgEzz(), ArgEzz())),
     "HSETEX": (Vitals(ArgEzz()),
                Opts(EXPIRE_FIELD_ARGS),
                OptSet(Opts(PERSISTENCE_ARGS, ArgInt()),
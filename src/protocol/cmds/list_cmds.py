@@ -2,7 +2,7 @@ from frozendict import frozendict
 
 from .patterns import CmdDict, \
                       Vitals, Opts, Variadic, Opts, \
-                      ArgEzz, ArgInt, \
+                      ArgEzz, ArgInt, ArgFlt, \
                       DIRECTION_ARGS, \
                       POSITION_ARGS, \
                       COUNT_ARG, \
@@ -13,20 +13,20 @@ LIST_CMDS: CmdDict = frozendict({
     "BLMOVE": Vitals(ArgEzz(), ArgEzz(),
                    DIRECTION_ARGS,
                    DIRECTION_ARGS,
-                   ArgInt()),
-    "BLMPOP": (Vitals(ArgInt(), ArgInt(), ArgEzz()),
+                   ArgFlt()),
+    "BLMPOP": (Vitals(ArgFlt(), ArgInt(), ArgEzz()),
                Variadic(ArgEzz()),
                DIRECTION_ARGS,
                Opts(COUNT_ARG, ArgInt())),
     "BLPOP":  (Vitals(ArgEzz()),
                Variadic(ArgEzz()),
-               Vitals(ArgInt())),
+               Vitals(ArgFlt())),
     "BRPOP":  (Vitals(ArgEzz()),
                Variadic(ArgEzz()),
-               Vitals(ArgInt())),
-    "BRPOPLPUSH": Vitals(ArgEzz(), ArgEzz(), ArgInt()),
+               Vitals(ArgFlt())),
+    "BRPOPLPUSH": Vitals(ArgEzz(), ArgEzz(), ArgFlt()),
     "LINDEX":  Vitals(ArgEzz(), ArgInt()),
-    "LINSERT": Vitals(ArgEzz(), POSITION_ARGS, ArgInt(), ArgEzz()),
+    "LINSERT": Vitals(ArgEzz(), POSITION_ARGS, ArgEzz(), ArgEzz()),
     "LLEN":    Vitals(ArgEzz()),
     "LMOVE":   Vitals(ArgEzz(), ArgEzz(), DIRECTION_ARGS, DIRECTION_ARGS),
     "LMPOP":  (Vitals(ArgInt(), ArgEzz()),
@@ -8,7 +8,7 @@ class RequiredPattern(core.Immutable):
     for a section or argument list to be considered valid. It ensures that
     subclasses are treated as required components during parsing or validation.
     """
-    pass
+    __slots__ = ()
 
 class OptionalPattern(core.Immutable):
     """
@@ -18,7 +18,7 @@ class OptionalPattern(core.Immutable):
     require a match. Subclasses represent arguments or structures that may 
     be omitted from the input without causing validation errors.
     """
-    pass
+    __slots__ = ()
 
 class StrictPattern(core.Immutable):
     """
@@ -28,4 +28,4 @@ class StrictPattern(core.Immutable):
     literal string matches or specific sets of allowed values, as opposed to
     looser, type-based matching (like integers or floats).
     """
-    pass
+    __slots__ = ()
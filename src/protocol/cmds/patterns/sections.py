@@ -10,7 +10,7 @@ class Section(core.Immutable):
     Represents a logical grouping of patterns (arguments or options) that
     form a distinct part of a command's structure.
     """
-    pass
+    __slots__ = ()
 
 class RequiredSect(Section):
     """
@@ -18,7 +18,7 @@ class RequiredSect(Section):
     
     All of its element must be both present and valid.
     """
-    pass
+    __slots__ = ()
 
 class Vitals(RequiredSect):
     """
@@ -30,6 +30,8 @@ class Vitals(RequiredSect):
     Attributes:
         patterns (arr): The ordered sequence of required patterns.
     """
+    __slots__ = ("patterns",)
+
     def __init__(self, *patterns: RequiredPattern) -> None:
         super().__init__()
         self.patterns = tuple(patterns)
@@ -41,7 +43,7 @@ class OptionalSect(Section, OptionalPattern):
     Represents a segment of the command that can be omitted. Inherits from 
     OptionalPattern to allow nesting within other optional structures.
     """
-    pass
+    __slots__ = ()
 
 class OptSet(OptionalSect):
     """
@@ -53,6 +55,8 @@ class OptSet(OptionalSect):
     Attributes:
         patterns (set): An immutable set of available keyed options.
     """
+    __slots__ = ("patterns",)
+
     def __init__(self, *optionals: OptionalSect) -> None:
         super().__init__()
         self.patterns = frozenset(optionals)
@@ -65,6 +69,8 @@ class Optionals(OptionalSect):
         patterns (arr): A sequence of patterns 
             contained within this optional section.
     """
+    __slots__ = ("patterns",)
+
     def __init__(self, patterns: tuple[OptionalPattern, ...]) -> None:
         super().__init__()
         self.patterns = patterns
@@ -75,6 +81,8 @@ class Opts(Optionals):
     
     A user provided a correct option section if all patterns are matched.
     """
+    __slots__ = ()
+
     def __init__(self, *patterns: OptionalPattern) -> None:
         super().__init__(tuple(patterns))
 
@@ -90,6 +98,8 @@ class Variadic(Opts):
     the command accepts an unlimited number of arguments in groups of three, 
     where each argument in a group must match its corresponding pattern definition.
     """
+    __slots__ = ()
+
     def __init__(self, *patterns: OptionalPattern) -> None:
         super().__init__(*patterns)
 
@@ -99,6 +109,8 @@ class KeyedVariadic(Variadic):
     
     Example: A flag followed by an arbitrary list of values.
     """
+    __slots__ = ("key",)
+
     def __init__(self, key: VariadicKey,
                  *patterns: OptionalPattern) -> None:
         super().__init__(*patterns)
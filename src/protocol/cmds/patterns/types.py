@@ -8,7 +8,7 @@ class Argument(RequiredPattern, OptionalPattern):
     or an optional component within a command structure. Subclasses define
     specific data types or matching logic (e.g., integers, literals).
     """
-    pass
+    __slots__ = ()
 
 class ArgEzz(Argument):
     """
@@ -17,7 +17,7 @@ class ArgEzz(Argument):
     Used for variable inputs (such as keys or arbitrary string values) 
     that do not need to match a specific pre-defined pattern/keyword.
     """
-    pass
+    __slots__ = ()
 
 class ArgInt(Argument):
     """
@@ -25,7 +25,7 @@ class ArgInt(Argument):
     
     Validates that the provided input token can be parsed as an integer.
     """
-    pass
+    __slots__ = ()
 
 class ArgFlt(Argument):
     """
@@ -33,7 +33,7 @@ class ArgFlt(Argument):
     
     Validates that the provided input token can be parsed as a float.
     """
-    pass
+    __slots__ = ()
 
 class ArgStr(Argument, StrictPattern):
     """
@@ -45,6 +45,8 @@ class ArgStr(Argument, StrictPattern):
     Attributes:
         pattern (str): The exact string literal that this argument matches.
     """
+    __slots__ = ("pattern",)
+
     def __init__(self, pattern: str) -> None:
         super().__init__()
         self.pattern = pattern
@@ -59,6 +61,8 @@ class ArgSet(Argument, StrictPattern):
     Attributes:
         patterns (frozenset): An immutable set of allowed string patterns.
     """
+    __slots__ = ("patterns",)
+
     def __init__(self, *patterns: Argument | str) -> None:
         super().__init__()
         # Allow client code to simple type in strings.
@@ -80,5 +84,7 @@ class VariadicKey(StrictPattern):
     Attributes:
         pattern (StrictPattern): The strict pattern acting as the option key.
     """
+    __slots__ = ("pattern",)
+
     def __init__(self, pattern: StrictPattern) -> None:
         self.pattern = pattern
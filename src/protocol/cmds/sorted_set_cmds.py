@@ -19,15 +19,15 @@ from .patterns import CmdDict, \
                       WEIGHTS_ARG
 
 SORTED_SET_CMDS: CmdDict = frozendict({
-    "BZMPOP": (Vitals(ArgInt(), ArgInt(), ArgEzz()),
+    "BZMPOP": (Vitals(ArgFlt(), ArgInt(), ArgEzz()),
                Variadic(ArgEzz()),
                Vitals(EXTREMITY_ARGS)),
     "BZPOPMAX": (Vitals(ArgEzz()),
                  Variadic(ArgEzz()),
-                 Vitals(ArgInt())),
+                 Vitals(ArgFlt())),
     "BZPOPMIN": (Vitals(ArgEzz()),
                  Variadic(ArgEzz()),
-                 Vitals(ArgInt())),
+                 Vitals(ArgFlt())),
     "ZADD":  (Vitals(ArgEzz()),
               Opts(PRESENCE_ARGS),
               Opts(COMP_ARGS),
@@ -36,7 +36,7 @@ SORTED_SET_CMDS: CmdDict = frozendict({
               Vitals(ArgFlt(), ArgEzz()),
               Variadic(ArgFlt(), ArgEzz())),
     "ZCARD":  Vitals(ArgEzz()),
-    "ZCOUNT": Vitals(ArgEzz(), ArgFlt(), ArgFlt()),
+    "ZCOUNT": Vitals(ArgEzz(), ArgEzz(), ArgEzz()),
     "ZDIFF": (Vitals(ArgInt(), ArgEzz()),
               Variadic(ArgEzz()),
               Opts(WITHSCORES_ARG)),
@@ -71,7 +71,7 @@ SORTED_SET_CMDS: CmdDict = frozendict({
     "ZRANDMEMBER": (Vitals(ArgEzz()),
                     Opts(ArgInt(),
                          Opts(WITHSCORES_ARG))),
-    "ZRANGE": (Vitals(ArgEzz(), ArgInt(), ArgInt()),
+    "ZRANGE": (Vitals(ArgEzz(), ArgEzz(), ArgEzz()),
                Opts(BY_ARGS),
                Opts(REV_ARG),
                Opts(LIMIT_ARG, ArgInt(), ArgInt()),
@@ -91,12 +91,12 @@ SORTED_SET_CMDS: CmdDict = frozendict({
               Variadic(ArgEzz())),
     "ZREMRANGEBYLEX":   Vitals(ArgEzz(), ArgEzz(), ArgEzz()),
     "ZREMRANGEBYRANK":  Vitals(ArgEzz(), ArgInt(), ArgInt()),
-    "ZREMRANGEBYSCORE": Vitals(ArgEzz(), ArgFlt(), ArgFlt()),
+    "ZREMRANGEBYSCORE": Vitals(ArgEzz(), ArgEzz(), ArgEzz()),
     "ZREVRANGE": (Vitals(ArgEzz(), ArgInt(), ArgInt()),
                   Opts(WITHSCORES_ARG)),
     "ZREVRANGEBYLEX":   (Vitals(ArgEzz(), ArgEzz(), ArgEzz()),
                          Opts(LIMIT_ARG, ArgInt(), ArgInt())),
-    "ZREVRANGEBYSCORE": (Vitals(ArgEzz(), ArgFlt(), ArgFlt()),
+    "ZREVRANGEBYSCORE": (Vitals(ArgEzz(), ArgEzz(), ArgEzz()),
                          Opts(WITHSCORES_ARG),
                          Opts(LIMIT_ARG, ArgInt(), ArgInt())),
     "ZREVRANK": (Vitals(ArgEzz(), ArgEzz()),
@@ -109,13 +109,13 @@ SORTED_SET_CMDS: CmdDict = frozendict({
                Variadic(ArgEzz()),
                Opts(WEIGHTS_ARG, ArgFlt(),
                     Variadic(ArgFlt())),
-                Opts(AGGREGATE_ARGS, AGGREGATE_ARG),
+                Opts(AGGREGATE_ARG, AGGREGATE_ARGS),
                 Opts(WITHSCORES_ARG)),
     "ZUNIONSTORE": (Vitals(ArgEzz(), ArgInt(), ArgEzz()),
                     Variadic(ArgEzz()),
                     Opts(WEIGHTS_ARG, ArgFlt(),
                          Variadic(ArgFlt())),
-                    Opts(AGGREGATE_ARGS, AGGREGATE_ARG))
+                    Opts(AGGREGATE_ARG, AGGREGATE_ARGS))
 })
 """
 Predefined set storing Sorted sets specific commands.
@@ -19,12 +19,12 @@ STRING_CMDS: CmdDict = frozendict({
     "DECR":   Vitals(ArgEzz()),
     "DECRBY": Vitals(ArgEzz(), ArgEzz()),
     "DELEX": (Vitals(ArgEzz()),
-              Opts(COMPARISON_ARGS, ArgInt())),
+              Opts(COMPARISON_ARGS, ArgEzz())),
     "DIGEST": Vitals(ArgEzz()),
     "GET":    Vitals(ArgEzz()),
     "GETDEL": Vitals(ArgEzz()),
     "GETEX": (Vitals(ArgEzz()),
-              OptSet(Opts(COMPARISON_ARGS, ArgInt()),
+              OptSet(Opts(PERSISTENCE_ARGS, ArgInt()),
                      Opts(PERSIST_ARG))),
     "GETRANGE": Vitals(ArgEzz(), ArgInt(), ArgInt()),
     "GETSET": Vitals(ArgEzz(), ArgEzz()),
@@ -50,7 +50,7 @@ STRING_CMDS: CmdDict = frozendict({
     "PSETEX":  Vitals(ArgEzz(), ArgInt(), ArgEzz()),
     "SET":    (Vitals(ArgEzz(), ArgEzz()),
                OptSet(Opts(PRESENCE_ARGS),
-                      Opts(COMPARISON_ARGS, ArgInt())),
+                      Opts(COMPARISON_ARGS, ArgEzz())),
                Opts(GET_ARG),
                OptSet(Opts(PERSISTENCE_ARGS, ArgInt()),
                       Opts(KEEPTTL_ARG))),
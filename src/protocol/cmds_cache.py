@@ -0,0 +1,145 @@
+"""
+Cache of the compiled syntax of the predefined commands.
+
+Importing the pattern tables builds thousands of immutable objects,
+and compiling them takes longer still; neither is needed to validate a single command.
+The compiled commands are serialized once, with `marshal`, in a cache file:
+an index mapping every command to its family, and the compiled commands of each family.
+The index is loaded on first use, and each family only when one of its commands is validated.
+
+The cache is rebuilt whenever the sources it was compiled from change.
+It is built at install time, or else by the first validation.
+
+Usage: PYTHONPATH=src python3 -m protocol.cmds_cache
+"""
+import contextlib
+import hashlib
+import marshal
+import os
+import sys
+from pathlib import Path
+
+import core
+
+from .constants_cmds import MatcherData
+
+logger = core.get_logger(__name__)
+
+# Mapping from command name, in uppercase, to its family.
+CmdIndex = dict[str, str]
+
+# Mapping from family to its serialized compiled commands.
+FamilyBlobs = dict[str, bytes]
+
+_PACKAGE_DIR: Path = Path(__file__).parent
+"""
+Internal constant.
+
+The directory of the protocol package.
+"""
+
+_CACHE_PATH: Path = _PACKAGE_DIR / "__pycache__" / "cmds.cache"
+"""
+Internal constant.
+
+The cache file; it lives next to the bytecode of the package, and is never committed.
+"""
+
+_SOURCE_PATHS: tuple[Path, ...] = (_PACKAGE_DIR / "cmds_compiler.py",
+                                   _PACKAGE_DIR / "constants_cmds.py")
+"""
+Internal constant.
+
+The modules the cache is compiled by, besides the pattern tables of the `cmds` package.
+"""
+
+def load() -> tuple[CmdIndex, FamilyBlobs]:
+    """
+    Loads the index of the predefined commands and their serialized families.
+    A missing, unreadable or stale cache is rebuilt first.
+
+    Returns:
+        dict: Maps every command, in uppercase, to its family.
+        dict: Maps every family to its serialized compiled commands; see `load_family()`.
+    """
+    digest = _digest()
+    try:
+        with open(_CACHE_PATH, "rb") as file:
+            cached_digest, index, blobs = marshal.load(file)
+        if cached_digest == digest:
+            return index, blobs
+        logger.info("The commands cache is stale.")
+    except (OSError, EOFError, ValueError, TypeError) as e:
+        logger.info(f"The commands cache could not be loaded: {e}.")
+    return build(digest)
+
+def load_family(blob: bytes) -> dict[str, MatcherData]:
+    """
+    Deserializes the compiled commands of a family.
+
+    Args:
+        blob (bytes): The serialized family, as returned by `load()`.
+
+    Returns:
+        dict: The compiled commands, indexed by their uppercase name.
+    """
+    return marshal.loads(blob)
+
+def build(digest: str | None = None) -> tuple[CmdIndex, FamilyBlobs]:
+    """
+    Compiles the pattern tables and writes the cache file.
+    The cache is still returned if it can not be written (e.g. a read-only installation).
+
+    Args:
+        digest (str): The digest of the sources, if it was already computed.
+
+    Returns:
+        dict: Maps every command, in uppercase, to its family.
+        dict: Maps every family to its serialized compiled commands.
+    """
+    # The compiler imports the pattern tables;
+    # importing it at module level would defeat the purpose of the cache.
+    from .cmds_compiler import compile_families
+
+    if digest is None:
+        digest = _digest()
+
+    index: CmdIndex = {}
+    blobs: FamilyBlobs = {}
+    for family, compiled in compile_families().items():
+        index.update(dict.fromkeys(compiled, family))
+        blobs[family] = marshal.dumps(compiled)
+
+    # The cache is replaced at once; a concurrent reader never sees half of it.
+    tmp_path = _CACHE_PATH.with_name(f"{_CACHE_PATH.name}.{os.getpid()}.tmp")
+    try:
+        _CACHE_PATH.parent.mkdir(exist_ok=True)
+        with open(tmp_path, "wb") as file:
+            marshal.dump((digest, index, blobs), file)
+        os.replace(tmp_path, _CACHE_PATH)
+        logger.info(f"The commands cache was written to {_CACHE_PATH}.")
+    except OSError as e:
+        logger.warning(f"The commands cache could not be written: {e}.")
+        with contextlib.suppress(OSError):
+            tmp_path.unlink(missing_ok=True)
+    return index, blobs
+
+def _digest() -> str:
+    """
+    Internal method.
+
+    Hashes every source the cache is compiled from,
+    along with the interpreter version, which the `marshal` format depends on.
+
+    Returns:
+        str: The digest of the sources.
+    """
+    hasher = hashlib.sha256(f"{sys.version_info[:2]} {marshal.version}".encode(core.UTF8_ENC))
+    paths = sorted((_PACKAGE_DIR / "cmds").rglob("*.py")) + list(_SOURCE_PATHS)
+    for path in paths:
+        hasher.update(path.relative_to(_PACKAGE_DIR).as_posix().encode(core.UTF8_ENC))
+        hasher.update(path.read_bytes())
+    return hasher.hexdigest()
+
+if __name__ == "__main__":
+    build()
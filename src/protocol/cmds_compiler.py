@@ -0,0 +1,303 @@
+from .cmds import CMD_FAMILIES, CmdDict, \
+                  StrictPattern, Argument, ArgEzz, ArgInt, ArgFlt, ArgStr, ArgSet, VariadicKey, \
+                  Section, Vitals, OptSet, Opts, Variadic, KeyedVariadic
+from .constants_cmds import MatcherData, INT_CLASS, FLT_CLASS, TOKEN_CLASSES
+
+def compile_families() -> dict[str, dict[str, MatcherData]]:
+    """
+    Compiles every command of the predefined tables.
+
+    Returns:
+        dict: Maps every family of commands to its compiled commands,
+              indexed by their uppercase name.
+    """
+    return {family: compile_cmds(cmd_dict) for family, cmd_dict in CMD_FAMILIES.items()}
+
+def compile_cmds(cmd_dict: CmdDict) -> dict[str, MatcherData]:
+    """
+    Compiles the commands of a single table.
+    A command defined by a single section is not wrapped in a tuple.
+
+    Returns:
+        dict: The compiled commands, indexed by their uppercase name.
+    """
+    compiled: dict[str, MatcherData] = {}
+    for name, sections in cmd_dict.items():
+        if not isinstance(sections, tuple):
+            sections = (sections,)
+        compiled[name.upper()] = _Compiler(name, sections).build()
+    return compiled
+
+# A test is the set of token classes a pattern accepts; None accepts any token.
+_Test = frozenset[int | str] | None
+
+class _Compiler:
+    """
+    Internal helper class.
+
+    Compiles the sections of a command into a nondeterministic automaton (Thompson construction),
+    which is then turned into a deterministic one (subset construction).
+
+    Sections are compiled in order:
+        - Vitals: required patterns, in order.
+        - Opts: optional patterns, all of them or none; nested sections keep their own meaning.
+        - Variadic: zero or more repetitions of its patterns.
+        - KeyedVariadic: an optional key, followed by zero or more repetitions of its patterns.
+        - OptSet: at most one of its options.
+
+    The server accepts keyword options in any order.
+    Therefore a run of optional sections, each of them starting with a keyword,
+    matches its sections in any order; repeated or conflicting keywords are left for the server.
+    """
+
+    _MIN_UNORDERED_RUN: int = 2
+    """
+    Internal constant.
+
+    How many keyword led optional sections in a row are matched in any order.
+    """
+
+    def __init__(self, name: str, sections: tuple[Section | Argument, ...]) -> None:
+        self._name = name
+        self._keywords: set[str] = set()
+        self._moves: list[list[tuple[_Test, int]]] = []
+        self._eps: list[list[int]] = []
+
+        self._start = self._new_node()
+        self._final = self._compile_seq(self._start, sections)
+
+    def build(self) -> MatcherData:
+        """
+        Builds the deterministic automaton, state by state, over every token class.
+
+        Returns:
+            tuple: The compiled syntax of the command.
+        """
+        alphabet = tuple(self._keywords) + TOKEN_CLASSES
+        start = self._closure((self._start,))
+        states: dict[frozenset[int], int] = {start: 0}
+        pending = [start]
+        transitions: list[dict[int | str, int]] = []
+        accepting: set[int] = set()
+
+        # States are numbered in the order they are found,
+        # which is also the order they are visited.
+        while len(transitions) < len(states):
+            nodes = pending[len(transitions)]
+            if self._final in nodes:
+                accepting.add(len(transitions))
+
+            transition: dict[int | str, int] = {}
+            for token_class in alphabet:
+                targets = [target for node in nodes
+                                  for test, target in self._moves[node]
+                                  if test is None or token_class in test]
+                if not targets:
+                    continue
+
+                target_nodes = self._closure(targets)
+                if target_nodes not in states:
+                    states[target_nodes] = len(states)
+                    pending.append(target_nodes)
+                transition[token_class] = states[target_nodes]
+            transitions.append(transition)
+
+        return (self._name, frozenset(self._keywords), tuple(transitions), frozenset(accepting))
+
+    def _new_node(self) -> int:
+        """
+        Internal method.
+        """
+        self._moves.append([])
+        self._eps.append([])
+        return len(self._moves) - 1
+
+    def _closure(self, nodes) -> frozenset[int]:
+        """
+        Internal method.
+
+        Returns:
+            frozenset: The nodes reachable from the given ones without consuming a token.
+        """
+        reached = set(nodes)
+        stack = list(nodes)
+        while stack:
+            for target in self._eps[stack.pop()]:
+                if target not in reached:
+                    reached.add(target)
+                    stack.append(target)
+        return frozenset(reached)
+
+    def _test(self, pattern: StrictPattern | Argument) -> _Test:
+        """
+        Internal method.
+
+        Returns:
+            frozenset: The token classes accepted by the pattern.
+            None: If the pattern accepts any token.
+        """
+        if isinstance(pattern, ArgStr):
+            keyword = pattern.pattern.upper()
+            self._keywords.add(keyword)
+            return frozenset((keyword,))
+        if isinstance(pattern, ArgSet):
+            tests = [self._test(member) for member in pattern.patterns]
+            if None in tests:
+                return None
+            return frozenset().union(*tests)
+        if isinstance(pattern, VariadicKey):
+            return self._test(pattern.pattern)
+        if isinstance(pattern, ArgInt):
+            return frozenset((INT_CLASS,))
+        if isinstance(pattern, ArgFlt):
+            return frozenset((INT_CLASS, FLT_CLASS))
+        assert isinstance(pattern, ArgEzz)
+        return None
+
+    def _compile_seq(self, entry: int, items) -> int:
+        """
+        Internal method.
+
+        Compiles consecutive patterns or sections.
+        Runs of keyword led optional sections are matched in any order.
+
+        Returns:
+            int: The node reached once every item was matched.
+        """
+        idx = 0
+        while idx < len(items):
+            end_idx = idx
+            while end_idx < len(items) and _Compiler._leads_with_keyword(items[end_idx]):
+                end_idx += 1
+
+            if end_idx - idx >= _Compiler._MIN_UNORDERED_RUN:
+                entry = self._compile_unordered(entry, items[idx:end_idx])
+                idx = end_idx
+                continue
+
+            entry = self._compile_item(entry, items[idx])
+            idx += 1
+        return entry
+
+    def _compile_item(self, entry: int, item) -> int:
+        """
+        Internal method.
+
+        Returns:
+            int: The node reached once the item was matched.
+        """
+        if isinstance(item, OptSet):
+            exit = self._compile_alt(entry, tuple(item.patterns))
+            self._eps[entry].append(exit)
+            return exit
+        if isinstance(item, Opts):
+            start = self._new_node()
+            self._eps[entry].append(start)
+            exit = self._compile_body(start, item)
+            self._eps[start].append(exit)
+            return exit
+        if isinstance(item, Vitals):
+            return self._compile_seq(entry, item.patterns)
+
+        exit = self._new_node()
+        self._moves[entry].append((self._test(item), exit))
+        return exit
+
+    def _compile_body(self, entry: int, item) -> int:
+        """
+        Internal method.
+
+        Compiles an optional section as if it was required;
+        the caller decides whether it can be skipped.
+
+        Returns:
+            int: The node reached once the section was matched.
+        """
+        if isinstance(item, KeyedVariadic):
+            entry = self._compile_item(entry, item.key)
+            return self._compile_star(entry, item.patterns)
+        if isinstance(item, Variadic):
+            return self._compile_star(entry, item.patterns)
+        if isinstance(item, OptSet):
+            return self._compile_alt(entry, tuple(item.patterns))
+        if isinstance(item, Opts):
+            return self._compile_seq(entry, item.patterns)
+        return self._compile_item(entry, item)
+
+    def _compile_star(self, entry: int, patterns) -> int:
+        """
+        Internal method.
+
+        Compiles zero or more repetitions of the patterns.
+
+        Returns:
+            int: The node reached after the last repetition.
+        """
+        loop = self._new_node()
+        self._eps[entry].append(loop)
+        body_exit = self._compile_seq(loop, patterns)
+        self._eps[body_exit].append(loop)
+
+        exit = self._new_node()
+        self._eps[loop].append(exit)
+        return exit
+
+    def _compile_alt(self, entry: int, options) -> int:
+        """
+        Internal method.
+
+        Compiles exactly one of the options.
+
+        Returns:
+            int: The node reached once an option was matched.
+        """
+        exit = self._new_node()
+        for option in options:
+            start = self._new_node()
+            self._eps[entry].append(start)
+            option_exit = self._compile_body(start, option)
+            self._eps[option_exit].append(exit)
+        return exit
+
+    def _compile_unordered(self, entry: int, sections) -> int:
+        """
+        Internal method.
+
+        Compiles keyword led optional sections, matched in any order.
+
+        Returns:
+            int: The node reached once no other section matches.
+        """
+        options: list = []
+        for section in sections:
+            if isinstance(section, OptSet):
+                options.extend(section.patterns)
+            else:
+                options.append(section)
+
+        loop = self._new_node()
+        self._eps[entry].append(loop)
+        body_exit = self._compile_alt(loop, options)
+        self._eps[body_exit].append(loop)
+
+        exit = self._new_node()
+        self._eps[loop].append(exit)
+        return exit
+
+    @staticmethod
+    def _leads_with_keyword(item) -> bool:
+        """
+        Internal method.
+
+        Returns:
+            bool: True if the item is an optional section whose every match starts with a keyword.
+        """
+        if isinstance(item, KeyedVariadic):
+            return True
+        if isinstance(item, Variadic):
+            return False
+        if isinstance(item, Opts):
+            return bool(item.patterns) and isinstance(item.patterns[0], StrictPattern)
+        if isinstance(item, OptSet):
+            return bool(item.patterns) and all(map(_Compiler._leads_with_keyword, item.patterns))
+        return False
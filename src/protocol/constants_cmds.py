@@ -0,0 +1,29 @@
+"""
+A command's syntax is compiled into a deterministic automaton over token classes.
+Keywords are their own classes (their uppercase spelling);
+any other token falls into one of the classes below.
+"""
+
+# A compiled command: its name, its keywords,
+# the transitions of each state (indexed by token class) and the accepting states.
+MatcherData = tuple[str, frozenset[str], tuple[dict[int | str, int], ...], frozenset[int]]
+
+INT_CLASS = 0
+"""
+The class of tokens parsed as integers; they are floats as well.
+"""
+
+FLT_CLASS = 1
+"""
+The class of tokens parsed as floats, but not as integers.
+"""
+
+STR_CLASS = 2
+"""
+The class of tokens that are neither keywords, nor numbers.
+"""
+
+TOKEN_CLASSES = (INT_CLASS, FLT_CLASS, STR_CLASS)
+"""
+Every token class, except the keywords.
+"""
@@ -1,24 +1,33 @@
 from frozendict import frozendict
-from typing import Callable
+from typing import TYPE_CHECKING, Callable
 
 import core
-from network import Receiver
 
 from .constants_resp import RespDataType, \
                             SYMB_TYPE, NULL_LENGTH, \
                             NULL
-from .output import Output, OutputStr, OutputErr, OutputSeq, OutputMap, OutputAtt
+from .output import Output, OutputStr, OutputErr, OutputInt, OutputDbl, OutputBool, OutputMap, OutputAtt, double, integer, sequence
+from .tape import TapeDecoder
+
+# The network package owns a decoder for each connection.
+# Importing the receiver at runtime would create a circular import.
+if TYPE_CHECKING:
+    from network import Receiver
 
 logger = core.get_logger(__name__)
 
-def decoder(receiver: Receiver) -> Output:
+def decoder(receiver: "Receiver", lazy: bool = False) -> Output:
     """
     Decodes a RESP-encoded Redis response using a Receiver instance.
 
     The input is assumed to be well-formed according to RESP rules.
+    The progress of a partial response is discarded;
+    use a `Decoder` instance to resume decoding after more data is received.
 
     Args:
         receiver (obj): The receiver instance to consume data from.
+        lazy (bool): Whether the response is only framed, as a tape,
+                     and its elements are decoded when they are accessed.
 
     Returns:
         Output: The decoded value.
@@ -26,218 +35,391 @@ def decoder(receiver: Receiver) -> Output:
     Raises:
         PartialResponseError: If the buffer provided by receiver is incomplete.
     """
-    decoder = _Decoder(receiver)
-    return decoder.decoded
+    if lazy:
+        return TapeDecoder(receiver).decode()
+    return Decoder(receiver).decode()
 
-class _Decoder:
+class _Frame:
     """
     Internal helper class.
 
-    Decodes Redis RESP3/RESP2-encoded strings into structured Output objects,
-    preserving the original hierarchical structure.
+    An aggregate output whose elements are still being decoded.
 
     Attributes:
-        receiver (Receiver): The receiver source.
-        decoded (Output): The fully decoded representation of the input.
+        data_type (int): The RESP data type of the aggregate.
+        size (int): How many elements the aggregate is made of.
+        children (list): The already decoded elements.
+    """
+    __slots__ = ("data_type", "size", "children")
+
+    def __init__(self, data_type: RespDataType, size: int) -> None:
+        self.data_type = data_type
+        self.size = size
+        self.children: list[Output] = []
+
+class _Bulk:
+    """
+    Internal helper class.
+
+    A bulk output whose header was decoded, but whose payload was not received yet.
+
+    Attributes:
+        data_type (int): The RESP data type of the bulk output.
+        length (int): How many payload bytes are needed, NOT including CRLF.
+        value (str): The payload, once it was consumed.
+    """
+    __slots__ = ("data_type", "length", "value")
+
+    def __init__(self, data_type: RespDataType, length: int) -> None:
+        self.data_type = data_type
+        self.length = length
+        self.value: str | None = None
+
+class Decoder:
     """
+    Resumable decoder of Redis RESP3/RESP2-encoded responses.
 
-    # Static dispatcher mapping RESP data types to traversal methods.
+    Decodes responses into structured Output objects,
+    preserving the original hierarchical structure.
+
+    When the receiver runs out of bytes in the middle of a response,
+    the progress is kept in an explicit parse stack.
+    The next call resumes exactly where the previous one stopped,
+    so no byte of a response is ever decoded twice.
+
+    Header lines are matched on their raw bytes.
+    The most common lines (`+OK`, `:1`, `$-1`...) are decoded into shared outputs,
+    without decoding anything or building a new output.
+    """
+
+    # Static dispatcher mapping RESP symbols to header handlers.
     # This is a class-level field shared by all instances;
     # It is initialized exactly once after the class is defined.
-    _TRAVERSERS: frozendict[RespDataType, Callable]
+    _HANDLERS: frozendict[bytes, tuple[RespDataType, Callable]]
     """
     Internal dispatcher.
 
-    Maps RESP3 data types to their traversal functions.
+    Maps the encoded first byte of a header line to its RESP3 data type, and to the handler of the line.
+
+    A handler returns the decoded output,
+    or None if the output continues after the header (bulk payload or aggregate elements).
+    """
+
+    # The outputs are immutable, so a single instance can be shared by every response.
+    _SHARED_OUTPUTS: frozendict[bytes, Output] = frozendict({
+        b"+OK": OutputStr("OK"),
+        b"+QUEUED": OutputStr("QUEUED"),
+        b":0": OutputInt(0),
+        b":1": OutputInt(1),
+        b"#t": OutputBool(True),
+        b"#f": OutputBool(False),
+        b"_": OutputStr(NULL),
+        b"$-1": OutputStr(NULL),
+    })
+    """
+    Internal constant.
 
-    Used by `_traverser()` to decode values based on type.
+    Maps the most common complete lines, NOT including CRLF, to their decoded outputs.
     """
-    
+
     _COLON_SEP: str = ":"
     """
     Internal constant.
 
     The separator between the encoding and the content in a verbatim string.
     """
-    
-    def __init__(self, receiver: Receiver) -> None:
+
+    _PAIR_SIZE: int = 2
+    """
+    Internal constant.
+
+    How many elements a key-value pair is made of.
+    """
+
+    _TRUE: bytes = b"t"
+    """
+    Internal constant.
+
+    The content of a true boolean.
+    """
+
+    def __init__(self, receiver: "Receiver") -> None:
         self._receiver = receiver
-        self.decoded = self._traverser()
+        self._stack: list[_Frame] = []
+        self._bulk: _Bulk | None = None
 
-    def _traverser(self) -> Output:
+    def in_progress(self) -> bool:
+        """
+        Checks if a response was partially decoded.
+
+        Returns:
+            bool: True if the decoding stopped in the middle of a response, False otherwise.
+        """
+        return bool(self._stack) or self._bulk is not None
+
+    def reset(self) -> None:
+        """
+        Discards the progress of a partially decoded response.
+        """
+        self._stack.clear()
+        self._bulk = None
+
+    def decode(self) -> Output:
+        """
+        Decodes the next response, resuming a partially decoded one.
+
+        Returns:
+            Output: The decoded value.
+
+        Raises:
+            KeyError: Invalid first byte of an output.
+            PartialResponseError: If the buffer does not contain the rest of the response.
+                                  The progress is kept for the next call.
+        """
+        while True:
+            if self._bulk is not None:
+                output = self._resume_bulk()
+            else:
+                output = self._decode_header()
+                if output is None:
+                    continue
+
+            output = self._attach(output)
+            if output is not None:
+                return output
+
+    def _attach(self, output: Output) -> Output | None:
         """
         Internal method.
 
-        Dispatches traversal logic based on the RESP data type prefix symbol.
+        Appends a decoded output to the innermost unfinished aggregate.
+        Completed aggregates are built, and attached to their own parent in turn.
+
+        Returns:
+            Output: The whole response, if it was completed.
+            None: If the response continues.
+        """
+        while self._stack:
+            frame = self._stack[-1]
+            frame.children.append(output)
+            if len(frame.children) < frame.size:
+                return None
+
+            self._stack.pop()
+            output = Decoder._build(frame.data_type, frame.children)
+        return output
+
+    def _decode_header(self) -> Output | None:
+        """
+        Internal method.
+
+        Consumes a header line and dispatches it based on the RESP data type prefix symbol.
+        The most common lines are decoded into shared outputs.
 
         Raises:
             KeyError: Invalid first byte of an output.
-            PartialResponseError: If the buffer is empty.
+            PartialResponseError: If the line is not complete.
         """
-        symb = self._receiver.consume(core.STR_TRAVERSAL_STRIDE)
+        line = self._receiver.consume_line()
+        output = Decoder._SHARED_OUTPUTS.get(line)
+        if output is not None:
+            return output
+
+        symb = line[:core.STR_TRAVERSAL_STRIDE]
         try:
-            data_type = SYMB_TYPE[symb]
+            data_type, handler = Decoder._HANDLERS[symb]
         except KeyError:
             logger.error(f"Unknown RESP type byte received: {symb!r}")
             raise
+        return handler(self, data_type, line[core.STR_TRAVERSAL_STRIDE:])
 
-        # Call the appropriate method for the first byte received.
-        traverser = _Decoder._TRAVERSERS[data_type]
-        return traverser(self)
-
-    def _traverse_string(self) -> OutputStr:
+    def _decode_string(self, data_type: RespDataType, content: bytes) -> OutputStr:
         """
         Internal method.
 
-        Handles simple strings, simple errors, RESP null values, and similar types.
-
-        Traverses the Redis output until the CRLF terminator.
-        
         Example: Input "+OK\r\n" returns OutputStr("OK").
-
-        Raises:
-            PartialResponseError: If CRLF is missing.
         """
-        line = self._receiver.consume_crlf()
-        return OutputStr(line)
+        return OutputStr(content.decode(core.UTF8_ENC))
 
-    def _traverse_null(self) -> OutputStr:
+    def _decode_int(self, data_type: RespDataType, content: bytes) -> OutputInt | OutputStr:
         """
         Internal method.
 
-        Parses a RESP null value.
+        Handles integers and big numbers, which are not bounded to 64 bits.
+        Big numbers with more digits than `int()` converts are kept as text.
 
-        Returns the constant `NULL`.
-        
-        Example: Input "_\r\n" returns OutputStr("NULL").
+        Example: Input ":-12\r\n" returns OutputInt(-12).
         """
-        self._traverse_string()
-        return OutputStr(NULL)
-    
-    def _traverse_bulk_string(self) -> OutputStr:
+        return integer(content)
+
+    def _decode_double(self, data_type: RespDataType, content: bytes) -> OutputDbl:
         """
         Internal method.
 
-        Parses a bulk string by reading its declared length,
-        followed by the content itself.
-        
-        Example: Input "$6\r\nfoobar\r\n" returns OutputStr("foobar").
+        Handles doubles, including "inf", "-inf" and "nan".
+
+        Example: Input ",1.5\r\n" returns OutputDbl(1.5).
+                 Input ",0.10000000000000001\r\n" returns OutputDbl(0.1, "0.10000000000000001").
         """
-        length_str = self._traverse_string().value
-        length = int(length_str)
+        return double(content.decode(core.UTF8_ENC))
 
-        if length == NULL_LENGTH:
-            return OutputStr(NULL)
+    def _decode_bool(self, data_type: RespDataType, content: bytes) -> OutputBool:
+        """
+        Internal method.
 
-        value = self._receiver.consume(length)
-        self._receiver.consume(len(core.CRLF))
-        return OutputStr(value)
+        Example: Input "#t\r\n" returns OutputBool(True).
+        """
+        return OutputBool(content == Decoder._TRUE)
 
-    def _traverse_verbatim_string(self) -> OutputStr:
+    def _decode_simple_error(self, data_type: RespDataType, content: bytes) -> OutputErr:
         """
         Internal method.
 
-        Parses a verbatim string, which consists of:
-        - Three bytes specifying the encoding
-        - A colon separator
-        - The string data
-        
-        Example: Input "=9\r\ntxt:Hello\r\n" returns OutputStr("Hello").
-        """
-        content = self._traverse_bulk_string().value
-        # Under the assumption that the server sends valid verbatim strings,
-        # we can safely assume that the index method does not raise errors.
-        start_idx = content.index(_Decoder._COLON_SEP)
-        return OutputStr(content[start_idx + len(_Decoder._COLON_SEP) : ])
-    
-    def _traverse_simple_error(self) -> OutputErr:
+        Example: Input "-Error\r\n" returns OutputErr("Error").
+        """
+        return OutputErr(content.decode(core.UTF8_ENC))
+
+    def _decode_null(self, data_type: RespDataType, content: bytes) -> OutputStr:
         """
         Internal method.
-        
-        Example: Input "-Error\r\n" returns OutputErr("Error").
+
+        Parses a RESP null value.
+
+        Example: Input "_\r\n" returns OutputStr("null").
         """
-        line = self._receiver.consume_crlf()
-        return OutputErr(line)
+        return OutputStr(NULL)
 
-    def _traverse_bulk_error(self) -> OutputErr:
+    def _decode_bulk(self, data_type: RespDataType, content: bytes) -> OutputStr | None:
         """
         Internal method.
 
-        Parses a bulk error by reading its declared length,
-        followed by the content itself.
-        
-        Example: Input "$6\r\nfoobar\r\n" returns OutputErr("foobar").
+        Parses the declared length of bulk strings, bulk errors and verbatim strings.
+        The payload itself is consumed by `_resume_bulk()`.
+
+        Example: Input "$-1\r\n" returns OutputStr("null").
         """
-        length_str = self._traverse_string().value
-        length = int(length_str)
+        length = int(content)
+        if length == NULL_LENGTH:
+            # RESP2 NULLS can only be represented through the bulk strings and arrays.
+            assert data_type != RespDataType.BULK_ERRORS
+            return OutputStr(NULL)
+
+        self._bulk = _Bulk(data_type, length)
+        return None
+
+    def _resume_bulk(self) -> OutputStr | OutputErr:
+        """
+        Internal method.
 
-        # RESP2 NULLS can only be represented through the bulk strings and arrays.
-        assert length != NULL_LENGTH
+        Consumes the payload of the pending bulk output.
+        The payload is consumed at once, only after all of its bytes were received.
 
-        value = self._receiver.consume(length)
+        Example: Input "$6\r\nfoobar\r\n" returns OutputStr("foobar").
+                 Input "!6\r\nfoobar\r\n" returns OutputErr("foobar").
+                 Input "=10\r\ntxt:foobar\r\n" returns OutputStr("foobar").
+
+        Raises:
+            PartialResponseError: If the payload or its CRLF were not received yet.
+        """
+        bulk = self._bulk
+        assert bulk is not None
+        if bulk.value is None:
+            bulk.value = self._receiver.consume(bulk.length)
         self._receiver.consume(len(core.CRLF))
-        return OutputErr(value)
-    
-    def _traverse_sequence(self) -> OutputSeq:
+        self._bulk = None
+
+        value = bulk.value
+        if bulk.data_type == RespDataType.BULK_ERRORS:
+            return OutputErr(value)
+        if bulk.data_type == RespDataType.VERBATIM_STRINGS:
+            # Under the assumption that the server sends valid verbatim strings,
+            # we can safely assume that the index method does not raise errors.
+            start_idx = value.index(Decoder._COLON_SEP)
+            return OutputStr(value[start_idx + len(Decoder._COLON_SEP) : ])
+        return OutputStr(value)
+
+    def _decode_aggregate(self, data_type: RespDataType, content: bytes) -> Output | None:
         """
         Internal method.
 
-        Parses aggregate RESP types such as arrays, sets, and pushes.
+        Parses the declared length of arrays, sets, pushes, maps and attributes,
+        and pushes a frame collecting their elements.
         Although RC-application does not support push messages,
         the decoder can still interpret them.
-        
-        Example: Input "*2\r\n:1\r\n:2\r\n" returns OutputSeq((OutputStr("1"), OutputStr("2"))).
-        """
-        length = int(self._traverse_string().value)
-        elements = tuple(self._traverser() for _ in range(length))
-        return OutputSeq(elements)
 
-    def _traverse_map(self) -> OutputMap:
+        Example: Input "*0\r\n" returns OutputSeq(()).
+        """
+        length = max(int(content), core.EMPTY_LEN)
+        if data_type == RespDataType.MAPS:
+            size = length * Decoder._PAIR_SIZE
+        elif data_type == RespDataType.ATTRIBUTES:
+            # The attributes are followed by the actual payload.
+            size = length * Decoder._PAIR_SIZE + 1
+        else:
+            size = length
+
+        if size == core.EMPTY_LEN:
+            return Decoder._build(data_type, [])
+        self._stack.append(_Frame(data_type, size))
+        return None
+
+    @staticmethod
+    def _build(data_type: RespDataType, children: list[Output]) -> Output:
         """
         Internal method.
 
-        Parses aggregate key-value structures such as RESP maps and attributes.
-        
-        Example: Input "%1\r\n+k\r\n+v\r\n" returns OutputMap({OutputStr("k"): OutputStr("v")}).
-        """
-        length = int(self._traverse_string().value)
-        result = {}
-        for _ in range(length):
-            key = self._traverser()
-            val = self._traverser()
-            result[key] = val
-        result = frozendict(result)
-        return OutputMap(result)
-    
-    def _traverse_attribute(self) -> OutputAtt:
+        Builds an aggregate output out of its decoded elements.
+        Sequences of integers or of doubles are packed into typed arrays.
+
+        Example: Elements of "*2\r\n:1\r\n$1\r\na\r\n" build OutputSeq((OutputInt(1), OutputStr("a"))).
+                 Elements of "*2\r\n:1\r\n:2\r\n" build OutputVec(array("q", [1, 2])).
+                 Elements of "%1\r\n+k\r\n+v\r\n" build OutputMap({OutputStr("k"): OutputStr("v")}).
+                 Elements of "|1\r\n+k\r\n+v\r\n:1\r\n" build
+                 OutputAtt({OutputStr("k"): OutputStr("v")}, OutputStr("1")).
+        """
+        if data_type == RespDataType.MAPS:
+            return Decoder._build_map(children)
+        if data_type == RespDataType.ATTRIBUTES:
+            attributes = Decoder._build_map(children[:-1])
+            return OutputAtt(attributes, children[-1])
+        return sequence(children)
+
+    @staticmethod
+    def _build_map(children: list[Output]) -> OutputMap:
         """
         Internal method.
 
-        Parses a attributes and message. This consists of:
-        - a key-value map (the attributes)
-        - the actual data payload following the map
-        
-        Example: Input "|1\r\n+k\r\n+v\r\n:1\r\n" returns
-                 OutputAtt({OutputStr("k"): OutputStr("v")}, OutputStr("1")).
+        Pairs consecutive elements as keys and values.
         """
-        attributes = self._traverse_map()
-        output = self._traverser()
-        return OutputAtt(attributes, output)
-
-_Decoder._TRAVERSERS = frozendict({
-    RespDataType.SIMPLE_STRINGS: _Decoder._traverse_string,
-    RespDataType.SIMPLE_ERRORS: _Decoder._traverse_simple_error,
-    RespDataType.INTEGERS: _Decoder._traverse_string,
-    RespDataType.BULK_STRINGS: _Decoder._traverse_bulk_string,
-    RespDataType.ARRAYS: _Decoder._traverse_sequence,
-    RespDataType.NULLS: _Decoder._traverse_null,
-    RespDataType.BOOLEANS: _Decoder._traverse_string,
-    RespDataType.DOUBLES: _Decoder._traverse_string,
-    RespDataType.BIG_NUMBERS: _Decoder._traverse_string,
-    RespDataType.BULK_ERRORS: _Decoder._traverse_bulk_error,
-    RespDataType.VERBATIM_STRINGS: _Decoder._traverse_verbatim_string,
-    RespDataType.MAPS: _Decoder._traverse_map,
-    RespDataType.ATTRIBUTES: _Decoder._traverse_attribute,
-    RespDataType.SETS: _Decoder._traverse_sequence,
-    RespDataType.PUSHES: _Decoder._traverse_sequence,
+        pairs = zip(children[0::Decoder._PAIR_SIZE], children[1::Decoder._PAIR_SIZE])
+        return OutputMap(frozendict(pairs))
+
+_DATA_TYPE_HANDLERS: dict[RespDataType, Callable] = {
+    RespDataType.SIMPLE_STRINGS: Decoder._decode_string,
+    RespDataType.SIMPLE_ERRORS: Decoder._decode_simple_error,
+    RespDataType.INTEGERS: Decoder._decode_int,
+    RespDataType.BULK_STRINGS: Decoder._decode_bulk,
+    RespDataType.ARRAYS: Decoder._decode_aggregate,
+    RespDataType.NULLS: Decoder._decode_null,
+    RespDataType.BOOLEANS: Decoder._decode_bool,
+    RespDataType.DOUBLES: Decoder._decode_double,
+    RespDataType.BIG_NUMBERS: Decoder._decode_int,
+    RespDataType.BULK_ERRORS: Decoder._decode_bulk,
+    RespDataType.VERBATIM_STRINGS: Decoder._decode_bulk,
+    RespDataType.MAPS: Decoder._decode_aggregate,
+    RespDataType.ATTRIBUTES: Decoder._decode_aggregate,
+    RespDataType.SETS: Decoder._decode_aggregate,
+    RespDataType.PUSHES: Decoder._decode_aggregate,
+}
+"""
+Internal dispatcher.
+
+Maps RESP3 data types to the handlers of their header line.
+"""
+
+# Keyed by the raw symbol, so that a header line is dispatched without decoding it,
+# and without hashing an enum member.
+Decoder._HANDLERS = frozendict({
+    symb.encode(core.ASCII_ENC): (data_type, _DATA_TYPE_HANDLERS[data_type])
+    for symb, data_type in SYMB_TYPE.items()
 })
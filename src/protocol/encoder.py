@@ -2,32 +2,42 @@ import core
 
 from .constants_resp import RespDataType, RESP_SYMB
 
-def _encode_arg(arg: str) -> str:
-    """
-    Internal method.
-    Encodes an argument as a bulk string.
-    """
-    encoded = RESP_SYMB[RespDataType.BULK_STRINGS] + str(len(arg)) + core.CRLF
-    encoded += (arg + core.CRLF)
-    return encoded
+_ARRAY_HEADER = (RESP_SYMB[RespDataType.ARRAYS] + "%d" + core.CRLF).encode(core.ASCII_ENC)
+"""
+Internal constant.
+
+The template of an array header, formatted with the number of elements.
+"""
+
+_BULK_STRING = (RESP_SYMB[RespDataType.BULK_STRINGS] + "%d" + core.CRLF + "%b" + core.CRLF).encode(core.ASCII_ENC)
+"""
+Internal constant.
 
-def encoder(cmd: str, argv: list[str]) -> str:
+The template of a bulk string, formatted with its length in bytes and its payload.
+"""
+
+def encoder(cmd: str | bytes, argv: list[str | bytes]) -> bytes:
     """
     Encodes the cmd and the arguments.
     Must be used after running the sanitizer.
 
+    The strings are encoded as UTF-8,
+    and the lengths of the bulk strings are counted in bytes.
+    The frame is joined once, after all of its pieces were encoded.
+
     Args:
-        cmd (str): The command string (e.g. "GET").
-        argv (list[str]): The argument values for the command.
+        cmd (str | bytes): The command string (e.g. "GET").
+        argv (list[str | bytes]): The argument values for the command.
 
     Returns:
-        str: The entire encoded command and arguments,
-             all following the RESP Config.
+        bytes: The entire encoded command and arguments,
+               all following the RESP Config.
     """
-    argc = len(argv)
-    # argc + 1 is necessary since we also send the command itself.
-    encoded = RESP_SYMB[RespDataType.ARRAYS] + str(argc + 1) + core.CRLF
-    encoded += _encode_arg(cmd)
-    for idx in range(argc):
-        encoded += _encode_arg(argv[idx])
-    return encoded
+    # Already encoded arguments are sent as they are.
+    # The command is also sent as the first element.
+    args = [arg.encode(core.UTF8_ENC) if isinstance(arg, str) else arg
+            for arg in (cmd, *argv)]
+
+    frame = [_ARRAY_HEADER % len(args)]
+    frame += [_BULK_STRING % (len(arg), arg) for arg in args]
+    return b"".join(frame)
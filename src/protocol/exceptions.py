@@ -9,3 +9,13 @@ class SpaceError(ParserError):
 
 class QuoteError(ParserError):
     pass
+
+#! validator errors
+class ValidatorError(core.RCError):
+    MSG_PREFIX = "Validator exception"
+
+class ArityError(ValidatorError):
+    pass
+
+class ArgumentError(ValidatorError):
+    pass
@@ -0,0 +1,123 @@
+"""
+Cache of the formatted text of outputs.
+
+Many replies are identical: `OK`, `QUEUED`, an empty sequence, or the same hash polled every second.
+The text an output is formatted into is cached by a key listing the elements of the output,
+and shared by the outputs decoded from identical replies.
+The least recently used texts are evicted once their size, in bytes, exceeds the capacity of the cache.
+
+The keys are listed by the formatter: they tell apart every output which is formatted differently,
+such as maps holding the same pairs in another order.
+The keys hold the values of the leaves, but the cache never keeps the outputs alive;
+both the keys and the formatted texts are accounted for in the size of the cache.
+"""
+import sys
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from threading import Lock
+
+import core
+
+# A formatted output, or a formatted window of an output along with its element count.
+Formatted = str | tuple[str, int]
+
+class FormatCache:
+    """
+    LRU cache of formatted outputs, bounded by the size of the keys and the formatted texts.
+    Shared by the formatting workers; every operation is thread-safe.
+
+    Attributes:
+        max_bytes (int): The capacity of the cache, in bytes; 0 disables the cache.
+        size (int): The bytes held by the keys and the cached texts.
+        hits (int): Lookups which found the formatted text.
+        misses (int): Lookups which formatted the text.
+        evictions (int): Texts evicted to make room for others.
+    """
+    __slots__ = ("max_bytes", "size", "hits", "misses", "evictions", "_entries", "_lock")
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[Hashable, Formatted] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Hashable, produce: Callable[[], Formatted]) -> Formatted:
+        """
+        Returns the cached text of a key, formatting it on a miss.
+
+        Args:
+            key (Hashable): The elements of the output, along with the arguments it is formatted with.
+            produce (lambda): Formats the text of the key.
+
+        Returns:
+            str | tuple: The formatted text, as returned by `produce()`.
+        """
+        if self.max_bytes < 1:
+            return produce()
+
+        with self._lock:
+            formatted = self._entries.get(key)
+            if formatted is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return formatted
+            self.misses += 1
+
+        formatted = produce()
+        self._put(key, formatted)
+        return formatted
+
+    def clear(self) -> None:
+        """
+        Drops every cached text, and resets the counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.size = self.hits = self.misses = self.evictions = 0
+
+    def _put(self, key: Hashable, formatted: Formatted) -> None:
+        """
+        Internal method.
+
+        Caches a formatted text, evicting the least recently used ones while the cache is full.
+        A text larger than the whole cache is never cached.
+        """
+        size = _size(key, formatted)
+        if size > self.max_bytes:
+            return
+
+        entries = self._entries
+        with self._lock:
+            # Another worker may have formatted the same key meanwhile.
+            if key in entries:
+                return
+            entries[key] = formatted
+            self.size += size
+            while self.size > self.max_bytes:
+                evicted_key, evicted = entries.popitem(last=False)
+                self.size -= _size(evicted_key, evicted)
+                self.evictions += 1
+
+def _size(key: Hashable, formatted: Formatted) -> int:
+    """
+    Internal method.
+
+    The values listed by a tuple key are accounted for, but not the types, which are shared.
+
+    Returns:
+        int: The bytes held by a key and its formatted text.
+    """
+    size = sys.getsizeof(key)
+    if isinstance(key, tuple):
+        size += sum(sys.getsizeof(part) for part in key if not isinstance(part, type))
+    if isinstance(formatted, str):
+        return size + sys.getsizeof(formatted)
+    return size + sys.getsizeof(formatted[0])
+
+format_cache: FormatCache = FormatCache(core.FORMAT_CACHE_BYTES)
+"""
+The cache of the outputs formatted by the application.
+"""
@@ -1,16 +1,26 @@
+import sys
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from itertools import chain, islice
+from typing import Any
+
 import core
 
-from .output import Output, OutputStr, OutputErr, OutputSeq, OutputMap, OutputAtt
+from .format_cache import format_cache
+from .output import Output, OutputStr, OutputErr, OutputInt, OutputDbl, OutputBool, OutputSeq, OutputVec, OutputMap, OutputAtt, \
+                     double_text
+from .tape import Tape, TapeView, TapeStr, TapeErr, TapeInt, TapeDbl, TapeBool, TapeSeq, TapeMap, TapeAtt
 
 def formatter(output: Output, prefix: str = core.EMPTY_STR) -> str:
     """
     Formats a decoded RESP Output object into a human-readable string.
 
     Entry point for traversal.
-    Dispatches aggregate types to their specific formatting methods.
+    The output is traversed with an explicit stack instead of recursive calls,
+    so the nesting depth of a response is only bounded by memory.
 
     Args:
-        output (obj): The Output object (Str, Err, Seq, Map, or Att) to format.
+        output (obj): The Output object (Str, Err, Int, Dbl, Bool, Seq, Vec, Map, or Att) to format.
         prefix (str): Optional indentation string. Defaults to empty string.
 
     Returns:
@@ -19,17 +29,128 @@ def formatter(output: Output, prefix: str = core.EMPTY_STR) -> str:
     Raises:
         AssertionError: If the output type is NOT one of the expected Output subclasses.
     """
-    # Strings (leaf nodes). No recursive calls are performed here.
-    if isinstance(output, (OutputStr, OutputErr)):
-        return _format_str(output.value, prefix)
-    
-    # Aggregate types. Potentially contain recursive calls.
-    if isinstance(output, OutputSeq):
-        return _format_seq(output, prefix)
-    if isinstance(output, OutputMap):
-        return _format_map(output, prefix)
-    assert isinstance(output, OutputAtt)
-    return _format_att(output, prefix)
+    return _cached(output, (prefix,), lambda: _format(output, prefix))
+
+def formatter_lines(output: Output, prefix: str = core.EMPTY_STR) -> Iterator[str]:
+    """
+    Formats a decoded RESP Output object lazily, line by line.
+
+    The output is formatted as the lines are consumed,
+    so only a bounded part of the formatted text is held at once,
+    regardless of the size of the output.
+
+    Args:
+        output (obj): The Output object to format.
+        prefix (str): Optional indentation string. Defaults to empty string.
+
+    Returns:
+        Iterator: The lines of the formatted output, NOT including LF.
+                  Joined by LF, they make up the result of `formatter()`.
+    """
+    pending = core.EMPTY_STR
+    for piece in _pieces(output, prefix):
+        lines = (pending + piece).split(_LF)
+        # The last line may continue in the next piece.
+        pending = lines.pop()
+        yield from lines
+    yield pending
+
+_CHUNK_SIZE: int = 1 << 16
+"""
+Internal constant.
+
+How many characters a chunk of `formatter_chunks()` is made of, by default.
+"""
+
+def formatter_chunks(output: Output,
+                     prefix: str = core.EMPTY_STR,
+                     chunk_size: int = _CHUNK_SIZE) -> Iterator[str]:
+    """
+    Formats a decoded RESP Output object lazily, in chunks of a fixed size.
+
+    Args:
+        output (obj): The Output object to format.
+        prefix (str): Optional indentation string. Defaults to empty string.
+        chunk_size (int): How many characters a chunk is made of; the last one may be shorter.
+
+    Returns:
+        Iterator: The chunks of the formatted output.
+                  Concatenated, they make up the result of `formatter()`.
+    """
+    pending = core.EMPTY_STR
+    for piece in _pieces(output, prefix):
+        pending += piece
+        start = 0
+        while len(pending) - start >= chunk_size:
+            yield pending[start : start + chunk_size]
+            start += chunk_size
+        pending = pending[start:]
+    if pending:
+        yield pending
+
+def formatter_window(output: Output,
+                     start: int,
+                     count: int,
+                     prefix: str = core.EMPTY_STR) -> tuple[str, int]:
+    """
+    Formats a window of the top-level elements of a decoded RESP Output object.
+
+    Only the elements within the window are traversed,
+    so a page of a huge reply is formatted as fast as a short reply.
+    The elements keep the numbering and the indentation they have in the whole formatted output;
+    the pairs of a map are numbered by their keys and values, as `1) 3) ...`.
+    Any other output, such as an attribute based one, is a single element.
+
+    Args:
+        output (obj): The Output object to format.
+        start (int): The index of the first element of the window; the pairs of a map are elements.
+        count (int): How many elements the window is made of, at most.
+        prefix (str): Optional indentation string. Defaults to empty string.
+
+    Returns:
+        str: The lines of the whole formatted output making up the elements of the window.
+        int: How many top-level elements the output is made of.
+
+    Raises:
+        ValueError: If the start or the count of the window is negative.
+    """
+    if start < 0 or count < 0:
+        raise ValueError(f"Invalid window ({start}, {count})")
+    return _cached(output, (start, count, prefix), lambda: _format_window(output, start, count, prefix))
+
+# The prefix of an element: either the whole prefix,
+# or the prefix of the enclosing aggregate along with the segment continuing it.
+# The first element of a sequence continues the prefix of the sequence itself;
+# copying the whole prefix at every nesting level would take quadratic time.
+Prefix = str | tuple["Prefix", str]
+
+_FLUSH_SIZE: int = 1024
+"""
+Internal constant.
+
+How many formatted fragments are held at once by the lazy formatters.
+"""
+
+_FLUSH: object = object()
+"""
+Internal constant.
+
+Yielded by a generator, instead of a nested generator, once the formatted fragments should be flushed.
+"""
+
+_CACHE_MAX_ELEMENTS: int = 1024
+"""
+Internal constant.
+
+How many elements an output may be made of, at most, nested ones included, to be looked up in the format cache.
+"""
+
+_CACHE_KEY_LEAVES: frozenset[type] = frozenset((OutputStr, OutputErr, OutputInt, OutputBool))
+"""
+Internal constant.
+
+The leaves listed by their values in the keys of the format cache; doubles are listed by their text.
+"""
 
 _PAIR_SIZE: int = 2
 """
@@ -73,6 +194,13 @@ Internal constant.
 Message displayed when formatting an empty map output.
 """
 
+_BOOL_TEXTS: tuple[str, str] = ("f", "t")
+"""
+Internal constant.
+
+The text of the false and true booleans, as they are encoded.
+"""
+
 _ATTR_HEADER: str = "Attributes:"
 """
 Internal constant.
@@ -87,156 +215,717 @@ Internal constant.
 Header text displayed before the payload section of an Attributed output.
 """
 
-def _is_first(prefix: str) -> bool:
+def _resolve(prefix: Prefix) -> str:
     """
     Internal method.
 
-    Checks if the given prefix is for the first item in an iterable.
+    Joins the segments of a prefix.
 
     Args:
-        prefix (str): The indentation string to prepend.
+        prefix (str | tuple): The prefix of an element.
 
     Returns:
-        bool: True if the prefix is for the first item, False otherwise.
+        str: The whole prefix.
     """
-    return prefix == core.EMPTY_STR or prefix.startswith(_FIRST_ITEM_PREFIX)
+    if isinstance(prefix, str):
+        return prefix
 
-def _set_prefix(prefix: str, idx: int) -> str:
+    segments = []
+    while not isinstance(prefix, str):
+        prefix, segment = prefix
+        segments.append(segment)
+    segments.append(prefix)
+    return core.EMPTY_STR.join(reversed(segments))
+
+def _traversal(output: Output, flush_size: int) -> tuple["_Traversal", Any]:
     """
     Internal method.
 
-    Constructs a numbered prefix string for list items.
+    Picks the traversal of an output.
 
     Args:
-        prefix (str): The existing indentation or parent prefix.
-        idx (int): The current item index to display.
+        output (obj): The Output object to format.
+        flush_size (int): How many formatted fragments may be held before they are flushed.
 
     Returns:
-        str: The formatted prefix string ending with a closing parenthesis and space.
+        tuple: The traversal, along with the root element it formats.
     """
-    return f"{prefix}{idx}) "
+    # Tape views are formatted straight from their tape, without building a view per element.
+    if isinstance(output, TapeView):
+        return _TapeTraversal(output.tape, flush_size), output.index
+    return _OutputTraversal(flush_size), output
 
-def _format_str(output: str, prefix: str) -> str:
+def _cached(output: Output, args: tuple, produce: Callable[[], Any]) -> Any:
     """
     Internal method.
 
-    Formats a simple string output by appending a newline.
+    Looks the formatted text of an output up in the format cache, formatting it on a miss.
 
     Args:
-        output (str): The string content to format.
-        prefix (str): The indentation string to prepend.
+        output (obj): The Output object to format.
+        args (tuple): The arguments the output is formatted with.
+        produce (lambda): Formats the output.
 
     Returns:
-        str: The indented string followed by newline.
+        str | tuple: The formatted text, as returned by `produce()`.
     """
-    if _is_first(prefix):
-        return prefix + output
-    return _LF + prefix + output
+    if format_cache.max_bytes > 0:
+        key = _cache_key(output, args)
+        if key is not None:
+            return format_cache.get(key, produce)
+    return produce()
 
-def _format_seq(output: OutputSeq, prefix: str) -> str:
+def _cache_key(output: Output, args: tuple) -> tuple | None:
     """
     Internal method.
 
-    Formats a sequence (Array/Set/Push) into a numbered list.
-    Handles empty sequences by returning a specific empty message.
+    Lists the elements of an output, along with the arguments it is formatted with, as a key of the format cache.
+
+    The aggregates are listed breadth-first, each with its type, its element count,
+    and the type and value of each of its leaves, or None in place of its nested aggregates.
+    Only the outputs formatted into the same text share a key:
+    the pairs of maps are listed in order, and doubles by their text, e.g. "-0" apart from "0".
+    The key holds the values of the leaves, but none of the outputs.
+    Leaves and empty aggregates, such as the shared outputs of `+OK`, are formatted faster than they are looked up;
+    large replies are seldom repeated, and a window of them is formatted faster than they are listed;
+    tape views are read straight from their tapes.
 
     Args:
-        output: The OutputSeq object containing the list of values.
-        prefix (str): The indentation string for the current level.
+        output (obj): The Output object to format.
+        args (tuple): The arguments the output is formatted with.
 
     Returns:
-        str: A multi-line string representing the numbered sequence.
-    """
-    values_len = len(output.values)
-    if values_len < 1:
-        return _format_str(_EMPTY_SEQ_MSG, prefix)
-    
-    # Handle the first element separately to apply the parent prefix.
-    first_value = output.values[0]
-    val_prefix = _set_prefix(prefix, 1)
-    formatted = formatter(first_value, val_prefix)
-
-    # Prepare indentation and iterate over subsequent elements.
-    indent_padding = _INDENT_CHAR * len(prefix)
-    
-    for idx in range(1, values_len):
-        value = output.values[idx]
-        display_idx = idx + core.STR_TRAVERSAL_STRIDE
-        val_prefix = _set_prefix(indent_padding, display_idx)
-        formatted += formatter(value, val_prefix)
-    
-    return formatted
-
-def _format_map(output: OutputMap, prefix: str) -> str:
+        tuple: The key of the output.
+        None: If the output is not looked up in the format cache.
+    """
+    if output.__class__ in _CACHE_KEY_LEAVES or output.__class__ is OutputDbl:
+        return None
+
+    parts = [args]
+    append = parts.append
+    budget = _CACHE_MAX_ELEMENTS
+    queue = [output]
+    # The queue grows while it is iterated.
+    for item in queue:
+        item_type = item.__class__
+        if item_type is OutputSeq or item_type is OutputVec:
+            size = len(item.values)
+        elif item_type is OutputMap:
+            size = len(item.values) * _PAIR_SIZE
+        elif item_type is OutputAtt:
+            size = len(item.attributes.values) * _PAIR_SIZE + 1
+        else:
+            # Tape views.
+            return None
+        budget -= size
+        if budget < 0 or (size < 1 and item is output):
+            return None
+
+        append(item_type)
+        if item_type is OutputVec:
+            append(item.values.typecode)
+            append(item.values.tobytes())
+            continue
+        append(size)
+        if item_type is OutputSeq:
+            elements = item.values
+        elif item_type is OutputMap:
+            elements = chain.from_iterable(item.values.items())
+        else:
+            elements = chain(chain.from_iterable(item.attributes.values.items()), (item.payload,))
+        for element in elements:
+            element_type = element.__class__
+            if element_type in _CACHE_KEY_LEAVES:
+                append(element_type)
+                append(element.value)
+            elif element_type is OutputDbl:
+                append(element_type)
+                append(_double_text(element))
+            else:
+                append(None)
+                queue.append(element)
+    return tuple(parts)
+
+def _format(output: Output, prefix: str) -> str:
+    """
+    Internal method.
+
+    Formats an output, without the format cache.
+    """
+    traversal, root = _traversal(output, sys.maxsize)
+    return traversal.run(root, prefix)
+
+def _format_window(output: Output, start: int, count: int, prefix: str) -> tuple[str, int]:
+    """
+    Internal method.
+
+    Formats a window of an output, without the format cache.
+    """
+    traversal, root = _traversal(output, sys.maxsize)
+    return traversal.window(root, prefix, start, start + count)
+
+def _pieces(output: Output, prefix: str) -> Iterator[str]:
+    """
+    Internal method.
+
+    Formats an output lazily, in pieces of about `_FLUSH_SIZE` fragments.
+    """
+    traversal, root = _traversal(output, _FLUSH_SIZE)
+    return traversal.stream(root, prefix)
+
+def _number_text(value: int | bool) -> str:
     """
     Internal method.
 
-    Formats a Map into a flattened key-value list structure.
-    Iterates through dictionary items and presents them as sequential numbered entries.
+    Formats an integer or a boolean.
 
     Args:
-        output: The OutputMap object containing key-value pairs.
-        prefix (str): The indentation string for the current level.
+        value (int | bool): The value to format.
 
     Returns:
-        str: A multi-line string representing the flattened map.
+        str: The formatted value.
     """
-    values_len = len(output.values)
-    if values_len < 1:
-        return _format_str(_EMPTY_MAP_MSG, prefix)
+    if value.__class__ is bool:
+        return _BOOL_TEXTS[value]
+    return repr(value)
 
-    formatted = core.EMPTY_STR
-    # Indentation for all pairs except the first one.
-    indent_padding = _INDENT_CHAR * len(prefix)
+def _double_text(output: OutputDbl) -> str:
+    """
+    Internal method.
 
-    for idx, (key, val) in enumerate(output.values.items()):
-        # Determine prefix for the Key:
-        # If it's the very first key (idx == 0), use the parent 'prefix'.
-        # Otherwise, use the calculated indentation padding.
-        key_prefix = prefix if idx == 0 else indent_padding
-        display_idx = idx * _PAIR_SIZE
+    Formats a double as it was sent by the server.
 
-        # Format Key.
-        display_idx += core.STR_TRAVERSAL_STRIDE
-        key_prefix = _set_prefix(key_prefix, display_idx)
-        formatted += formatter(key, key_prefix)
+    Args:
+        output (obj): The double to format.
+
+    Returns:
+        str: The formatted value.
+    """
+    text = output.text
+    if text is None:
+        return double_text(output.value)
+    return text
 
-        # Format Value.
-        display_idx += core.STR_TRAVERSAL_STRIDE
-        val_prefix = _set_prefix(indent_padding, display_idx)
-        formatted += formatter(val, val_prefix)
+def _vec_text(values: Sequence[int | float]) -> Callable[[int | float], str]:
+    """
+    Internal method.
 
-    return formatted
+    Returns:
+        lambda: Formats the numbers of a packed sequence; `repr` for integers, `double_text` for doubles.
+    """
+    if values and values[0].__class__ is float:
+        return double_text
+    return repr
 
-def _format_att(output: OutputAtt, prefix: str) -> str:
+def _is_first(prefix: str) -> bool:
     """
     Internal method.
 
-    Formats an attribute based output.
-    It is formed out of an attribute map and a payload,
-    which can be any output type.
+    Checks if the given prefix is for the first item in an iterable.
 
     Args:
-        output: The OutputAtt object containing attributes and payload.
-        prefix (str): The indentation string for the current level.
+        prefix (str): The indentation string to prepend.
 
     Returns:
-        str: A multi-line string separating attributes and payload with headers.
+        bool: True if the prefix is for the first item, False otherwise.
+    """
+    return prefix == core.EMPTY_STR or prefix.startswith(_FIRST_ITEM_PREFIX)
+
+class _Traversal(ABC):
     """
-    # Ignore empty attribute maps.
-    if len(output.attributes.values) < 1:
-        return formatter(output.payload, prefix)
+    Internal helper class.
 
-    indent_padding = _INDENT_CHAR * len(prefix)
-    optional_lf = core.EMPTY_STR
-    if _is_first(indent_padding):
-        optional_lf = _LF
+    Formats an element and all of its nested elements, in order, without recursive calls.
 
-    formatted = _format_str(_ATTR_HEADER, indent_padding)
-    formatted += optional_lf + _format_map(output.attributes, indent_padding)
+    Every non-empty aggregate is expanded into a generator, which writes the leaves among its elements,
+    and yields the generators of its nested aggregates.
+    Aggregates without nested aggregates are written at once, without a generator.
+    The generator on top of the stack is resumed until it is exhausted;
+    a nested generator is pushed, so the elements are written in order.
+    The formatted text is collected in chunks, joined once at the end.
 
-    formatted += optional_lf + _format_str(_PAYLOAD_HEADER, indent_padding)
-    # All of the above strings are considered additional.
-    # It should not use the actual prefix.
-    formatted += optional_lf + formatter(output.payload, prefix)
-    return formatted
+    Once `flush_size` chunks are pending, the generators pause, so that the chunks can be flushed.
+    Only the aggregates smaller than that are written at once.
+
+    Attributes:
+        chunks (list): The formatted chunks.
+        paddings (dict): The indentation strings built so far, by their width.
+        flush_size (int): How many chunks may be pending before they are flushed.
+    """
+    __slots__ = ("chunks", "paddings", "flush_size")
+
+    def __init__(self, flush_size: int) -> None:
+        self.chunks: list[str] = []
+        self.paddings: dict[int, str] = {}
+        self.flush_size = flush_size
+
+    def run(self, root: Any, prefix: str) -> str:
+        """
+        Formats an element.
+
+        Args:
+            root (Any): The element to format.
+            prefix (str): The prefix of the element.
+
+        Returns:
+            str: The formatted element.
+        """
+        for _ in self._steps(root, prefix):
+            pass
+        return core.EMPTY_STR.join(self.chunks)
+
+    def stream(self, root: Any, prefix: str) -> Iterator[str]:
+        """
+        Formats an element lazily.
+
+        Args:
+            root (Any): The element to format.
+            prefix (str): The prefix of the element.
+
+        Returns:
+            Iterator: The pieces of the formatted element, as they are flushed.
+        """
+        for _ in self._steps(root, prefix):
+            yield core.EMPTY_STR.join(self.chunks)
+            self.chunks.clear()
+        if self.chunks:
+            yield core.EMPTY_STR.join(self.chunks)
+            self.chunks.clear()
+
+    def window(self, root: Any, prefix: str, start: int, stop: int) -> tuple[str, int]:
+        """
+        Formats the top-level elements of an element within a window.
+
+        Args:
+            root (Any): The element to format.
+            prefix (str): The prefix of the element.
+            start (int): The index of the first element of the window.
+            stop (int): The index past the last element of the window.
+
+        Returns:
+            str: The formatted elements of the window.
+            int: How many top-level elements the element is made of.
+        """
+        expanded, total = self.expand_window(root, prefix, start, stop)
+        for _ in self._drive(expanded, prefix):
+            pass
+        text = core.EMPTY_STR.join(self.chunks)
+        # Past the first element, the window starts on a new line of the whole output.
+        if start > 0:
+            text = text.removeprefix(_LF)
+        return text, total
+
+    def _steps(self, root: Any, prefix: str) -> Iterator[None]:
+        """
+        Internal method.
+
+        Drives the generators of an element.
+        """
+        yield from self._drive(self.expand(root, prefix), prefix)
+
+    def _drive(self, expanded: str | Iterator | None, prefix: str) -> Iterator[None]:
+        """
+        Internal method.
+
+        Drives the generators, pausing whenever the pending chunks should be flushed.
+        """
+        if isinstance(expanded, str):
+            self._write(expanded, prefix)
+        elif expanded is not None:
+            stack: list[Iterator] = [expanded]
+            while stack:
+                nested = next(stack[-1], None)
+                if nested is None:
+                    stack.pop()
+                elif nested is _FLUSH:
+                    yield None
+                else:
+                    stack.append(nested)
+
+    @abstractmethod
+    def expand(self, item: Any, prefix: Prefix) -> str | Iterator | None:
+        """
+        Dispatches an element based on its type.
+
+        Args:
+            item (Any): The element to expand.
+            prefix (str | tuple): The prefix of the element.
+
+        Returns:
+            str: The text of a leaf, or the message of an empty aggregate.
+            Iterator: The generator formatting the rest of the elements of an aggregate.
+            None: If the elements of an aggregate were all written at once.
+        """
+
+    def expand_window(self, item: Any, prefix: str, start: int, stop: int) -> tuple[str | Iterator | None, int]:
+        """
+        Dispatches the top-level elements of an element within a window.
+        Elements other than non-empty sequences and maps are made of a single top-level element.
+
+        Args:
+            item (Any): The element to expand.
+            prefix (str): The prefix of the element.
+            start (int): The index of the first element of the window.
+            stop (int): The index past the last element of the window.
+
+        Returns:
+            str | Iterator | None: The expanded window, as returned by `expand()`.
+            int: How many top-level elements the element is made of.
+        """
+        if start > 0 or stop < 1:
+            return None, 1
+        return self.expand(item, prefix), 1
+
+    @abstractmethod
+    def leaf(self, item: Any) -> str | None:
+        """
+        Formats an element, if it is a leaf.
+
+        Args:
+            item (Any): The element to format.
+
+        Returns:
+            str: The text of a leaf.
+            None: If the element is an aggregate.
+        """
+
+    def _write(self, output: str, prefix: Prefix) -> None:
+        """
+        Internal method.
+
+        Formats a simple string output, on a new line unless it is the first item.
+        """
+        prefix = _resolve(prefix)
+        if not _is_first(prefix):
+            self.chunks.append(_LF)
+        self.chunks.append(prefix)
+        self.chunks.append(output)
+
+    def _padding(self, prefix: Prefix) -> str:
+        """
+        Internal method.
+
+        Returns the indentation aligning the elements of an aggregate with its prefix.
+        The aggregates at the same depth share the same indentation string;
+        it is only kept while formatting, as deep outputs have as many of them as levels.
+        """
+        width = len(_resolve(prefix))
+        padding = self.paddings.get(width)
+        if padding is None:
+            padding = self.paddings[width] = _INDENT_CHAR * width
+        return padding
+
+    def _seq(self, values: Sequence, prefix: Prefix) -> str | Iterator | None:
+        """
+        Internal method.
+
+        Formats a sequence (Array/Set/Push) into a numbered list.
+        Handles empty sequences by returning a specific empty message.
+
+        The leaves are written at once, up to the first nested aggregate;
+        sequences of leaves, such as member-score pairs, never need a generator.
+        Nested aggregates are only expanded by the generator, so the nesting depth never recurses.
+        """
+        if len(values) < 1:
+            return _EMPTY_SEQ_MSG
+
+        # Handle the first element separately to apply the parent prefix.
+        leaf = self.leaf
+        elements = iter(values)
+        value = next(elements)
+        text = leaf(value)
+        # Large sequences are written by the generator, so that they can be flushed along the way.
+        if text is None or len(values) >= self.flush_size:
+            return self._seq_elements(value, elements, core.STR_TRAVERSAL_STRIDE, prefix)
+        self._write(text, (prefix, _FIRST_ITEM_PREFIX))
+        if len(values) < _PAIR_SIZE:
+            return None
+
+        # Prepare indentation and iterate over subsequent elements.
+        # They are never first items, so they always start on a new line.
+        chunks = self.chunks
+        indent_padding = self._padding(prefix)
+        for display_idx, value in enumerate(elements, _PAIR_SIZE):
+            text = leaf(value)
+            if text is None:
+                return self._seq_elements(value, elements, display_idx, prefix)
+            chunks.append(f"{_LF}{indent_padding}{display_idx}) {text}")
+        return None
+
+    def _seq_window(self, values: Sequence, start: int, stop: int, prefix: Prefix) -> Iterator | None:
+        """
+        Internal method.
+
+        Formats the elements of a non-empty sequence within a window.
+        """
+        window = values[start:stop]
+        if len(window) < 1:
+            return None
+        elements = iter(window)
+        return self._seq_elements(next(elements), elements, start + 1, prefix)
+
+    def _seq_elements(self, value: Any, elements: Iterator, start: int, prefix: Prefix) -> Iterator:
+        """
+        Internal method.
+
+        Formats the rest of a sequence, starting with the nested aggregate which interrupted `_seq()`.
+        """
+        expand, chunks, flush_size = self.expand, self.chunks, self.flush_size
+        indent_padding = None
+        for display_idx, value in enumerate(chain((value,), elements), start):
+            if len(chunks) >= flush_size:
+                yield _FLUSH
+            if display_idx == core.STR_TRAVERSAL_STRIDE:
+                val_prefix = (prefix, _FIRST_ITEM_PREFIX)
+                expanded = expand(value, val_prefix)
+                if isinstance(expanded, str):
+                    self._write(expanded, val_prefix)
+                    continue
+            else:
+                # A single element sequence needs no indentation;
+                # resolving the prefix of every level of a deep chain would take quadratic time.
+                if indent_padding is None:
+                    indent_padding = self._padding(prefix)
+                val_prefix = f"{indent_padding}{display_idx}) "
+                expanded = expand(value, val_prefix)
+                if isinstance(expanded, str):
+                    chunks.append(f"{_LF}{val_prefix}{expanded}")
+                    continue
+            if expanded is not None:
+                yield expanded
+
+    def _vec(self, values: Sequence[int | float], prefix: Prefix) -> Iterator | None:
+        """
+        Internal method.
+
+        Formats a packed sequence of numbers, all at once.
+        Large sequences are written by a generator, in batches of `flush_size` numbers.
+        """
+        if len(values) >= self.flush_size:
+            return self._vec_elements(values, 0, len(values), prefix)
+        texts = map(_vec_text(values), values)
+        self._write(next(texts), (prefix, _FIRST_ITEM_PREFIX))
+        indent_padding = self._padding(prefix)
+        self.chunks.extend(f"{_LF}{indent_padding}{display_idx}) {text}"
+                           for display_idx, text in enumerate(texts, _PAIR_SIZE))
+        return None
+
+    def _vec_elements(self, values: Sequence[int | float], start: int, stop: int, prefix: Prefix) -> Iterator:
+        """
+        Internal method.
+
+        Formats the numbers of a packed sequence from `start` up to `stop`, in batches.
+        """
+        to_text = _vec_text(values)
+        if start == 0 and stop > 0:
+            self._write(to_text(values[0]), (prefix, _FIRST_ITEM_PREFIX))
+            start = core.STR_TRAVERSAL_STRIDE
+        indent_padding = self._padding(prefix)
+        for batch_start in range(start, min(stop, len(values)), self.flush_size):
+            batch = values[batch_start : min(batch_start + self.flush_size, stop)]
+            self.chunks.extend(f"{_LF}{indent_padding}{display_idx}) {text}"
+                               for display_idx, text in enumerate(map(to_text, batch), batch_start + 1))
+            yield _FLUSH
+
+    def _map(self, pairs: Iterable[tuple], pairs_len: int, prefix: Prefix) -> str | Iterator | None:
+        """
+        Internal method.
+
+        Formats a Map into a flattened key-value list structure.
+        Handles empty maps by returning a specific empty message.
+        """
+        if pairs_len < 1:
+            return _EMPTY_MAP_MSG
+        return self._map_elements(pairs, prefix)
+
+    def _map_elements(self, pairs: Iterable[tuple], prefix: Prefix, start: int = 0) -> Iterator:
+        """
+        Internal method.
+
+        Formats the pairs of a non-empty map, as sequential numbered entries.
+        A window of the pairs is numbered from the index of its first pair, `start`.
+        """
+        expand, chunks, flush_size = self.expand, self.chunks, self.flush_size
+        # Indentation for all pairs except the first one.
+        indent_padding = self._padding(prefix)
+
+        for idx, (key, val) in enumerate(pairs, start):
+            if len(chunks) >= flush_size:
+                yield _FLUSH
+            display_idx = idx * _PAIR_SIZE + core.STR_TRAVERSAL_STRIDE
+
+            # Determine prefix for the Key:
+            # If it's the very first key (idx == 0), continue the parent 'prefix'.
+            # Otherwise, use the calculated indentation padding.
+            if idx == 0:
+                key_prefix = (prefix, _FIRST_ITEM_PREFIX)
+                expanded = expand(key, key_prefix)
+                if isinstance(expanded, str):
+                    self._write(expanded, key_prefix)
+                elif expanded is not None:
+                    yield expanded
+            else:
+                key_prefix = f"{indent_padding}{display_idx}) "
+                expanded = expand(key, key_prefix)
+                if isinstance(expanded, str):
+                    chunks.append(f"{_LF}{key_prefix}{expanded}")
+                elif expanded is not None:
+                    yield expanded
+
+            val_prefix = f"{indent_padding}{display_idx + core.STR_TRAVERSAL_STRIDE}) "
+            expanded = expand(val, val_prefix)
+            if isinstance(expanded, str):
+                chunks.append(f"{_LF}{val_prefix}{expanded}")
+            elif expanded is not None:
+                yield expanded
+
+    def _att(self, pairs: Iterable[tuple], pairs_len: int, payload: Any, prefix: Prefix) -> str | Iterator | None:
+        """
+        Internal method.
+
+        Formats an attribute based output.
+        It is formed out of an attribute map and a payload,
+        which can be any output type.
+        """
+        # Ignore empty attribute maps.
+        if pairs_len < 1:
+            return self._payload(payload, prefix)
+        return self._att_elements(pairs, payload, prefix)
+
+    def _att_elements(self, pairs: Iterable[tuple], payload: Any, prefix: Prefix) -> Iterator:
+        """
+        Internal method.
+
+        Formats the headers, the attributes and the payload of an attribute based output.
+        """
+        indent_padding = self._padding(prefix)
+        optional_lf = core.EMPTY_STR
+        if _is_first(indent_padding):
+            optional_lf = _LF
+
+        self._write(_ATTR_HEADER, indent_padding)
+        self.chunks.append(optional_lf)
+        yield from self._map_elements(pairs, indent_padding)
+
+        self.chunks.append(optional_lf)
+        self._write(_PAYLOAD_HEADER, indent_padding)
+        self.chunks.append(optional_lf)
+        # All of the above strings are considered additional.
+        # It should not use the actual prefix.
+        yield from self._payload(payload, prefix)
+
+    def _payload(self, payload: Any, prefix: Prefix) -> Iterator:
+        """
+        Internal method.
+
+        Formats the payload of an attribute based output.
+        It is only expanded by the generator, so nested attributes never recurse.
+        """
+        expanded = self.expand(payload, prefix)
+        if isinstance(expanded, str):
+            self._write(expanded, prefix)
+        elif expanded is not None:
+            yield expanded
+
+class _OutputTraversal(_Traversal):
+    """
+    Internal helper class.
+
+    Formats a tree of Output objects.
+    """
+    __slots__ = ()
+
+    def leaf(self, item: Output) -> str | None:
+        # Strings (leaf nodes).
+        if isinstance(item, (OutputStr, OutputErr)):
+            return item.value
+        if isinstance(item, (OutputInt, OutputBool)):
+            return _number_text(item.value)
+        if isinstance(item, OutputDbl):
+            return _double_text(item)
+        return None
+
+    def expand(self, item: Output, prefix: Prefix) -> str | Iterator | None:
+        text = self.leaf(item)
+        if text is not None:
+            return text
+
+        if isinstance(item, OutputSeq):
+            return self._seq(item.values, prefix)
+        if isinstance(item, OutputVec):
+            return self._vec(item.values, prefix)
+        if isinstance(item, OutputMap):
+            values = item.values
+            return self._map(values.items(), len(values), prefix)
+        assert isinstance(item, OutputAtt)
+        attributes = item.attributes.values
+        return self._att(attributes.items(), len(attributes), item.payload, prefix)
+
+    def expand_window(self, item: Output, prefix: str, start: int, stop: int) -> tuple[str | Iterator | None, int]:
+        if isinstance(item, (OutputSeq, OutputVec, OutputMap)) and len(item.values) > 0:
+            values = item.values
+            if isinstance(item, OutputSeq):
+                return self._seq_window(values, start, stop, prefix), len(values)
+            if isinstance(item, OutputVec):
+                return self._vec_elements(values, start, stop, prefix), len(values)
+            return self._map_elements(islice(values.items(), start, stop), prefix, start), len(values)
+        return super().expand_window(item, prefix, start, stop)
+
+class _TapeTraversal(_Traversal):
+    """
+    Internal helper class.
+
+    Formats the entries of a tape, reading the elements straight from the tape.
+
+    Attributes:
+        tape (obj): The tape holding the entries.
+    """
+    __slots__ = ("tape", "_view_type", "_text")
+
+    def __init__(self, tape: Tape, flush_size: int) -> None:
+        super().__init__(flush_size)
+        self.tape = tape
+        # Looked up once per element; bound once per traversal.
+        self._view_type = tape.view_type
+        self._text = tape.text
+
+    def leaf(self, item: int) -> str | None:
+        view_type = self._view_type(item)
+        # Doubles are displayed as sent by the server.
+        if view_type is TapeStr or view_type is TapeDbl or view_type is TapeErr:
+            return self._text(item)
+        if view_type is TapeInt or view_type is TapeBool:
+            return _number_text(self.tape.value(item))
+        return None
+
+    def expand(self, item: int, prefix: Prefix) -> str | Iterator | None:
+        view_type = self._view_type(item)
+        if view_type is TapeSeq:
+            return self._seq(self.tape.children(item), prefix)
+        if view_type is not TapeMap and view_type is not TapeAtt:
+            return self.leaf(item)
+
+        # A repeated key is formatted once, as the `Decoder` keeps it.
+        children = self.tape.pairs(item)
+        pairs_len = len(children) // _PAIR_SIZE
+        pairs = zip(children[0::_PAIR_SIZE], children[1::_PAIR_SIZE])
+        if view_type is TapeMap:
+            return self._map(pairs, pairs_len, prefix)
+        # The payload of an attribute entry follows its pairs.
+        return self._att(pairs, pairs_len, self.tape.children(item)[-1], prefix)
+
+    def expand_window(self, item: int, prefix: str, start: int, stop: int) -> tuple[str | Iterator | None, int]:
+        tape = self.tape
+        view_type = tape.view_type(item)
+        if view_type is TapeSeq:
+            children = tape.children(item)
+            if len(children) > 0:
+                return self._seq_window(children, start, stop, prefix), len(children)
+        elif view_type is TapeMap:
+            children = tape.pairs(item)
+            pairs_len = len(children) // _PAIR_SIZE
+            if pairs_len > 0:
+                keys = children[start * _PAIR_SIZE : stop * _PAIR_SIZE : _PAIR_SIZE]
+                vals = children[start * _PAIR_SIZE + 1 : stop * _PAIR_SIZE : _PAIR_SIZE]
+                return self._map_elements(zip(keys, vals), prefix, start), pairs_len
+        return super().expand_window(item, prefix, start, stop)
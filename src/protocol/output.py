@@ -5,13 +5,16 @@ These classes provide a structured representation of data returned by the Redis
 They allow recursive nesting to capture arrays, sets, and maps, preserving the hierarchical
 nature of the responses.
 
-OutputType = str | list[OutputType] | dict[OutputType, OutputType] | OutputType, OutputType
+OutputType = str | int | float | bool | array | list[OutputType] | dict[OutputType, OutputType] | OutputType, OutputType
 """
 
+from array import array
 from dataclasses import dataclass
 from frozendict import frozendict
 from typing import Callable
 
+import core
+
 class Output:
     """
     Base class for all decoded Redis output types.
@@ -19,7 +22,11 @@ class Output:
     Acts as a common ancestor for all RESP3 decoded values.
 
     Note: The stored data is immutable.
+    A reply may be made of millions of outputs;
+    none of them carries a per-instance `__dict__`.
     """
+    __slots__ = ()
+
     _callback: Callable | None = None
 
     def __str__(self) -> str:
@@ -28,38 +35,182 @@ class Output:
             Output._callback = formatter
         return Output._callback(self)
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OutputStr(Output):
     """
     Represents a simple string or scalar value returned by Redis.
     """
     value: str
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OutputErr(Output):
     """
     Represents a RESP error (simple or bulk).
     """
     value: str
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
+class OutputInt(Output):
+    """
+    Represents an integer or a big number returned by Redis.
+    """
+    value: int
+
+@dataclass(frozen=True, slots=True)
+class OutputDbl(Output):
+    """
+    Represents a double returned by Redis, including infinities and NaN.
+
+    The text of the double is kept only if `double_text()` does not reproduce it,
+    e.g. "0.10000000000000001"; it is displayed as sent by the server.
+    """
+    value: float
+    text: str | None = None
+
+@dataclass(frozen=True, slots=True)
+class OutputBool(Output):
+    """
+    Represents a boolean returned by Redis.
+    """
+    value: bool
+
+@dataclass(frozen=True, slots=True)
 class OutputSeq(Output):
     """
     Represents a list-like collection of Redis outputs (arrays, sets, or pushes).
     """
     values: tuple[Output, ...]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OutputMap(Output):
     """
     Represents a key-value mapping of Redis outputs.
     """
     values: frozendict[Output, Output]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OutputAtt(Output):
     """
     Represents a value decorated with attributes.
     """
     attributes: OutputMap
     payload: Output
+
+@dataclass(frozen=True, slots=True)
+class OutputVec(Output):
+    """
+    Represents a list-like collection of Redis outputs which are all integers, or all doubles.
+
+    The numbers are packed into a typed array ('q' or 'd'), instead of one output per element.
+    Arrays are not hashable; packed sequences are compared and hashed by their type codes and bytes,
+    so that they may be the keys of maps.
+    """
+    values: array
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, OutputVec):
+            return self.values.typecode == other.values.typecode and self.values.tobytes() == other.values.tobytes()
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((self.values.typecode, self.values.tobytes()))
+
+_INT_CODE: str = "q"
+"""
+Internal constant.
+
+The array type code of packed integers.
+"""
+
+_DBL_CODE: str = "d"
+"""
+Internal constant.
+
+The array type code of packed doubles.
+"""
+
+_DBL_SUFFIX: str = ".0"
+"""
+Internal constant.
+
+The suffix Python adds to integral doubles, which Redis does not send.
+"""
+
+def integer(content: bytes) -> OutputInt | OutputStr:
+    """
+    Builds the output of an integer or a big number out of its content.
+
+    Example: b"-12" returns OutputInt(-12).
+
+    Args:
+        content (bytes): The number, as sent by the server.
+
+    Returns:
+        OutputInt: The number.
+        OutputStr: The text of a big number with more digits than `int()` converts,
+                   as displayed by the previous releases.
+    """
+    try:
+        return OutputInt(int(content))
+    except ValueError:
+        return OutputStr(content.decode(core.UTF8_ENC))
+
+def double_text(value: float) -> str:
+    """
+    Formats a double in its shortest round-trip form, as Redis sends it.
+
+    Example: 1.5 returns "1.5"; 10.0 returns "10"; -inf returns "-inf".
+
+    Args:
+        value (float): The double to format.
+
+    Returns:
+        str: The text of the double.
+    """
+    text = repr(value)
+    if text.endswith(_DBL_SUFFIX):
+        return text[:-len(_DBL_SUFFIX)]
+    return text
+
+def double(text: str) -> OutputDbl:
+    """
+    Builds the output of a double out of its text.
+
+    Args:
+        text (str): The double, as sent by the server.
+
+    Returns:
+        OutputDbl: The double, along with its text unless `double_text()` reproduces it.
+    """
+    value = float(text)
+    if double_text(value) == text:
+        return OutputDbl(value)
+    return OutputDbl(value, text)
+
+def sequence(values: list[Output]) -> OutputSeq | OutputVec:
+    """
+    Builds the output of an array, set or push out of its elements.
+
+    Args:
+        values (list): The elements, in order.
+
+    Returns:
+        OutputVec: If the elements are all integers fitting 64 bits, or all doubles without a kept text.
+        OutputSeq: Otherwise.
+    """
+    if values:
+        value_type = type(values[0])
+        if value_type is OutputInt:
+            packed = all(type(value) is OutputInt for value in values)
+        else:
+            # A packed double is displayed by `double_text()`; the kept texts would be lost.
+            packed = value_type is OutputDbl and all(type(value) is OutputDbl and value.text is None
+                                                     for value in values)
+        if packed:
+            code = _INT_CODE if value_type is OutputInt else _DBL_CODE
+            try:
+                return OutputVec(array(code, [value.value for value in values]))
+            except OverflowError:
+                # Big numbers do not fit 64 bits.
+                pass
+    return OutputSeq(tuple(values))
@@ -1,6 +1,10 @@
+import re
+from frozendict import frozendict
+
 import core
 
 from .constants_resp import SPACE, QUOTE_DOUBLE, QUOTE_SINGLE, QUOTE_TYPE
+from .encoder import encoder
 from .exceptions import QuoteError, SpaceError
 
 _MIN_CMD_LEN: int = 3
@@ -8,6 +12,16 @@ _MIN_CMD_LEN: int = 3
 Minimum length of a valid input string.
 """
 
+_SPACE_BYTE: bytes = SPACE.encode(core.ASCII_ENC)
+"""
+The encoded argument separator.
+"""
+
+_SPACES: re.Pattern = re.compile(f"{re.escape(SPACE)}*")
+"""
+Matches a run of spaces, possibly empty.
+"""
+
 def parser(input: str) -> tuple[str, list[str]]:
     """
     Parses the input string into a list of tokens.
@@ -30,9 +44,7 @@ def parser(input: str) -> tuple[str, list[str]]:
         raise ValueError("The input string must contain at least one (supported) command")
     
     # Skip first idx spaces.
-    idx = 0
-    while idx < input_len and input[idx] == SPACE:
-        idx += core.STR_TRAVERSAL_STRIDE
+    idx = _SPACES.match(input).end()
     
     space_idx = input.find(SPACE, idx)
     
@@ -48,12 +60,44 @@ def parser(input: str) -> tuple[str, list[str]]:
     parser = _ArgumentParser(input, space_idx + 1)
     return cmd, parser.argv
 
+def parse_encode(input: str) -> bytes:
+    """
+    Parses the input string and encodes it into a RESP frame, without building the arguments list.
+
+    Most inputs have no quotes; their arguments are only separated by spaces.
+    Such an input is encoded at once and split into its arguments as bytes,
+    which are written straight into the frame.
+    Any other input takes the regular path, through `parser()` and `encoder()`.
+
+    Args:
+        input (str): The raw input command string from the user.
+
+    Returns:
+        bytes: The entire encoded command and arguments.
+
+    Raises:
+        ValueError: If the input is empty.
+        ParseError: In case of parsing errors related to either argument separators or quoting.
+    """
+    if len(input) < _MIN_CMD_LEN or QUOTE_DOUBLE in input or QUOTE_SINGLE in input:
+        cmd, argv = parser(input)
+        return encoder(cmd, argv)
+
+    tokens = [token for token in input.encode(core.UTF8_ENC).split(_SPACE_BYTE) if token]
+    # An input made only of spaces is parsed as an empty command.
+    if not tokens:
+        return encoder(core.EMPTY_STR, [])
+    return encoder(tokens[0], tokens[1:])
+
 class _ArgumentParser:
     """
     Internal helper class.
 
     Parses raw input strings into structured command and argument components,
     managing state traversal internally.
+
+    The input is scanned in runs: each argument is matched and sliced as a whole,
+    and only the escape sequences of quoted arguments are handled one by one.
     """
     
     _ESCAPE_CHAR: str = "\\"
@@ -61,6 +105,23 @@ class _ArgumentParser:
     Character used for escaping.
     """
 
+    # This is a class-level field shared by all instances;
+    # It is initialized exactly once after the class is defined.
+    _QUOTED_BODY: frozendict[str, re.Pattern]
+    """
+    Internal constant.
+
+    Maps a quote character to the pattern of the body of an argument inside its quotes:
+    runs of regular characters and escape sequences (a "\\" byte followed by any character).
+    """
+
+    _ESCAPE_SEQ: re.Pattern = re.compile(f"{re.escape(_ESCAPE_CHAR)}(.)", re.DOTALL)
+    """
+    Internal constant.
+
+    Matches an escape sequence, capturing the escaped character.
+    """
+
     def __init__(self, input: str, start_idx: int) -> None:
         self._input = input
         self._input_len = len(input)
@@ -98,8 +159,7 @@ class _ArgumentParser:
         
         Advances the internal index past any sequence of spaces.
         """
-        while self._idx < self._input_len and self._input[self._idx] == SPACE:
-            self._idx += core.STR_TRAVERSAL_STRIDE
+        self._idx = _SPACES.match(self._input, self._idx).end()
 
     def _traverse_arg(self) -> str:
         """
@@ -125,6 +185,7 @@ class _ArgumentParser:
         Internal method.
         
         Parses a quoted argument, handling escape sequences.
+        The whole argument is matched at once; only its escape sequences are visited one by one.
         
         Args:
             QUOTE (str): The specific quote character (single or double) starting the sequence.
@@ -135,32 +196,22 @@ class _ArgumentParser:
         Raises:
             QuoteError: If a second quote of the same type as the starting one was NOT found.
         """
-        arg = core.EMPTY_STR
-        while self._idx < self._input_len:
-            char = self._input[self._idx]
-
-            # Found the second quote, of the same type as the starting one.
-            if char == QUOTE:
-                self._idx += core.STR_TRAVERSAL_STRIDE
-                return arg
-
-            if char != _ArgumentParser._ESCAPE_CHAR:
-                arg += char; self._idx += core.STR_TRAVERSAL_STRIDE; continue
-            
-            if self._idx + core.STR_TRAVERSAL_STRIDE == self._input_len:
-                arg += char; self._idx += core.STR_TRAVERSAL_STRIDE; continue
-            
-            # If the "\\" byte was encountered check if the next character can escape.
-            next_char = self._input[self._idx + core.STR_TRAVERSAL_STRIDE]
-            escaped = QUOTE_TYPE[QUOTE].get(next_char)
-            if escaped is not None:
-                arg += escaped
-            else:
-                arg += (char + next_char)
-            self._idx += 2 * core.STR_TRAVERSAL_STRIDE
-        
-       # Raised if an argument like "abc' is provided.
-        raise QuoteError("Argument was not ended with a (correct) quote")
+        end_idx = _ArgumentParser._QUOTED_BODY[QUOTE].match(self._input, self._idx).end()
+        # The body stops before the closing quote,
+        # or before a "\\" byte ending the input, which can not escape anything.
+        # Raised if an argument like "abc' is provided.
+        if end_idx == self._input_len or self._input[end_idx] != QUOTE:
+            raise QuoteError("Argument was not ended with a (correct) quote")
+
+        arg = self._input[self._idx : end_idx]
+        self._idx = end_idx + core.STR_TRAVERSAL_STRIDE
+        if _ArgumentParser._ESCAPE_CHAR not in arg:
+            return arg
+
+        # If the "\\" byte was encountered check if the next character can escape.
+        escapes = QUOTE_TYPE[QUOTE]
+        return _ArgumentParser._ESCAPE_SEQ.sub(
+            lambda sequence: escapes.get(sequence[1], sequence[0]), arg)
 
     def _visit_unquoted(self) -> str:
         """
@@ -174,16 +225,27 @@ class _ArgumentParser:
         Raises:
             QuoteError: If a quote is encountered (they should NOT be present).
         """
-        arg = core.EMPTY_STR
-        while self._idx < self._input_len:
-            char = self._input[self._idx]
-            
-            if char == QUOTE_DOUBLE or char == QUOTE_SINGLE:
-                raise QuoteError("Unquoted values must NOT contain quotes")
+        end_idx = self._input.find(SPACE, self._idx)
+        if end_idx == core.NOT_FOUND_INDEX:
+            end_idx = self._input_len
 
-            if char == SPACE:
-                return arg
-            arg += char
-            self._idx += core.STR_TRAVERSAL_STRIDE
+        arg = self._input[self._idx : end_idx]
+        if QUOTE_DOUBLE in arg or QUOTE_SINGLE in arg:
+            raise QuoteError("Unquoted values must NOT contain quotes")
 
+        self._idx = end_idx
         return arg
+
+def _compile_quoted_body(QUOTE: str) -> re.Pattern:
+    """
+    Internal method.
+
+    Compiles the pattern of the body of an argument inside the given quotes.
+    """
+    escape = re.escape(_ArgumentParser._ESCAPE_CHAR)
+    regular = f"[^{re.escape(QUOTE)}{escape}]"
+    # The body is unrolled as: regular* (escape any regular*)*.
+    # Unlike an alternation repeated for each character, it is matched without backtracking.
+    return re.compile(f"{regular}*(?:{escape}.{regular}*)*", re.DOTALL)
+
+_ArgumentParser._QUOTED_BODY = frozendict({QUOTE: _compile_quoted_body(QUOTE) for QUOTE in QUOTE_TYPE})
@@ -0,0 +1,874 @@
+"""
+Flat tape representation of decoded Redis responses.
+
+The `Decoder` builds a tree of outputs, tuples and frozendicts:
+a reply of a million elements becomes millions of Python objects,
+which the formatter then walks again.
+
+A tape stores the whole reply as parallel arrays instead, one entry per RESP value, in pre-order:
+    - types: The RESP data type of the value.
+    - offsets: Where the content of a scalar value starts in the reply bytes.
+    - lengths: How many bytes a scalar value is made of,
+               or how many elements an aggregate value is made of (maps count keys and values).
+    - nexts: The entry after the value and all of its elements, which skips over an aggregate.
+
+The views subclass the output classes, so any consumer of outputs consumes a tape as it consumes a tree;
+their contents are read from the tape on access, and nothing is materialised unless requested.
+The formatter skips the views altogether, and walks the entries of the tape.
+"""
+import sys
+from array import array
+from collections.abc import Iterator, Mapping, Sequence
+from itertools import chain
+from frozendict import frozendict
+from typing import TYPE_CHECKING
+
+import core
+
+from .constants_resp import RespDataType, \
+                            SYMB_TYPE, NULL_LENGTH, \
+                            NULL
+from .output import Output, OutputStr, OutputErr, OutputInt, OutputDbl, OutputBool, OutputSeq, OutputMap, OutputAtt, \
+                     double, double_text, sequence
+
+# The network package owns a decoder for each connection.
+# Importing the receiver at runtime would create a circular import.
+if TYPE_CHECKING:
+    from network import Receiver
+
+logger = core.get_logger(__name__)
+
+_TYPE_CODE: str = "B"
+"""
+Internal constant.
+
+The array type code of the RESP data types.
+"""
+
+_INDEX_CODE: str = "q"
+"""
+Internal constant.
+
+The array type code of offsets, lengths and entry indices.
+"""
+
+_PAIR_SIZE: int = 2
+"""
+Internal constant.
+
+How many elements a key-value pair is made of.
+"""
+
+_VERBATIM_PREFIX_LEN: int = len("txt:")
+"""
+Internal constant.
+
+How many bytes precede the content of a verbatim string: the encoding and a colon.
+"""
+
+_CRLF_LEN: int = len(core.CRLF)
+"""
+Internal constant.
+
+How many bytes terminate a RESP line.
+"""
+
+_SYMB_CODES: dict[int, int] = {ord(symb): int(data_type) for symb, data_type in SYMB_TYPE.items()}
+"""
+Internal constant.
+
+Maps the first byte of a RESP value to its data type.
+The tape stores plain integers; looking up enum members costs more than framing a value.
+"""
+
+_NULLS: int = int(RespDataType.NULLS)
+"""
+Internal constant.
+
+The data type of nulls, including the RESP2 null bulk strings.
+"""
+
+_INTEGERS: int = int(RespDataType.INTEGERS)
+"""
+Internal constant.
+
+The data type of integers.
+"""
+
+_BIG_NUMBERS: int = int(RespDataType.BIG_NUMBERS)
+"""
+Internal constant.
+
+The data type of big numbers.
+"""
+
+_DOUBLES: int = int(RespDataType.DOUBLES)
+"""
+Internal constant.
+
+The data type of doubles.
+"""
+
+_BOOLEANS: int = int(RespDataType.BOOLEANS)
+"""
+Internal constant.
+
+The data type of booleans.
+"""
+
+_INT_CHECKED_DIGITS: int = sys.int_info.str_digits_check_threshold
+"""
+Internal constant.
+
+How many digits a number may be made of, at most, to be converted by `int()` whatever its digit limit.
+"""
+
+_TRUE: bytes = b"t"
+"""
+Internal constant.
+
+The content of a true boolean.
+"""
+
+_BULK_ERRORS: int = int(RespDataType.BULK_ERRORS)
+"""
+Internal constant.
+
+The data type of bulk errors.
+"""
+
+_VERBATIM_STRINGS: int = int(RespDataType.VERBATIM_STRINGS)
+"""
+Internal constant.
+
+The data type of verbatim strings.
+"""
+
+_MAPS: int = int(RespDataType.MAPS)
+"""
+Internal constant.
+
+The data type of maps.
+"""
+
+_ATTRIBUTES: int = int(RespDataType.ATTRIBUTES)
+"""
+Internal constant.
+
+The data type of attributes.
+"""
+
+_BULK_TYPES: frozenset[RespDataType] = frozenset({
+    RespDataType.BULK_STRINGS, RespDataType.BULK_ERRORS, RespDataType.VERBATIM_STRINGS,
+})
+"""
+Internal constant.
+
+The data types whose payload follows their header line.
+"""
+
+_AGGREGATE_TYPES: frozenset[RespDataType] = frozenset({
+    RespDataType.ARRAYS, RespDataType.MAPS, RespDataType.ATTRIBUTES, RespDataType.SETS, RespDataType.PUSHES,
+})
+"""
+Internal constant.
+
+The data types whose elements follow their header line.
+"""
+
+class Tape:
+    """
+    A decoded response, stored as parallel arrays of entries over the bytes of the reply.
+
+    Attributes:
+        data (bytes): The RESP-encoded reply, as received.
+        types (array): The RESP data type of every entry.
+        offsets (array): Where the content of every scalar entry starts in `data`.
+        lengths (array): The byte length of scalar entries, the element count of aggregate entries.
+        nexts (array): The entry following every entry and its elements.
+    """
+    __slots__ = ("data", "types", "offsets", "lengths", "nexts")
+
+    # Static dispatcher mapping RESP data types to view classes.
+    # This is a class-level field shared by all instances;
+    # It is initialized exactly once after the view classes are defined.
+    _VIEWS: tuple[type, ...]
+    """
+    Internal dispatcher.
+
+    The view class of every RESP data type, indexed by the data type.
+    """
+
+    def __init__(self, data: bytes, types: array, offsets: array, lengths: array, nexts: array) -> None:
+        self.data = data
+        self.types = types
+        self.offsets = offsets
+        self.lengths = lengths
+        self.nexts = nexts
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    def root(self) -> Output:
+        """
+        Returns:
+            Output: The view of the whole response.
+        """
+        return self.view(0)
+
+    def view(self, idx: int) -> Output:
+        """
+        Args:
+            idx (int): The index of an entry.
+
+        Returns:
+            Output: The view of the entry, reading its contents from the tape on access.
+        """
+        return self.view_type(idx)(self, idx)
+
+    def view_type(self, idx: int) -> type:
+        """
+        Args:
+            idx (int): The index of an entry.
+
+        Returns:
+            type: The view class of the entry, without building the view.
+                  Big numbers with more digits than `int()` converts are viewed as text, as the `Decoder` keeps them.
+        """
+        view_type = Tape._VIEWS[self.types[idx]]
+        if view_type is TapeInt and self.lengths[idx] > _INT_CHECKED_DIGITS:
+            if isinstance(self.value(idx), str):
+                return TapeStr
+        return view_type
+
+    def text(self, idx: int) -> str:
+        """
+        Decodes the content of a scalar entry.
+
+        Args:
+            idx (int): The index of the entry.
+
+        Returns:
+            str: The content, as the `Decoder` would have decoded it.
+        """
+        if self.types[idx] == _NULLS:
+            return NULL
+        offset = self.offsets[idx]
+        return self.data[offset : offset + self.lengths[idx]].decode(core.UTF8_ENC)
+
+    def value(self, idx: int) -> str | int | float | bool:
+        """
+        Decodes the typed value of a scalar entry.
+
+        Args:
+            idx (int): The index of the entry.
+
+        Returns:
+            int: The value of integers and big numbers.
+            float: The value of doubles.
+            bool: The value of booleans.
+            str: The content of any other scalar entry,
+                 and of big numbers with more digits than `int()` converts.
+        """
+        data_type = self.types[idx]
+        offset = self.offsets[idx]
+        content = self.data[offset : offset + self.lengths[idx]]
+        if data_type == _INTEGERS or data_type == _BIG_NUMBERS:
+            try:
+                return int(content)
+            except ValueError:
+                # More digits than `int()` converts.
+                return self.text(idx)
+        if data_type == _DOUBLES:
+            return float(content)
+        if data_type == _BOOLEANS:
+            return content == _TRUE
+        return self.text(idx)
+
+    def _key(self, idx: int) -> Output:
+        """
+        Internal method.
+
+        Builds the output of a key of a map, as the `Decoder` would have built it.
+        """
+        output_cls = _SCALAR_OUTPUTS.get(self.view_type(idx))
+        if output_cls is not None:
+            return output_cls(self.value(idx))
+        return self.to_output(idx)
+
+    def children(self, idx: int) -> Sequence[int]:
+        """
+        Args:
+            idx (int): The index of an aggregate entry.
+
+        Returns:
+            Sequence: The indices of the elements of the entry.
+        """
+        first = idx + 1
+        count = self.lengths[idx]
+        # Without nested aggregates, the elements are contiguous.
+        if self.nexts[idx] - first == count:
+            return range(first, first + count)
+
+        children = array(_INDEX_CODE)
+        child = first
+        nexts = self.nexts
+        for _ in range(count):
+            children.append(child)
+            child = nexts[child]
+        return children
+
+    def pairs(self, idx: int) -> Sequence[int]:
+        """
+        Locates the pairs of a map or attribute entry, as the `Decoder` keeps them:
+        a repeated key keeps the position of its first occurrence, along with its last value.
+
+        Args:
+            idx (int): The index of a map or attribute entry.
+
+        Returns:
+            Sequence: The indices of the keys and values of the entry, alternately.
+                      The payload of an attribute entry is not part of its pairs.
+        """
+        children = self.children(idx)
+        pairs_len = self.lengths[idx] // _PAIR_SIZE
+        if pairs_len < _PAIR_SIZE:
+            # A single key is never repeated.
+            return children[: pairs_len * _PAIR_SIZE]
+
+        # The keys are compared as the outputs the `Decoder` builds for them.
+        pairs: dict[Output, list[int]] = {}
+        for pos in range(0, pairs_len * _PAIR_SIZE, _PAIR_SIZE):
+            key = self._key(children[pos])
+            pair = pairs.get(key)
+            if pair is None:
+                pairs[key] = [children[pos], children[pos + 1]]
+            else:
+                pair[1] = children[pos + 1]
+        if len(pairs) == pairs_len:
+            return children[: pairs_len * _PAIR_SIZE]
+        return array(_INDEX_CODE, chain.from_iterable(pairs.values()))
+
+    def to_output(self, idx: int = 0) -> Output:
+        """
+        Materialises an entry into the output tree the `Decoder` would have built.
+
+        Args:
+            idx (int): The index of the entry. Defaults to the whole response.
+
+        Returns:
+            Output: The materialised value.
+        """
+        return _materialise(self, idx)
+
+class TapeView:
+    """
+    Base class of the views of tape entries.
+
+    A view is an output whose contents are read from the tape on first access, then kept:
+    a scalar view decodes its value once, and an aggregate view builds each of its elements once.
+    The subclasses declare the slots, as the output classes already have their own.
+    """
+    __slots__ = ()
+
+    _tape: Tape
+    _idx: int
+    _cache: object
+
+    def __init__(self, tape: Tape, idx: int) -> None:
+        # The output classes are frozen.
+        object.__setattr__(self, "_tape", tape)
+        object.__setattr__(self, "_idx", idx)
+        object.__setattr__(self, "_cache", None)
+
+    @property
+    def tape(self) -> Tape:
+        return self._tape
+
+    @property
+    def index(self) -> int:
+        return self._idx
+
+    def to_output(self) -> Output:
+        """
+        Returns:
+            Output: The output tree the `Decoder` would have built for the entry.
+        """
+        return self._tape.to_output(self._idx)
+
+    def _text(self) -> str:
+        """
+        Internal method.
+
+        Decodes the value of a scalar entry on first access.
+        """
+        value = self._cache
+        if value is None:
+            value = self._tape.text(self._idx)
+            object.__setattr__(self, "_cache", value)
+        return value
+
+    def _value(self) -> int | float | bool:
+        """
+        Internal method.
+
+        Decodes the typed value of a numeric or boolean entry on first access.
+        """
+        value = self._cache
+        if value is None:
+            value = self._tape.value(self._idx)
+            object.__setattr__(self, "_cache", value)
+        return value
+
+class TapeStr(TapeView, OutputStr):
+    """
+    View of a scalar entry of a tape; equal to the `OutputStr` of the same value.
+    """
+    __slots__ = ("_tape", "_idx", "_cache")
+
+    @property
+    def value(self) -> str:
+        return self._text()
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, OutputStr):
+            return self.value == other.value
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((self.value,))
+
+class TapeErr(TapeView, OutputErr):
+    """
+    View of an error entry of a tape; equal to the `OutputErr` of the same value.
+    """
+    __slots__ = ("_tape", "_idx", "_cache")
+
+    @property
+    def value(self) -> str:
+        return self._text()
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, OutputErr):
+            return self.value == other.value
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((self.value,))
+
+class TapeInt(TapeView, OutputInt):
+    """
+    View of an integer or big number entry of a tape; equal to the `OutputInt` of the same value.
+    """
+    __slots__ = ("_tape", "_idx", "_cache")
+
+    @property
+    def value(self) -> int:
+        return self._value()
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, OutputInt):
+            return self.value == other.value
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((self.value,))
+
+class TapeDbl(TapeView, OutputDbl):
+    """
+    View of a double entry of a tape; equal to the `OutputDbl` of the same value and text.
+    """
+    __slots__ = ("_tape", "_idx", "_cache")
+
+    @property
+    def value(self) -> float:
+        return self._value()
+
+    @property
+    def text(self) -> str | None:
+        text = self._tape.text(self._idx)
+        if double_text(self.value) == text:
+            return None
+        return text
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, OutputDbl):
+            return self.value == other.value and self.text == other.text
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((self.value, self.text))
+
+class TapeBool(TapeView, OutputBool):
+    """
+    View of a boolean entry of a tape; equal to the `OutputBool` of the same value.
+    """
+    __slots__ = ("_tape", "_idx", "_cache")
+
+    @property
+    def value(self) -> bool:
+        return self._value()
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, OutputBool):
+            return self.value == other.value
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((self.value,))
+
+class TapeSeq(TapeView, OutputSeq):
+    """
+    View of an array, set or push entry of a tape.
+    Unlike the `Decoder`, a tape does not pack sequences of numbers into typed arrays;
+    they are already stored as flat entries.
+    """
+    __slots__ = ("_tape", "_idx", "_cache")
+
+    @property
+    def values(self) -> "TapeValues":
+        values = self._cache
+        if values is None:
+            values = TapeValues(self._tape, self._idx)
+            object.__setattr__(self, "_cache", values)
+        return values
+
+class TapeMap(TapeView, OutputMap):
+    """
+    View of a map entry of a tape, or of the attributes of an attribute entry.
+    """
+    __slots__ = ("_tape", "_idx", "_cache")
+
+    @property
+    def values(self) -> "TapePairs":
+        values = self._cache
+        if values is None:
+            values = TapePairs(self._tape, self._idx)
+            object.__setattr__(self, "_cache", values)
+        return values
+
+class TapeAtt(TapeView, OutputAtt):
+    """
+    View of an attribute entry of a tape.
+    """
+    __slots__ = ("_tape", "_idx", "_cache")
+
+    @property
+    def attributes(self) -> TapeMap:
+        return TapeMap(self._tape, self._idx)
+
+    @property
+    def payload(self) -> Output:
+        payload = self._cache
+        if payload is None:
+            # The payload is the last element of the entry.
+            payload = self._tape.view(self._tape.children(self._idx)[-1])
+            object.__setattr__(self, "_cache", payload)
+        return payload
+
+class _TapeElements:
+    """
+    Internal helper class.
+
+    The elements of an aggregate entry, built on first access and kept.
+
+    The element count is read from the tape, and the positions of the elements
+    are only located on first access; without nested aggregates, that costs nothing.
+    Nothing is decoded until an element is accessed.
+
+    Attributes:
+        _tape (obj): The tape holding the aggregate.
+        _idx (int): The index of the aggregate entry.
+        _children (Sequence): The indices of the elements, once located.
+        _elements (dict): The views built so far, by their position.
+    """
+    __slots__ = ("_tape", "_idx", "_children", "_elements")
+
+    def __init__(self, tape: Tape, idx: int) -> None:
+        self._tape = tape
+        self._idx = idx
+        self._children: Sequence[int] | None = None
+        self._elements: dict[int, Output] = {}
+
+    def _element(self, pos: int) -> Output:
+        """
+        Internal method.
+
+        Returns the view of the element at a position, building it on first access.
+        """
+        element = self._elements.get(pos)
+        if element is None:
+            element = self._elements[pos] = self._tape.view(self._located()[pos])
+        return element
+
+    def _located(self) -> Sequence[int]:
+        """
+        Internal method.
+
+        Returns the indices of the elements, locating them on first access.
+        """
+        children = self._children
+        if children is None:
+            children = self._children = self._locate()
+        return children
+
+    def _locate(self) -> Sequence[int]:
+        """
+        Internal method.
+
+        Locates the indices of the elements.
+        """
+        return self._tape.children(self._idx)
+
+class TapeValues(_TapeElements, Sequence):
+    """
+    The elements of an aggregate entry, viewed as a tuple.
+    """
+    __slots__ = ()
+
+    def __len__(self) -> int:
+        return self._tape.lengths[self._idx]
+
+    def __getitem__(self, pos: int | slice) -> Output | tuple[Output, ...]:
+        if isinstance(pos, slice):
+            return tuple(self._element(child_pos) for child_pos in range(*pos.indices(len(self))))
+        if pos < 0:
+            pos += len(self)
+        if not 0 <= pos < len(self):
+            raise IndexError("Tape values index out of range")
+        return self._element(pos)
+
+    def __iter__(self) -> Iterator[Output]:
+        for pos in range(len(self)):
+            yield self._element(pos)
+
+class TapePairs(_TapeElements, Mapping):
+    """
+    The key-value pairs of a map or attribute entry, viewed as a frozendict.
+    A repeated key is kept once, as the `Decoder` keeps it; keys are looked up by a linear scan.
+    """
+    __slots__ = ()
+
+    def __len__(self) -> int:
+        # The payload of an attribute entry is not part of its pairs.
+        pairs_len = self._tape.lengths[self._idx] // _PAIR_SIZE
+        if pairs_len < _PAIR_SIZE:
+            # A single key is never repeated.
+            return pairs_len
+        return len(self._located()) // _PAIR_SIZE
+
+    def __getitem__(self, key: Output) -> Output:
+        for child_key, child_val in self.items():
+            if child_key == key:
+                return child_val
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[Output]:
+        for key, _ in self.items():
+            yield key
+
+    def items(self) -> Iterator[tuple[Output, Output]]:
+        """
+        Returns:
+            Iterator: The keys and values, in their order in the response.
+        """
+        for pos in range(0, len(self) * _PAIR_SIZE, _PAIR_SIZE):
+            yield self._element(pos), self._element(pos + 1)
+
+    def _locate(self) -> Sequence[int]:
+        return self._tape.pairs(self._idx)
+
+Tape._VIEWS = tuple(
+    TapeMap if data_type == _MAPS else
+    TapeAtt if data_type == _ATTRIBUTES else
+    TapeSeq if data_type in _AGGREGATE_TYPES else
+    TapeErr if data_type in (RespDataType.SIMPLE_ERRORS, _BULK_ERRORS) else
+    TapeInt if data_type in (_INTEGERS, _BIG_NUMBERS) else
+    TapeDbl if data_type == _DOUBLES else
+    TapeBool if data_type == _BOOLEANS else
+    TapeStr
+    for data_type in RespDataType
+)
+
+_SCALAR_OUTPUTS: dict[type, type] = {
+    TapeStr: OutputStr, TapeErr: OutputErr, TapeInt: OutputInt, TapeBool: OutputBool,
+}
+"""
+Internal constant.
+
+Maps the views of scalar entries to the outputs the `Decoder` builds for them.
+Doubles are built out of their text, by `double()`.
+"""
+
+def _materialise(tape: Tape, idx: int) -> Output:
+    """
+    Internal method.
+
+    Builds the output tree of an entry.
+    The entries of the tree are contiguous, in pre-order;
+    an aggregate is built once its last entry was built, without recursive calls.
+    """
+    nexts = tape.nexts
+    # Built outputs whose aggregate is not complete yet.
+    built: list[Output] = []
+    # Unfinished aggregates, along with the position of their first element in `built`.
+    stack: list[tuple[int, int]] = []
+    for entry in range(idx, nexts[idx]):
+        view_type = tape.view_type(entry)
+        output_cls = _SCALAR_OUTPUTS.get(view_type)
+        if view_type is TapeDbl:
+            built.append(double(tape.text(entry)))
+        elif output_cls is not None:
+            built.append(output_cls(tape.value(entry)))
+        else:
+            stack.append((entry, len(built)))
+
+        while stack and nexts[stack[-1][0]] == entry + 1:
+            aggregate, start = stack.pop()
+            children = built[start:]
+            del built[start:]
+            built.append(_build(tape.view_type(aggregate), children))
+    return built[0]
+
+def _build(view_type: type, children: list[Output]) -> Output:
+    """
+    Internal method.
+
+    Builds an aggregate output out of its elements.
+    """
+    if view_type is TapeSeq:
+        return sequence(children)
+    pairs = zip(children[0:-1:_PAIR_SIZE], children[1::_PAIR_SIZE])
+    attributes = OutputMap(frozendict(pairs))
+    if view_type is TapeMap:
+        return attributes
+    return OutputAtt(attributes, children[-1])
+
+class TapeDecoder:
+    """
+    Resumable decoder of Redis RESP3/RESP2-encoded responses into tapes.
+
+    Has the interface of `Decoder`, and returns the root view of a tape.
+    The reply is framed in place, without consuming anything;
+    once it was completely received, its bytes are consumed at once, as the data of the tape.
+    When the receiver runs out of bytes, the next call resumes framing at the first incomplete value.
+    """
+
+    def __init__(self, receiver: "Receiver") -> None:
+        self._receiver = receiver
+        self._pos = 0
+        self._stack: list[list[int]] = []
+        self._new_arrays()
+
+    def in_progress(self) -> bool:
+        """
+        Checks if a response was partially decoded.
+
+        Returns:
+            bool: True if the decoding stopped in the middle of a response, False otherwise.
+        """
+        return self._pos != 0
+
+    def reset(self) -> None:
+        """
+        Discards the progress of a partially decoded response.
+        """
+        self._pos = 0
+        self._stack.clear()
+        self._new_arrays()
+
+    def decode(self) -> Output:
+        """
+        Decodes the next response, resuming a partially decoded one.
+
+        Returns:
+            Output: The root view of the decoded tape.
+
+        Raises:
+            KeyError: Invalid first byte of an output.
+            PartialResponseError: If the buffer does not contain the rest of the response.
+                                  The progress is kept for the next call.
+        """
+        receiver = self._receiver
+        types, offsets, lengths, nexts = self._types, self._offsets, self._lengths, self._nexts
+        stack = self._stack
+        while True:
+            pos = self._pos
+            crlf = receiver.find_crlf(pos)
+            header = receiver.peek(pos, crlf)
+            try:
+                data_type = _SYMB_CODES[header[0]]
+            except KeyError:
+                logger.error(f"Unknown RESP type byte received: {chr(header[0])!r}")
+                raise
+
+            start = crlf + _CRLF_LEN
+            idx = len(types)
+            if data_type in _BULK_TYPES:
+                length = int(header[core.STR_TRAVERSAL_STRIDE:])
+                if length == NULL_LENGTH:
+                    # RESP2 NULLS can only be represented through the bulk strings and arrays.
+                    assert data_type != _BULK_ERRORS
+                    data_type, length = _NULLS, core.EMPTY_LEN
+                    end = start
+                else:
+                    end = start + length + _CRLF_LEN
+                    receiver.ensure(end)
+                    if data_type == _VERBATIM_STRINGS:
+                        start += _VERBATIM_PREFIX_LEN
+                        length -= _VERBATIM_PREFIX_LEN
+            elif data_type in _AGGREGATE_TYPES:
+                length = max(int(header[core.STR_TRAVERSAL_STRIDE:]), core.EMPTY_LEN)
+                if data_type == _MAPS:
+                    length *= _PAIR_SIZE
+                elif data_type == _ATTRIBUTES:
+                    # The attributes are followed by the actual payload.
+                    length = length * _PAIR_SIZE + 1
+                end = start
+            else:
+                end = start
+                start = pos + core.STR_TRAVERSAL_STRIDE
+                length = crlf - start
+
+            types.append(data_type)
+            offsets.append(start)
+            lengths.append(length)
+            nexts.append(idx + 1)
+            self._pos = end
+            if data_type in _AGGREGATE_TYPES and length != core.EMPTY_LEN:
+                stack.append([idx, length])
+                continue
+
+            # Completed aggregates are skipped over by their next entry.
+            while stack:
+                frame = stack[-1]
+                frame[1] -= 1
+                if frame[1] != core.EMPTY_LEN:
+                    break
+                stack.pop()
+                nexts[frame[0]] = len(types)
+            else:
+                return self._finish()
+
+    def _finish(self) -> Output:
+        """
+        Internal method.
+
+        Consumes the framed response, and starts framing the next one.
+        """
+        data = self._receiver.consume_bytes(self._pos)
+        tape = Tape(data, self._types, self._offsets, self._lengths, self._nexts)
+        self._pos = 0
+        self._new_arrays()
+        return tape.root()
+
+    def _new_arrays(self) -> None:
+        """
+        Internal method.
+
+        Allocates the arrays of the next tape.
+        """
+        self._types = array(_TYPE_CODE)
+        self._offsets = array(_INDEX_CODE)
+        self._lengths = array(_INDEX_CODE)
+        self._nexts = array(_INDEX_CODE)
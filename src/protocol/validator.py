@@ -0,0 +1,149 @@
+import re
+
+import core
+
+from . import cmds_cache
+from .constants_cmds import INT_CLASS, FLT_CLASS, STR_CLASS
+from .exceptions import ArityError, ArgumentError
+
+logger = core.get_logger(__name__)
+
+_INT_PATTERN: re.Pattern = re.compile(r"-?[0-9]+")
+"""
+Matches the integers accepted by the server.
+"""
+
+_FLT_PATTERN: re.Pattern = re.compile(r"[+-]?(?:inf(?:inity)?|(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:e[+-]?[0-9]+)?)",
+                                      re.IGNORECASE)
+"""
+Matches the floats accepted by the server, including the infinities.
+"""
+
+_ARG_PREVIEW_LEN: int = 32
+"""
+How many characters of a rejected argument are quoted in the error message.
+"""
+
+def validator(cmd: str, argv: list[str]) -> None:
+    """
+    Validates the arguments of a command against its syntax.
+
+    Commands are looked up case-insensitively.
+    Commands missing from the predefined tables are left for the server to validate.
+
+    Args:
+        cmd (str): The command string.
+        argv (list[str]): The arguments of the command.
+
+    Raises:
+        ArityError: If arguments are missing.
+        ArgumentError: If an argument does not fit the syntax of the command.
+    """
+    matcher = _MATCHERS.get(cmd.upper())
+    if matcher is None:
+        return
+    matcher.match(argv)
+
+class _Matcher:
+    """
+    Internal helper class.
+
+    The syntax of a single command, compiled into a deterministic automaton over token classes.
+    Each argument is classified and makes exactly one transition;
+    no argument is ever visited twice.
+
+    Attributes:
+        name (str): The command.
+    """
+    __slots__ = ("name", "_keywords", "_keyword_len", "_transitions", "_accepting")
+
+    def __init__(self, name: str, keywords: frozenset[str],
+                 transitions: tuple[dict[int | str, int], ...], accepting: frozenset[int]) -> None:
+        self.name = name
+        self._keywords = keywords
+        self._keyword_len = max(map(len, keywords), default=core.EMPTY_LEN)
+        self._transitions = transitions
+        self._accepting = accepting
+
+    def match(self, argv: list[str]) -> None:
+        """
+        Runs the automaton over the arguments.
+
+        Raises:
+            ArityError: If the arguments end before the syntax does.
+            ArgumentError: If an argument has no transition from the current state.
+        """
+        state = 0
+        for idx, arg in enumerate(argv):
+            next_state = self._transitions[state].get(self._classify(arg))
+            if next_state is None:
+                raise ArgumentError(f"Invalid argument {idx + 1} of {self.name}: {arg[:_ARG_PREVIEW_LEN]!r}")
+            state = next_state
+
+        if state not in self._accepting:
+            raise ArityError(f"Wrong number of arguments for {self.name}: {len(argv)}")
+
+    def _classify(self, arg: str) -> int | str:
+        """
+        Internal method.
+
+        Returns:
+            str: The uppercase keyword, if the argument is one of the command's keywords.
+            int: The numeric class of the argument otherwise.
+        """
+        # Long arguments (values) are never keywords; they are not copied in uppercase.
+        if len(arg) <= self._keyword_len:
+            upper = arg.upper()
+            if upper in self._keywords:
+                return upper
+        if _INT_PATTERN.fullmatch(arg):
+            return INT_CLASS
+        if _FLT_PATTERN.fullmatch(arg):
+            return FLT_CLASS
+        return STR_CLASS
+
+class _Matchers:
+    """
+    Internal helper class.
+
+    The compiled syntax of the predefined commands, loaded from the commands cache on first use.
+    The commands of a family are only deserialized once one of them is looked up.
+    """
+    __slots__ = ("_index", "_blobs", "_matchers")
+
+    def __init__(self) -> None:
+        self._index: cmds_cache.CmdIndex | None = None
+        self._blobs: cmds_cache.FamilyBlobs = {}
+        self._matchers: dict[str, _Matcher] = {}
+
+    def get(self, name: str) -> _Matcher | None:
+        """
+        Args:
+            name (str): The command, in uppercase.
+
+        Returns:
+            _Matcher: The compiled syntax of the command.
+            None: If the command is not predefined.
+        """
+        matcher = self._matchers.get(name)
+        if matcher is not None:
+            return matcher
+
+        if self._index is None:
+            self._index, self._blobs = cmds_cache.load()
+        family = self._index.get(name)
+        if family is None:
+            return None
+
+        # A family is deserialized exactly once; its blob is no longer needed.
+        for cmd, data in cmds_cache.load_family(self._blobs.pop(family)).items():
+            self._matchers[cmd] = _Matcher(*data)
+        logger.debug(f"Loaded the {family} commands.")
+        return self._matchers[name]
+
+_MATCHERS: _Matchers = _Matchers()
+"""
+Internal constant.
+
+Maps every predefined command, in uppercase, to its compiled syntax.
+"""
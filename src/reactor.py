@@ -10,24 +10,30 @@ Thread-safety was ensured by applying the queue pattern.
 
 The client interface threads enques operations to be performed by the common selector.
 The multiplexing loop thread dequeues and processes these operations.
+
+Every enqueue operation signals a wakeup channel registered in the selector,
+so the multiplexing loop can block indefinitely while idle.
 """
 from collections import deque
 import selectors
+import socket
 from typing import Callable
 
 import core
 from network import Connection
+import formatting
 from util import uninterruptible
 
 logger = core.get_logger(__name__)
 
 # Client modules should only call these functions.
-def enque_new_connection(connection: Connection, on_response: Callable[[str], None]) -> None:
+def enque_new_connection(connection: Connection, on_response: Callable[[formatting.Response], None]) -> None:
     """
     Enqueues a new connection to be added to the selector.
     """
     logger.info(f"Enqueuing connection {connection.addr} to be added.")
     _connections_to_add.append((connection, on_response))
+    wakeup()
 
 def enque_close_connection(connection: Connection) -> None:
     """
@@ -35,6 +41,31 @@ def enque_close_connection(connection: Connection) -> None:
     """
     logger.info(f"Enqueuing connection {connection.addr} to be removed.")
     _connections_to_rem.append(connection)
+    wakeup()
+
+def enque_pending_input(connection: Connection, pending: str) -> None:
+    """
+    Adds a raw input to the connection's pending commands,
+    and enqueues the connection to have its write interest updated.
+    """
+    connection.sender.add_pending(pending)
+    _connections_to_arm.append(connection)
+    wakeup()
+
+def wakeup() -> None:
+    """
+    Interrupts a blocking `select()` call of the multiplexing loop.
+
+    Safe to call from any thread.
+    If the channel is full, a wakeup is already pending and the signal is dropped.
+    """
+    try:
+        _wakeup_writer.send(_WAKEUP_BYTE)
+    except BlockingIOError:
+        pass
+    except OSError as e:
+        # The channel is closed once the application shuts down.
+        logger.debug(f"Failed to signal the wakeup channel: {e}.")
 
 # Calling these functions in the main thread provokes race-conditions.
 # Should only be used by the multiplexing thread.
@@ -69,7 +100,10 @@ def close_resources() -> None:
             for connection in _connections_to_rem:
                 rem_connection(connection)
     
+        _selector.unregister(_wakeup_reader)
         _selector.close()
+        _wakeup_reader.close()
+        _wakeup_writer.close()
         logger.info("Resources closed.")
 
     except Exception as e:
@@ -87,7 +121,7 @@ def add_connection(connection: Connection, on_response: Callable) -> None:
         on_response (lambda): The callback function to be called when a response is received.
     """
     try:
-        _selector.register(connection, selectors.EVENT_READ | selectors.EVENT_WRITE)
+        _selector.register(connection, _get_events(connection))
         _response_lambdas[connection] = on_response
     except KeyError as e:
         logger.error(f"Failed to register connection {connection.addr}: {e}.")
@@ -108,6 +142,7 @@ def rem_connection(connection: Connection) -> None:
     try:
         _selector.unregister(connection)
         _response_lambdas.pop(connection)
+        formatting.discard(connection)
     except (KeyError, ValueError) as e:
         logger.error(f"Failed to remove connection {connection.addr}: {e}.")
     else:
@@ -116,15 +151,79 @@ def rem_connection(connection: Connection) -> None:
         connection.close()
         logger.info(f"Closed connection {connection.addr}.")
 
+def sync_write_interest(connection: Connection) -> None:
+    """
+    Updates the events a registered connection is selected for.
+    https://docs.python.org/3/library/selectors.html#selectors.BaseSelector.modify
+
+    Writable events are requested only while the connection has something to send.
+    An idle socket is always writable, so a permanent write interest
+    would make `select()` return immediately on every iteration.
+    Unregistered connections are ignored.
+
+    Args:
+        connection (obj): The connection to update.
+    """
+    try:
+        key = _selector.get_key(connection)
+    except KeyError:
+        return
+    
+    events = _get_events(connection)
+    if key.events == events:
+        return
+    _selector.modify(connection, events)
+    logger.debug(f"Connection {connection.addr} selected for events: {events}.")
+
+def is_wakeup(fileobj: object) -> bool:
+    """
+    Checks if a selected file object is the wakeup channel.
+    """
+    return fileobj is _wakeup_reader
+
+def drain_wakeup() -> None:
+    """
+    Discards every signal written into the wakeup channel.
+    """
+    try:
+        while _wakeup_reader.recv(_WAKEUP_BUFSIZE):
+            pass
+    except BlockingIOError:
+        pass
+
+def _get_events(connection: Connection) -> int:
+    """
+    Internal method.
+    
+    Computes the selector events a connection is interested in.
+    """
+    if connection.wants_write():
+        return selectors.EVENT_READ | selectors.EVENT_WRITE
+    return selectors.EVENT_READ
+
 _selector = selectors.DefaultSelector()
 """
 The unique selector used by the application.
 """
-_response_lambdas: dict[Connection, Callable[[str], None]] = {}
+_WAKEUP_BYTE: bytes = b"\0"
+"""
+The signal written into the wakeup channel.
+"""
+_WAKEUP_BUFSIZE: int = 4096
+"""
+How many signals are discarded at once when draining the wakeup channel.
+"""
+# A socket pair is used instead of eventfd or os.pipe(),
+# since it is the only option that `select()` accepts on every platform.
+_wakeup_reader, _wakeup_writer = socket.socketpair()
+_wakeup_reader.setblocking(False)
+_wakeup_writer.setblocking(False)
+_selector.register(_wakeup_reader, selectors.EVENT_READ)
+_response_lambdas: dict[Connection, Callable[[formatting.Response], None]] = {}
 """
 Lambda functions for each connection to be called when a full response is received.
 """
-_connections_to_add: deque[tuple[Connection, Callable[[str], None]]] = deque()
+_connections_to_add: deque[tuple[Connection, Callable[[formatting.Response], None]]] = deque()
 """
 A queue of connections to be added to the selector.
 """
@@ -132,3 +231,8 @@ _connections_to_rem: deque[Connection] = deque()
 """
 A queue of connections to be removed from the selector.
 """
+_connections_to_arm: deque[Connection] = deque()
+"""
+A queue of connections that received new pending inputs,
+and whose write interest must be updated.
+"""
@@ -1,23 +1,33 @@
+from typing import Callable
+
 import core
-from network import Receiver
+from network import Receiver, Synchronizer
+from protocol import Decoder, Output
 
 from .processor import process_output, is_init_command, validate_init_cmd_output
 
 logger = core.get_logger(__name__)
 
-def handle_read(addr: core.Addr, receiver: Receiver, last_raw_cmd: str, all_sent: bool) -> str:
+def handle_read(addr: core.Addr,
+                receiver: Receiver,
+                decoder: Decoder,
+                synchronizer: Synchronizer,
+                on_output: Callable[[Output], None]) -> None:
     """
     Reads from the socket, decodes data, and updates history.
 
+    Every complete output found in the buffer is decoded,
+    correlated with the oldest input in flight, and delivered at once;
+    the outputs delivered before an error are never lost.
+
     Args:
         addr (obj): The address of the client.
         receiver (obj): The receiver object.
-        last_raw_cmd (str): The last raw user input.
-        all_sent (bool): Whether the request is completely sent.
+        decoder (obj): The decoder object.
+        synchronizer (obj): The synchronizer object.
+        on_output (lambda): Called with each response, in the order of their requests.
+                            The responses are formatted by the client, which may only display a part of them.
 
-    Returns:
-        str: The response to send to the client.
-    
     Raises:
         PartialRequestError: If the request is not completely sent.
         PartialResponseError: If the response is not completely received.
@@ -28,34 +38,45 @@ def handle_read(addr: core.Addr, receiver: Receiver, last_raw_cmd: str, all_sent
     # `recv()` should NOT read bytes theoretically.
     # Reductio ad absurdum there are bytes to be read; then do it.
     _handle_recv(receiver, addr)
-    if all_sent != True:
-        raise core.PartialRequestError("The request is not completely sent")
-    
+
+    delivered = False
     try:
-        initial_buf_idx = receiver._idx
-        output = process_output(receiver)
-        if is_init_command(last_raw_cmd):
-            validate_init_cmd_output(last_raw_cmd, output)
-        return str(output)
-    
-    # When a partial response is encountered, 
-    # the buffer index is restored to the initial position, 
-    # and the next chunk of data is read and concatenated to the initial buffer. 
-    except core.PartialResponseError:
-        receiver.restore_buf(initial_buf_idx)
-        raise
+        while not receiver.empty_buf():
+            if not synchronizer.head_sent():
+                if delivered:
+                    break
+                raise core.PartialRequestError("The request is not completely sent")
+
+            # When a partial response is encountered,
+            # the decoder keeps its progress,
+            # and resumes once the next chunk of data is read.
+            try:
+                output = process_output(decoder)
+            except core.PartialResponseError:
+                if delivered:
+                    break
+                raise
+
+            last_raw_cmd = synchronizer.sync_output()
+            if last_raw_cmd is not None and is_init_command(last_raw_cmd):
+                validate_init_cmd_output(last_raw_cmd, output)
+            on_output(output)
+            delivered = True
+    finally:
+        # The delivered responses are no longer needed.
+        receiver.compact()
 
 def _handle_recv(receiver: Receiver, addr: core.Addr) -> None:
     """
     Handles receiving data from the socket.
+    Everything the socket holds is read at once, within the receiver's budget.
 
     Raises:
         ConnectionError: If the socket is closed by the peer.
     """
     try:
-        receiver.recv()
-    except BlockingIOError:
-        logger.warning("Receiving would block.")
+        if receiver.drain() == core.EMPTY_LEN:
+            logger.warning("Receiving would block.")
     except ConnectionError as e:
-        logger.error(f"Error receiving data from {connection.addr}: {e}.")
+        logger.error(f"Error receiving data from {addr}: {e}.")
         raise
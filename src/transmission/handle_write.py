@@ -1,47 +1,62 @@
 import core
 from network import Sender, Synchronizer
 
-from .processor import process_input
+from .processor import process_input, is_init_command
 
 logger = core.get_logger(__name__)
 
-def handle_write(addr: core.Addr, sender: Sender, synchronizer: Synchronizer) -> None:
+def handle_write(addr: core.Addr, sender: Sender, synchronizer: Synchronizer) -> list[float]:
     """
     Sends pending commands to the socket.
     
-    Handles encoding of strings and manages partial sends by updating
-    the sender's pending input queue.
+    Every command the pipeline has room for is encoded and staged,
+    then all staged commands are sent together by a single system call.
+    Partially sent commands stay staged until the next writable event.
 
     Args:
         addr (obj): The address of the connection.
         sender (obj): The sender object.
         synchronizer (obj): The synchronizer object.
 
+    Returns:
+        list[float]: The enqueue-to-send latencies of the completely sent commands.
+
     Raises:
-        PartialResponseError: If the last output was not fully received.
+        PartialResponseError: If the pipeline has no room for another command.
         ValueError: If the input is has parser errors.
+                    The commands staged before it are still sent.
         ConnectionError: If the socket is closed by the peer.
     """
-    pending = sender.get_first_pending()
-    
-    # Encoding the command.
-    if pending is None:
-        return
-    # Note that an input might be transmitted by n number of `send()` calls.
-    # When partial send occurs,
-    # the first pending input from the queue becomes the remaining bytes from the `send()` call.
-    if isinstance(pending, bytes):
-        logger.debug(f"Sending leftovers from a previous command: {pending}.")
-        encoded = pending
-    else:
-        assert isinstance(pending, str)
-        # If the previous command was not fully received by the peer,
+    error = None
+    try:
+        _handle_stage(addr, sender, synchronizer)
+    except ValueError as e:
+        error = e
+
+    latencies = []
+    if sender.has_outgoing():
+        latencies = _handle_send(addr, sender, synchronizer)
+    if error is not None:
+        raise error
+    return latencies
+
+def _handle_stage(addr: core.Addr, sender: Sender, synchronizer: Synchronizer) -> None:
+    """
+    Encodes and stages the pending commands, as long as the pipeline has room for them.
+
+    Raises:
+        PartialResponseError: If nothing can be sent.
+        ValueError: If the input is has parser errors.
+    """
+    while (pending := sender.get_first_pending()) is not None:
+        # If too many results are not yet received,
         # do NOT send this one.
-        if synchronizer.all_recv == False:
-            raise core.PartialResponseError("The previous command's result was not fully received")
+        exclusive = is_init_command(pending)
+        if not synchronizer.can_sync(exclusive):
+            break
         
         logger.debug(f"Syncing input for {addr}: {pending}.")
-        synchronizer.sync_input(pending)
+        synchronizer.sync_input(pending, exclusive)
         try:
             encoded = process_input(pending)
         except ValueError as e:
@@ -49,33 +64,32 @@ def handle_write(addr: core.Addr, sender: Sender, synchronizer: Synchronizer) ->
             synchronizer.unsync()
             sender.rem_first_pending()
             raise
+        sender.stage_first_pending(encoded)
 
-    # Sending the command.
-    _handle_send(addr, sender, synchronizer, encoded)
+    if sender.has_pending() and not sender.has_outgoing():
+        raise core.PartialResponseError("The previous commands' results were not fully received")
 
-def _handle_send(addr: core.Addr, sender: Sender, synchronizer: Synchronizer, encoded: bytes) -> None:
+def _handle_send(addr: core.Addr, sender: Sender, synchronizer: Synchronizer) -> list[float]:
     """
-    Handles sending data to the socket.
+    Handles sending the staged commands to the socket.
+
+    Returns:
+        list[float]: The enqueue-to-send latencies of the completely sent commands.
 
     Raises:
         ConnectionError: If the socket is closed by the peer.
     """
     try:
-        sent_count = sender.send(encoded)
+        latencies = sender.flush()
     except BlockingIOError:
         logger.warning("Sending would block.")
-        return
+        return []
     except ConnectionError as e:
         logger.error(f"Error sending data to {addr}: {e}.")
         raise
     
-    if sent_count >= len(encoded):
-        synchronizer.all_sent = True
-        sender.rem_first_pending()
-        return
-
-    # The command was not sent in one go.
-    # Update the pending item with the remaining bytes.
-    logger.debug(f"Partial send for {addr}: {sent_count}/{len(encoded)} bytes sent.")
-    remaining = encoded[sent_count:]
-    sender.shrink_first_pending(remaining)
+    for _ in latencies:
+        synchronizer.mark_sent()
+    if sender.has_outgoing():
+        logger.debug(f"Partial send for {addr}; the rest is sent on the next writable event.")
+    return latencies
@@ -1,7 +1,8 @@
 import core
 
-from network import Connection, Receiver
-from protocol import parser, encoder, decoder, Output, OutputErr, ParserError
+from network import Connection
+from protocol import parser, parse_encode, encoder, validator, \
+                     Decoder, Output, OutputErr, ParserError, ValidatorError
 
 from .exceptions import Resp3NotSupportedError
 
@@ -10,7 +11,9 @@ logger = core.get_logger(__name__)
 def process_input(input_str: str) -> bytes:
     """
     Processes the input string by parsing it into a command and arguments,
+    validating the arguments against the syntax of the command,
     encoding it, and returning the encoded bytes.
+    Without validation, parsing and encoding are fused into a single pass.
     
     Args:
         input_str (str): A string representing the input to be processed.
@@ -23,35 +26,37 @@ def process_input(input_str: str) -> bytes:
     """
     logger.debug(f"Processing input: {input_str}.")
     
+    # As long as nothing inspects the arguments,
+    # the input is encoded without building their list (`parser()` and `encoder()`).
     try:
+        if not core.VALIDATE_CMDS:
+            return parse_encode(input_str)
+        
         cmd, argv = parser(input_str)
-    except (ValueError, ParserError) as e:
+        validator(cmd, argv)
+        return encoder(cmd, argv)
+    except (ValueError, ParserError, ValidatorError) as e:
         raise ValueError(f"Invalid input {input_str}; {e}")
-    logger.debug(f"Parsed command: {cmd}, arguments: {argv}.")
-    
-    # todo sanitizer
-    
-    encoded = encoder(cmd, argv)
-    return encoded.encode(core.ASCII_ENC)
 
-def process_output(receiver: Receiver) -> str:
+def process_output(decoder: Decoder) -> Output:
     """
-    Processes the output string by decoding it and formatting it.
+    Processes the received data by decoding the next output.
     
     Args:
-        receiver (Receiver): The receiver to process.
+        decoder (Decoder): The decoder of the connection.
     
     Returns:
         obj: The processed output object.
 
     Raises:
         PartialResponseError: If the buffer provided by receiver is incomplete.
+                              The decoding progress is kept by the decoder.
         AssertionError: If the output type is NOT one of the expected Output subclasses.
     """
     logger.debug("Processing output.")
 
     try:
-        return decoder(receiver)
+        return decoder.decode()
     
     except core.PartialResponseError as e:
         logger.debug(f"Partial output received: {e}.")
@@ -68,7 +73,7 @@ def is_init_command(cmd: str) -> bool:
     Args:
         cmd (str): The raw command string given as input.
     """
-    return Connection.SELECT_CMD in cmd or Connection.HELLO_CMD in cmd
+    return Connection.is_init_input(cmd)
 
 def validate_init_cmd_output(cmd: str, output: Output) -> None:
     """
@@ -135,6 +135,144 @@ class TestConfig(TestCase):
         self.assertEqual(config.MAX_CONNECTIONS, 1024)
         self.assertTrue(config._found_invalid)
 
+    def test_pipeline_depth(self):
+        self.mock_dotenv.return_value = {}
+        importlib.reload(config)
+        self.assertEqual(config.PIPELINE_DEPTH, 16)
+        
+        self.mock_dotenv.return_value = {"PIPELINE_DEPTH": "1"}
+        importlib.reload(config)
+        self.assertEqual(config.PIPELINE_DEPTH, 1)
+        self.assertFalse(config._found_invalid)
+    
+    def test_invalid_pipeline_depth(self):
+        inputs = ["not_an_int", "0", "1025"]
+        for input in inputs:
+            self.mock_dotenv.return_value = {"PIPELINE_DEPTH": input}
+            importlib.reload(config)
+            self.assertEqual(config.PIPELINE_DEPTH, 16)
+            self.assertTrue(config._found_invalid)
+
+    def test_recv_buf_high_water(self):
+        self.mock_dotenv.return_value = {}
+        importlib.reload(config)
+        self.assertEqual(config.RECV_BUF_HIGH_WATER, 65536)
+        
+        self.mock_dotenv.return_value = {"RECV_BUF_HIGH_WATER": "0"}
+        importlib.reload(config)
+        self.assertEqual(config.RECV_BUF_HIGH_WATER, 0)
+        self.assertFalse(config._found_invalid)
+        
+        self.mock_dotenv.return_value = {"RECV_BUF_HIGH_WATER": "-1"}
+        importlib.reload(config)
+        self.assertEqual(config.RECV_BUF_HIGH_WATER, 65536)
+        self.assertTrue(config._found_invalid)
+
+    def test_read_budget(self):
+        self.mock_dotenv.return_value = {}
+        importlib.reload(config)
+        self.assertEqual(config.READ_BUDGET, 262144)
+        
+        self.mock_dotenv.return_value = {"READ_BUDGET": "4096"}
+        importlib.reload(config)
+        self.assertEqual(config.READ_BUDGET, 4096)
+        self.assertFalse(config._found_invalid)
+        
+        self.mock_dotenv.return_value = {"READ_BUDGET": "0"}
+        importlib.reload(config)
+        self.assertEqual(config.READ_BUDGET, 262144)
+        self.assertTrue(config._found_invalid)
+
+    def test_recv_bufsize_bounds(self):
+        self.mock_dotenv.return_value = {}
+        importlib.reload(config)
+        self.assertEqual(config.RECV_BUFSIZE_MIN, 4096)
+        self.assertEqual(config.RECV_BUFSIZE_MAX, 1048576)
+        
+        self.mock_dotenv.return_value = {"RECV_BUFSIZE_MIN": "1024", "RECV_BUFSIZE_MAX": "1024"}
+        importlib.reload(config)
+        self.assertEqual(config.RECV_BUFSIZE_MIN, 1024)
+        self.assertEqual(config.RECV_BUFSIZE_MAX, 1024)
+        self.assertFalse(config._found_invalid)
+
+    def test_invalid_recv_bufsize_bounds(self):
+        # The smallest read size can not exceed the largest one.
+        self.mock_dotenv.return_value = {"RECV_BUFSIZE_MIN": "65536", "RECV_BUFSIZE_MAX": "8192"}
+        importlib.reload(config)
+        self.assertEqual(config.RECV_BUFSIZE_MIN, 4096)
+        self.assertEqual(config.RECV_BUFSIZE_MAX, 1048576)
+        self.assertTrue(config._found_invalid)
+        
+        self.mock_dotenv.return_value = {"RECV_BUFSIZE_MIN": "1"}
+        importlib.reload(config)
+        self.assertEqual(config.RECV_BUFSIZE_MIN, 4096)
+        self.assertTrue(config._found_invalid)
+
+    def test_set_so_rcvbuf(self):
+        self.mock_dotenv.return_value = {}
+        importlib.reload(config)
+        self.assertFalse(config.SET_SO_RCVBUF)
+        
+        self.mock_dotenv.return_value = {"SET_SO_RCVBUF": "true"}
+        importlib.reload(config)
+        self.assertTrue(config.SET_SO_RCVBUF)
+        self.assertFalse(config._found_invalid)
+        
+        self.mock_dotenv.return_value = {"SET_SO_RCVBUF": "yes"}
+        importlib.reload(config)
+        self.assertFalse(config.SET_SO_RCVBUF)
+        self.assertTrue(config._found_invalid)
+
+    def test_validate_cmds(self):
+        self.mock_dotenv.return_value = {}
+        importlib.reload(config)
+        self.assertTrue(config.VALIDATE_CMDS)
+        
+        self.mock_dotenv.return_value = {"VALIDATE_CMDS": "False"}
+        importlib.reload(config)
+        self.assertFalse(config.VALIDATE_CMDS)
+        self.assertFalse(config._found_invalid)
+
+    def test_decode_tape(self):
+        self.mock_dotenv.return_value = {}
+        importlib.reload(config)
+        self.assertFalse(config.DECODE_TAPE)
+        
+        self.mock_dotenv.return_value = {"DECODE_TAPE": "True"}
+        importlib.reload(config)
+        self.assertTrue(config.DECODE_TAPE)
+        self.assertFalse(config._found_invalid)
+
+    def test_format_workers(self):
+        self.mock_dotenv.return_value = {}
+        importlib.reload(config)
+        self.assertEqual(config.FORMAT_WORKERS, 2)
+        
+        self.mock_dotenv.return_value = {"FORMAT_WORKERS": "0"}
+        importlib.reload(config)
+        self.assertEqual(config.FORMAT_WORKERS, 0)
+        self.assertFalse(config._found_invalid)
+        
+        self.mock_dotenv.return_value = {"FORMAT_WORKERS": "1000"}
+        importlib.reload(config)
+        self.assertEqual(config.FORMAT_WORKERS, 2)
+        self.assertTrue(config._found_invalid)
+
+    def test_format_cache_bytes(self):
+        self.mock_dotenv.return_value = {}
+        importlib.reload(config)
+        self.assertEqual(config.FORMAT_CACHE_BYTES, 1 << 22)
+        
+        self.mock_dotenv.return_value = {"FORMAT_CACHE_BYTES": "0"}
+        importlib.reload(config)
+        self.assertEqual(config.FORMAT_CACHE_BYTES, 0)
+        self.assertFalse(config._found_invalid)
+        
+        self.mock_dotenv.return_value = {"FORMAT_CACHE_BYTES": "-1"}
+        importlib.reload(config)
+        self.assertEqual(config.FORMAT_CACHE_BYTES, 1 << 22)
+        self.assertTrue(config._found_invalid)
+
     def test_handlers_configuration(self):
         self.mock_dotenv.return_value = {}
         importlib.reload(config)
@@ -65,3 +65,22 @@ class TestUtil(TestCase):
             obj.key = "cool"
         with self.assertRaises(AssignmentError):
             obj.value = 1
+
+    class SlottedObject(Immutable):
+        __slots__ = ("key",)
+
+        def __init__(self, key: str):
+            self.key = key
+
+    def test_slotted_initialization(self):
+        obj = TestUtil.SlottedObject("test")
+        self.assertEqual(obj.key, "test")
+        self.assertFalse(hasattr(obj, "__dict__"))
+
+    def test_slotted_assignment_failure(self):
+        obj = TestUtil.SlottedObject("test")
+        with self.assertRaises(AssignmentError):
+            obj.key = "cool"
+        # Only the declared slots can be assigned.
+        with self.assertRaises(AttributeError):
+            obj.value = 1
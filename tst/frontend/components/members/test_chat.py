@@ -1,8 +1,12 @@
+from frozendict import frozendict
 from unittest import TestCase
 from unittest.mock import MagicMock, patch, AsyncMock, PropertyMock
 import asyncio
 
 from src.frontend.components.members.chat import Chat
+# The outputs must come from the same package the chat module formats them with.
+from formatting import PAGE_SIZE, Response
+from protocol import OutputStr, OutputSeq, OutputMap, formatter_window
 
 class TestChat(TestCase):
     
@@ -52,12 +56,56 @@ class TestChat(TestCase):
         self.chat.history_box.controls.append.assert_called()
     
     def test_on_response(self):
-        self.chat.on_response("OK")
+        res = Response(OutputStr("OK"), "OK", 1)
+        self.chat.on_response(res)
         
         self.mock_page_val.run_task.assert_called()
         
         task_func = self.mock_page_val.run_task.call_args[0][0]
-        asyncio.run(task_func("OK"))
+        asyncio.run(task_func(res))
         
         self.chat.history_box.controls.append.assert_called()
         self.chat.history_box.update.assert_called()
+
+    def test_on_response_pages(self):
+        output = OutputSeq(tuple(OutputStr(f"e{idx}") for idx in range(450)))
+        asyncio.run(self.chat._auto_add_res(Response(output, *formatter_window(output, 0, PAGE_SIZE))))
+        
+        bubble = self.chat.history_box.controls.append.call_args[0][0]
+        container = bubble.controls[0]
+        text, load_more = container.content.controls
+        # Only the first page is displayed.
+        self.assertEqual(text.value.count("\n"), 199)
+        self.assertTrue(text.value.endswith("200) e199"))
+        
+        self.assertEqual(load_more.content, "Load more (1-200 of 450)")
+        
+        container.update = MagicMock()
+        load_more.on_click()
+        # Each page is displayed by a text of its own.
+        _, page, _ = container.content.controls
+        self.assertTrue(page.value.startswith("201) e200"))
+        self.assertTrue(page.value.endswith("400) e399"))
+        self.assertTrue(load_more.visible)
+        
+        load_more.on_click()
+        pages = container.content.controls[:-1]
+        self.assertTrue(pages[-1].value.endswith("450) e449"))
+        self.assertEqual("\n".join(page.value for page in pages).count("\n"), 449)
+        self.assertFalse(load_more.visible)
+
+    def test_on_response_map_pages(self):
+        output = OutputMap(frozendict({OutputStr(f"k{idx}"): OutputStr(f"v{idx}") for idx in range(300)}))
+        asyncio.run(self.chat._auto_add_res(Response(output, *formatter_window(output, 0, PAGE_SIZE))))
+        
+        bubble = self.chat.history_box.controls.append.call_args[0][0]
+        container = bubble.controls[0]
+        text, load_more = container.content.controls
+        # The label counts the keys and values, as they are numbered.
+        self.assertTrue(text.value.endswith("400) v199"))
+        self.assertEqual(load_more.content, "Load more (1-400 of 600)")
+        
+        container.update = MagicMock()
+        load_more.on_click()
+        self.assertTrue(container.content.controls[1].value.endswith("600) v299"))
+        self.assertFalse(load_more.visible)
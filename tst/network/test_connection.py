@@ -59,3 +59,34 @@ class TestConnection(TestCase):
         
         self.assertEqual(Connection.count, 0)
         self.mock_sock_instance.close.assert_called()
+
+    def test_is_init_input(self):
+        self.assertTrue(Connection.is_init_input("HELLO 3 AUTH default"))
+        self.assertTrue(Connection.is_init_input("SELECT 1"))
+        self.assertFalse(Connection.is_init_input("GET key"))
+
+    def test_wants_write(self):
+        conn = Connection("localhost", "6379", "user", "pass", "0")
+        sender = conn.sender
+        synchronizer = conn.synchronizer
+        
+        sender.has_outgoing.return_value = False
+        sender.get_first_pending.return_value = None
+        self.assertFalse(conn.wants_write())
+        
+        # Staged commands are sent regardless of the pipeline.
+        sender.has_outgoing.return_value = True
+        synchronizer.can_sync.return_value = False
+        self.assertTrue(conn.wants_write())
+        
+        sender.has_outgoing.return_value = False
+        sender.get_first_pending.return_value = "GET key"
+        self.assertFalse(conn.wants_write())
+        synchronizer.can_sync.assert_called_with(False)
+        
+        synchronizer.can_sync.return_value = True
+        self.assertTrue(conn.wants_write())
+        
+        sender.get_first_pending.return_value = "SELECT 1"
+        conn.wants_write()
+        synchronizer.can_sync.assert_called_with(True)
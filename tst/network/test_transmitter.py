@@ -29,15 +29,22 @@ class TestTransmitter(TestCase):
         mock_sock_instance = MagicMock()
         self.mock_sock_cls.return_value = mock_sock_instance
         
-        transmitter = Transmitter(self.addr)
+        transmitter = Transmitter(self.addr, pipeline_depth=4)
         
-        self.mock_sock_cls.assert_called_with(self.addr)
+        # The kernel receive buffer is left to the operating system by default.
+        self.mock_sock_cls.assert_called_with(self.addr, None)
         self.mock_receiver_cls.assert_called_with(mock_sock_instance._socket)
         self.mock_sender_cls.assert_called_with(mock_sock_instance._socket)
-        self.mock_sync_cls.assert_called()
+        self.mock_sync_cls.assert_called_with(4)
         
         self.assertEqual(transmitter.sock, mock_sock_instance)
 
+    def test_init_so_rcvbuf(self):
+        with patch("src.network.transmitter.core.SET_SO_RCVBUF", True), \
+             patch("src.network.transmitter.core.RECV_BUFSIZE_MAX", 65536):
+            Transmitter(self.addr)
+        self.mock_sock_cls.assert_called_with(self.addr, 65536)
+
     def test_delegations(self):
         mock_sock_instance = MagicMock()
         self.mock_sock_cls.return_value = mock_sock_instance
@@ -51,3 +58,14 @@ class TestTransmitter(TestCase):
         
         self.assertEqual(transmitter.fileno(), 10)
         self.assertEqual(transmitter.addr, self.addr)
+
+    def test_stats(self):
+        transmitter = Transmitter(self.addr)
+        transmitter.receiver.buf_size = 10
+        transmitter.receiver.peak_buf_size = 20
+        transmitter.receiver.recv_size = 8192
+        
+        stats = transmitter.stats()
+        self.assertEqual(stats["recv_buf_size"], 10)
+        self.assertEqual(stats["recv_buf_peak"], 20)
+        self.assertEqual(stats["recv_size"], 8192)
@@ -10,32 +10,135 @@ class TestReceiver(TestCase):
         self.mock_socket = MagicMock()
         self.receiver = Receiver(self.mock_socket)
 
+    def _load(self, data: bytes) -> None:
+        """
+        Places the data in the buffer as if it was received.
+        """
+        self.receiver._replace_buf(bytearray(data))
+        self.receiver._end = len(data)
+
+    def _set_recv(self, data: bytes) -> None:
+        """
+        Makes the mocked socket receive the data.
+        """
+        stream = bytearray(data)
+        def recv_into(buffer, nbytes):
+            chunk = stream[:nbytes]
+            del stream[:nbytes]
+            buffer[:len(chunk)] = chunk
+            return len(chunk)
+        self.mock_socket.recv_into.side_effect = recv_into
+
+    def _set_stream(self, data: bytes) -> None:
+        """
+        Makes the mocked socket receive the data, then block.
+        """
+        stream = bytearray(data)
+        def recv_into(buffer, nbytes):
+            if not stream:
+                raise BlockingIOError
+            chunk = stream[:nbytes]
+            del stream[:nbytes]
+            buffer[:len(chunk)] = chunk
+            return len(chunk)
+        self.mock_socket.recv_into.side_effect = recv_into
+
+    def _received(self) -> bytes:
+        return bytes(self.receiver._buf[:self.receiver._end])
+
     def test_empty_buf(self):
-        self.receiver._buf = bytearray(b"")
+        self._load(b"")
         self.receiver._idx = 0
         self.assertTrue(self.receiver.empty_buf())
 
-        self.receiver._buf = bytearray(b"1")
+        self._load(b"1")
         self.assertFalse(self.receiver.empty_buf())
 
     def test_recv_success(self):
         data = b"Hello"
-        self.mock_socket.recv.return_value = data
+        self._set_recv(data)
         
         received = self.receiver.recv(10)
         
-        self.mock_socket.recv.assert_called_with(10)
+        self.assertEqual(self.mock_socket.recv_into.call_args.args[1], 10)
         self.assertEqual(received, len(data))
-        self.assertEqual(self.receiver._buf, bytearray(data))
+        self.assertEqual(self._received(), data)
+
+    def test_recv_grows_buffer(self):
+        data = b"x" * (Receiver._4KB_BUFSIZE + 1)
+        self._set_recv(data)
+        
+        self.receiver.recv(len(data))
+        
+        self.assertGreaterEqual(self.receiver.buf_capacity, len(data))
+        self.assertEqual(self.receiver.consume(len(data)), data.decode())
+
+    def test_consume_reserves_missing_bytes(self):
+        data = b"x" * (Receiver._4KB_BUFSIZE * 4)
+        self._set_recv(data)
+        
+        self.receiver.recv(10)
+        with self.assertRaises(PartialResponseError):
+            self.receiver.consume(len(data))
+        # The buffer does not grow step by step while the rest is received.
+        self.assertGreaterEqual(self.receiver.buf_capacity, len(data))
+
+    def test_recv_compacts(self):
+        self.receiver.high_water = 4
+        self._load(b"+OK\r\n+O")
+        self.receiver._idx = 5
+        self._set_recv(b"K\r\n")
+        
+        self.receiver.recv(10)
+        
+        self.assertEqual(self._received(), b"+OK\r\n")
+        self.assertEqual(self.receiver._idx, 0)
+        self.assertEqual(self.receiver.consume_crlf(), "+OK")
+        self.assertEqual(self.receiver.peak_buf_size, 5)
 
     def test_recv_socket_closed(self):
-        self.mock_socket.recv.return_value = b""
+        self._set_recv(b"")
         
         with self.assertRaises(ConnectionError):
             self.receiver.recv(10)
 
+    def test_drain(self):
+        data = b"x" * 10000
+        self._set_stream(data)
+        
+        self.assertEqual(self.receiver.drain(), len(data))
+        self.assertEqual(self._received(), data)
+        # The short read stopped the draining without waiting for EAGAIN.
+        self.assertEqual(self.mock_socket.recv_into.call_count, 2)
+
+    def test_drain_adapts_recv_size(self):
+        self.receiver.recv_size_max = 16384
+        
+        # Full reads double the read size, up to the maximum.
+        self._set_stream(b"x" * 100000)
+        self.receiver.drain()
+        self.assertEqual(self.receiver.recv_size, 16384)
+        self.receiver._idx = self.receiver._end
+        
+        # Small replies halve it, down to the minimum.
+        for _ in range(4):
+            self._set_stream(b"+OK\r\n")
+            self.receiver.drain()
+        self.assertEqual(self.receiver.recv_size, 4096)
+
+    def test_drain_budget(self):
+        self.receiver.read_budget = 5000
+        self._set_stream(b"x" * 10000)
+        
+        self.assertEqual(self.receiver.drain(), 5000)
+        self.assertEqual(self.receiver.buf_size, 5000)
+
+    def test_drain_would_block(self):
+        self._set_stream(b"")
+        self.assertEqual(self.receiver.drain(), 0)
+
     def test_consume(self):
-        self.receiver._buf = bytearray(b"Hello World")
+        self._load(b"Hello World")
         self.receiver._idx = 0
         
         data = self.receiver.consume(5)
@@ -47,14 +150,37 @@ class TestReceiver(TestCase):
         self.assertEqual(self.receiver._idx, 11)
 
     def test_consume_insufficient_bytes(self):
-        self.receiver._buf = bytearray(b"Hi")
+        self._load(b"Hi")
         self.receiver._idx = 0
         
         with self.assertRaises(PartialResponseError):
             self.receiver.consume(5)
 
+    def test_consume_bytes(self):
+        self._load(b"Hello World")
+        self.receiver._idx = 0
+        
+        self.assertEqual(self.receiver.consume_bytes(5), b"Hello")
+        self.assertEqual(self.receiver._idx, 5)
+        with self.assertRaises(PartialResponseError):
+            self.receiver.consume_bytes(7)
+        self.assertEqual(self.receiver._idx, 5)
+
+    def test_find_crlf_and_peek(self):
+        self._load(b"+OK\r\n:12\r\n")
+        self.receiver._idx = 5
+        
+        # Positions are relative to the first unconsumed byte, and nothing is consumed.
+        self.assertEqual(self.receiver.find_crlf(0), 3)
+        self.assertEqual(self.receiver.peek(0, 3), b":12")
+        self.assertEqual(self.receiver._idx, 5)
+        with self.assertRaises(PartialResponseError):
+            self.receiver.find_crlf(4)
+        with self.assertRaises(PartialResponseError):
+            self.receiver.peek(0, 6)
+
     def test_consume_crlf(self):
-        self.receiver._buf = bytearray(b"Line1\r\nLine2")
+        self._load(b"Line1\r\nLine2")
         self.receiver._idx = 0
         
         line = self.receiver.consume_crlf()
@@ -63,14 +189,38 @@ class TestReceiver(TestCase):
         self.assertEqual(self.receiver._idx, 7)
 
     def test_consume_crlf_missing(self):
-        self.receiver._buf = bytearray(b"Line1 without terminator")
+        self._load(b"Line1 without terminator")
         self.receiver._idx = 0
         
         with self.assertRaises(PartialResponseError):
             self.receiver.consume_crlf()
 
+    def test_consume_crlf_resumes_scan(self):
+        self._load(b"Line1\r")
+        self.receiver._idx = 0
+        
+        with self.assertRaises(PartialResponseError):
+            self.receiver.consume_crlf()
+        # Only the byte which might start a CRLF is scanned again.
+        self.assertEqual(self.receiver._scan_idx, 5)
+        
+        self._load(b"Line1\r\nLine2\r\n")
+        self.assertEqual(self.receiver.consume_crlf(), "Line1")
+        self.assertEqual(self.receiver.consume_crlf(), "Line2")
+
+    def test_consume_line(self):
+        self._load(b"+OK\r\n:1")
+        self.receiver._idx = 0
+        
+        line = self.receiver.consume_line()
+        self.assertEqual(type(line), bytes)
+        self.assertEqual(line, b"+OK")
+        self.assertEqual(self.receiver._idx, 5)
+        with self.assertRaises(PartialResponseError):
+            self.receiver.consume_line()
+
     def test_restore_buf(self):
-        self.receiver._buf = bytearray(b"12345")
+        self._load(b"12345")
         self.receiver._idx = 3
         
         self.receiver.restore_buf(1)
@@ -80,21 +230,42 @@ class TestReceiver(TestCase):
         """
         Test ValueError raising if the restoration index is greater than the current one.
         """
-        self.receiver._buf = bytearray(b"12345")
+        self._load(b"12345")
         self.receiver._idx = 3
         
         with self.assertRaises(ValueError):
             self.receiver.restore_buf(4)
 
+    def test_compact_consumed(self):
+        self._load(b"Consumed")
+        self.receiver._idx = 8
+        self.receiver.compact()
+        self.assertEqual(self.receiver.buf_size, 0)
+        self.assertEqual(self.receiver._idx, 0)
+
+    def test_compact_high_water(self):
+        self.receiver.high_water = 10
+        self._load(b"ConsumedRemaining")
+        self.receiver._idx = 8
+        
+        # Below the high-water mark, the remaining bytes are not moved.
+        self.receiver.compact()
+        self.assertEqual(self.receiver._idx, 8)
+        
+        self.receiver.compact(force=True)
+        self.assertEqual(self._received(), b"Remaining")
+        self.assertEqual(self.receiver._idx, 0)
+        self.assertEqual(self.receiver.consume(9), "Remaining")
+
     def test_cleanup_success(self):
-        self.receiver._buf = bytearray(b"Consumed")
+        self._load(b"Consumed")
         self.receiver._idx = 8
         self.receiver.cleanup()
-        self.assertEqual(self.receiver._buf, bytearray(b""))
+        self.assertEqual(self.receiver.buf_size, 0)
         self.assertEqual(self.receiver._idx, 0)
     
     def test_cleanup_error(self):
-        self.receiver._buf = bytearray(b"ConsumedRemaining")
+        self._load(b"ConsumedRemaining")
         # 8 bytes were consumed.
         self.receiver._idx = 8
         
@@ -1,5 +1,5 @@
 from unittest import TestCase
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from src.network.transport.sender import Sender
 
@@ -37,21 +37,60 @@ class TestSender(TestCase):
         with self.assertRaises(AssertionError):
             self.sender.rem_first_pending()
 
-    def test_shrink_first_pending(self):
-        self.sender.add_pending("HMSET myhash field1 value1 field2 value2")
+    def test_rem_first_pending_latency(self):
+        self.sender.add_pending("GET key")
+        
+        latency = self.sender.rem_first_pending()
+        self.assertGreaterEqual(latency, 0)
+
+    def test_stage_first_pending(self):
+        self.sender.add_pending("GET key")
+        
+        self.sender.stage_first_pending(b"*2\r\n$3\r\nGET\r\n$3\r\nkey\r\n")
+        self.assertFalse(self.sender.has_pending())
+        self.assertTrue(self.sender.has_outgoing())
         
-        self.sender.shrink_first_pending(b"field2 value2")
-        self.assertEqual(self.sender.get_first_pending(), b"field2 value2")
-         
-        self.sender.rem_first_pending()
         with self.assertRaises(AssertionError):
-            self.sender.rem_first_pending()
+            self.sender.stage_first_pending(b"")
+
+    def test_flush_gathers(self):
+        for cmd in ("SET a 1", "SET b 2", "SET c 3"):
+            self.sender.add_pending(cmd)
+            self.sender.stage_first_pending(cmd.encode())
+        self.mock_socket.sendmsg.return_value = 21
+        
+        latencies = self.sender.flush()
+        
+        # A single system call sends every staged command.
+        self.mock_socket.sendmsg.assert_called_once()
+        self.assertEqual([bytes(b) for b in self.mock_socket.sendmsg.call_args.args[0]],
+                         [b"SET a 1", b"SET b 2", b"SET c 3"])
+        self.assertEqual(len(latencies), 3)
+        self.assertFalse(self.sender.has_outgoing())
+
+    def test_flush_partial(self):
+        for cmd in ("SET a 1", "SET b 2"):
+            self.sender.add_pending(cmd)
+            self.sender.stage_first_pending(cmd.encode())
+        self.mock_socket.sendmsg.return_value = 10
+        
+        latencies = self.sender.flush()
+        self.assertEqual(len(latencies), 1)
+        
+        # The remaining bytes are sent by the next call.
+        self.mock_socket.sendmsg.return_value = 4
+        latencies = self.sender.flush()
+        self.assertEqual(bytes(self.mock_socket.sendmsg.call_args.args[0][0]), b" b 2")
+        self.assertEqual(len(latencies), 1)
+        self.assertFalse(self.sender.has_outgoing())
 
-    def test_send(self):
-        data = b"ZADD myzset 5 member"
-        self.mock_socket.send.return_value = len(data)
+    def test_flush_without_sendmsg(self):
+        self.sender.add_pending("PING")
+        self.sender.stage_first_pending(b"PING")
+        self.mock_socket.send.return_value = 4
         
-        sent = self.sender.send(data)
+        with patch.object(Sender, "_SENDMSG_SUPPORTED", False):
+            latencies = self.sender.flush()
         
-        self.mock_socket.send.assert_called_with(data)
-        self.assertEqual(sent, len(data))
+        self.mock_socket.send.assert_called_with(b"PING")
+        self.assertEqual(len(latencies), 1)
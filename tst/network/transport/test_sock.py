@@ -51,6 +51,17 @@ class TestSock(TestCase):
         self.assertEqual(sock._socket, mock_socket_instance)
         self.assertEqual(sock.addr, self.addr)
 
+    def test_init_rcvbuf(self):
+        mock_socket_instance = MagicMock()
+        self.mock_socket_cls.return_value = mock_socket_instance
+        self.mock_getaddrinfo.return_value = [
+            (socket.AF_INET, socket.SOCK_STREAM, 6, "", self.sockaddr)
+        ]
+
+        Sock(self.addr, rcvbuf=65536)
+
+        mock_socket_instance.setsockopt.assert_any_call(socket.SOL_SOCKET, socket.SO_RCVBUF, 65536)
+
     def test_init_fail_all_families(self):
         """
         Mocks are set to fail connection on all attempts.
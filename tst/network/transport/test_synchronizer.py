@@ -26,3 +26,68 @@ class TestSynchronizer(TestCase):
         self.assertIsNone(self.sync.last_raw_input)
         self.assertIsNone(self.sync.all_sent)
         self.assertIsNone(self.sync.all_recv)
+
+    def test_invalid_depth(self):
+        with self.assertRaises(ValueError):
+            Synchronizer(0)
+
+    def test_pipelining(self):
+        sync = Synchronizer(depth=2)
+        self.assertTrue(sync.can_sync())
+        
+        sync.sync_input("SET key 1")
+        sync.mark_sent()
+        self.assertTrue(sync.can_sync())
+        sync.sync_input("GET key")
+        self.assertFalse(sync.can_sync())
+        self.assertEqual(sync.in_flight_count(), 2)
+        
+        # The outputs are correlated in order.
+        self.assertTrue(sync.head_sent())
+        self.assertEqual(sync.sync_output(), "SET key 1")
+        self.assertFalse(sync.all_recv)
+        self.assertEqual(sync.last_raw_input, "GET key")
+        
+        # The newest input was not completely sent.
+        self.assertFalse(sync.head_sent())
+        sync.mark_sent()
+        self.assertEqual(sync.sync_output(), "GET key")
+        self.assertTrue(sync.all_recv)
+        self.assertIsNone(sync.sync_output())
+
+    def test_exclusive_input(self):
+        sync = Synchronizer(depth=4)
+        sync.sync_input("GET key")
+        self.assertFalse(sync.can_sync(exclusive=True))
+        
+        sync.sync_output()
+        sync.sync_input("HELLO 3", exclusive=True)
+        self.assertFalse(sync.can_sync())
+        
+        sync.sync_output()
+        self.assertTrue(sync.can_sync())
+
+    def test_unsync_newest(self):
+        sync = Synchronizer(depth=2)
+        sync.sync_input("GET a")
+        sync.mark_sent()
+        sync.sync_input("GET \"b")
+        sync.unsync()
+        
+        self.assertEqual(sync.in_flight_count(), 1)
+        self.assertEqual(sync.last_raw_input, "GET a")
+        self.assertTrue(sync.all_sent)
+        self.assertFalse(sync.all_recv)
+
+    def test_unsent_inputs(self):
+        sync = Synchronizer(depth=4)
+        sync.sync_input("GET a")
+        sync.sync_input("GET b")
+        
+        # Neither input was sent, so no output can belong to them.
+        self.assertFalse(sync.head_sent())
+        sync.mark_sent()
+        self.assertTrue(sync.head_sent())
+        self.assertFalse(sync.all_sent)
+        sync.mark_sent()
+        self.assertTrue(sync.all_sent)
@@ -0,0 +1,84 @@
+import marshal
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import patch
+
+from src.protocol import cmds_cache
+from src.protocol.cmds import CMD_FAMILIES
+from src.protocol.validator import _Matchers
+
+class TestCmdsCache(TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache_path = Path(self.tmp_dir.name) / "__pycache__" / "cmds.cache"
+        self.path_patch = patch.object(cmds_cache, "_CACHE_PATH", self.cache_path)
+        self.path_patch.start()
+
+    def tearDown(self):
+        self.path_patch.stop()
+        self.tmp_dir.cleanup()
+
+    def test_build_writes_cache(self):
+        index, blobs = cmds_cache.load()
+        self.assertTrue(self.cache_path.exists())
+        self.assertEqual(set(blobs), set(CMD_FAMILIES))
+        self.assertEqual(index["GET"], "string")
+        self.assertEqual(index["ZADD"], "sorted_set")
+
+        family = cmds_cache.load_family(blobs["string"])
+        name, keywords, transitions, accepting = family["SET"]
+        self.assertEqual(name, "SET")
+        self.assertIn("NX", keywords)
+
+    def test_load_reuses_cache(self):
+        cmds_cache.load()
+        with patch.object(cmds_cache, "build") as mock_build:
+            index, _ = cmds_cache.load()
+        mock_build.assert_not_called()
+        self.assertEqual(index["HSET"], "hash")
+
+    def test_stale_cache_is_rebuilt(self):
+        cmds_cache.load()
+        with open(self.cache_path, "rb") as file:
+            _, index, blobs = marshal.load(file)
+        with open(self.cache_path, "wb") as file:
+            marshal.dump(("stale", index, blobs), file)
+
+        with patch.object(cmds_cache, "build", wraps=cmds_cache.build) as mock_build:
+            cmds_cache.load()
+        mock_build.assert_called_once()
+
+    def test_source_change_changes_digest(self):
+        digest = cmds_cache._digest()
+        self.assertEqual(digest, cmds_cache._digest())
+        with patch.object(Path, "read_bytes", return_value=b"changed"):
+            self.assertNotEqual(digest, cmds_cache._digest())
+
+    def test_corrupted_cache_is_rebuilt(self):
+        self.cache_path.parent.mkdir()
+        self.cache_path.write_bytes(b"corrupted")
+        index, _ = cmds_cache.load()
+        self.assertEqual(index["GET"], "string")
+
+    def test_unwritable_cache(self):
+        with patch("src.protocol.cmds_cache.os.replace", side_effect=PermissionError("read-only")):
+            index, _ = cmds_cache.load()
+        self.assertEqual(index["GET"], "string")
+        self.assertFalse(self.cache_path.exists())
+
+class TestMatchers(TestCase):
+
+    def test_families_load_lazily(self):
+        matchers = _Matchers()
+        self.assertIsNotNone(matchers.get("GET"))
+        self.assertIsNotNone(matchers.get("SET"))
+        self.assertNotIn("string", matchers._blobs)
+        self.assertIn("hash", matchers._blobs)
+        self.assertNotIn("HSET", matchers._matchers)
+
+    def test_unknown_command(self):
+        matchers = _Matchers()
+        self.assertIsNone(matchers.get("CLIENT"))
+        self.assertFalse(matchers._matchers)
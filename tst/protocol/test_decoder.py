@@ -1,11 +1,13 @@
+from array import array
 from frozendict import frozendict
 from unittest import TestCase
 
 from src.core.exceptions import PartialResponseError
 
 from src.protocol.constants_resp import NULL
-from src.protocol.decoder import decoder
-from src.protocol.output import OutputStr, OutputErr, OutputSeq, OutputMap, OutputAtt
+from src.protocol.decoder import decoder, Decoder
+from src.protocol.output import OutputStr, OutputErr, OutputInt, OutputDbl, OutputBool, OutputSeq, OutputVec, \
+                               OutputMap, OutputAtt
 
 class MockReceiver:
     """
@@ -32,6 +34,31 @@ class MockReceiver:
         self.idx = end + 2
         return res
 
+    def consume_line(self) -> bytes:
+        return self.consume_crlf().encode()
+
+class CountingReceiver(MockReceiver):
+    """
+    Simulates a receiver whose data arrives in chunks.
+    Counts the consumed lines and payloads to detect re-parsing.
+    """
+    def __init__(self):
+        super().__init__("")
+        self.consumed = 0
+
+    def feed(self, data: str) -> None:
+        self.data += data
+
+    def consume(self, n: int) -> str:
+        res = super().consume(n)
+        self.consumed += 1
+        return res
+
+    def consume_crlf(self) -> str:
+        res = super().consume_crlf()
+        self.consumed += 1
+        return res
+
 class TestDecoder(TestCase):
     
     # ------------------------------
@@ -44,30 +71,65 @@ class TestDecoder(TestCase):
         expected = OutputStr("OK")
         self.assertEqual(actual, expected)
 
+    def test_shared_outputs(self):
+        # The most common replies are decoded into the same instances.
+        for response, expected in (("+OK\r\n", OutputStr("OK")), ("+QUEUED\r\n", OutputStr("QUEUED")),
+                                   (":0\r\n", OutputInt(0)), (":1\r\n", OutputInt(1)),
+                                   ("#t\r\n", OutputBool(True)), ("#f\r\n", OutputBool(False)),
+                                   ("_\r\n", OutputStr(NULL)), ("$-1\r\n", OutputStr(NULL))):
+            first = decoder(MockReceiver(response))
+            self.assertEqual(first, expected)
+            self.assertIs(decoder(MockReceiver(response)), first)
+
+        actual = decoder(MockReceiver("*2\r\n+OK\r\n+OK\r\n"))
+        self.assertIs(actual.values[0], actual.values[1])
+
     def test_integer(self):
         receiver = MockReceiver(":1000\r\n")
         actual = decoder(receiver)
-        expected = OutputStr("1000")
+        expected = OutputInt(1000)
         self.assertEqual(actual, expected)
 
     def test_boolean(self):
         receiver = MockReceiver("#t\r\n")
         actual = decoder(receiver)
-        expected = OutputStr("t")
+        expected = OutputBool(True)
         self.assertEqual(actual, expected)
+        self.assertNotEqual(actual, OutputInt(1))
 
     def test_double(self):
         receiver = MockReceiver(",1.23\r\n")
         actual = decoder(receiver)
-        expected = OutputStr("1.23")
+        expected = OutputDbl(1.23)
         self.assertEqual(actual, expected)
 
+    def test_double_text(self):
+        # Integral doubles are sent without a fraction.
+        self.assertEqual(decoder(MockReceiver(",10\r\n")), OutputDbl(10.0))
+        # Texts which the shortest round-trip form does not reproduce are kept.
+        actual = decoder(MockReceiver(",0.10000000000000001\r\n"))
+        self.assertEqual(actual, OutputDbl(0.1, "0.10000000000000001"))
+        self.assertEqual(decoder(MockReceiver(",1.0\r\n")), OutputDbl(1.0, "1.0"))
+
+    def test_double_special(self):
+        self.assertEqual(decoder(MockReceiver(",inf\r\n")), OutputDbl(float("inf")))
+        self.assertEqual(decoder(MockReceiver(",-inf\r\n")), OutputDbl(float("-inf")))
+        self.assertNotEqual(decoder(MockReceiver(",nan\r\n")).value, decoder(MockReceiver(",nan\r\n")).value)
+
     def test_big_number(self):
         receiver = MockReceiver("(3492890328409238509324850943850943825024385\r\n")
         actual = decoder(receiver)
-        expected = OutputStr("3492890328409238509324850943850943825024385")
+        expected = OutputInt(3492890328409238509324850943850943825024385)
         self.assertEqual(actual, expected)
 
+    def test_huge_big_number(self):
+        # More digits than int() converts; kept as text.
+        digits = "1" * 5000
+        receiver = MockReceiver(f"({digits}\r\n:1\r\n")
+        self.assertEqual(decoder(receiver), OutputStr(digits))
+        # The next reply is decoded as usual.
+        self.assertEqual(decoder(receiver), OutputInt(1))
+
     def test_simple_error(self):
         receiver = MockReceiver("-ERR unknown command\r\n")
         actual = decoder(receiver)
@@ -139,10 +201,36 @@ class TestDecoder(TestCase):
         actual = decoder(receiver)
         # Using frozendict
         expected = OutputMap(frozendict({
-            OutputStr("first"): OutputStr("1")
+            OutputStr("first"): OutputInt(1)
         }))
         self.assertEqual(actual, expected)
 
+    def test_packed_array_key(self):
+        receiver = MockReceiver("%1\r\n*2\r\n:1\r\n:2\r\n+v\r\n+OK\r\n")
+        actual = decoder(receiver)
+        expected = OutputMap(frozendict({OutputVec(array("q", [1, 2])): OutputStr("v")}))
+        self.assertEqual(actual, expected)
+        # Packed sequences of another type are other keys.
+        self.assertNotEqual(OutputVec(array("q", [1, 2])), OutputVec(array("d", [1.0, 2.0])))
+        # The next reply is decoded as usual.
+        self.assertEqual(decoder(receiver), OutputStr("OK"))
+
+    def test_packed_arrays(self):
+        actual = decoder(MockReceiver("*3\r\n:1\r\n:-2\r\n:3\r\n"))
+        self.assertEqual(actual, OutputVec(array("q", [1, -2, 3])))
+        actual = decoder(MockReceiver("~2\r\n,1.5\r\n,inf\r\n"))
+        self.assertEqual(actual, OutputVec(array("d", [1.5, float("inf")])))
+
+        # Mixed elements, doubles whose text is kept, and integers which do not fit 64 bits, are not packed.
+        actual = decoder(MockReceiver("*2\r\n,1.5\r\n,1.0\r\n"))
+        self.assertEqual(actual, OutputSeq((OutputDbl(1.5), OutputDbl(1.0, "1.0"))))
+        actual = decoder(MockReceiver("*2\r\n:1\r\n,1.5\r\n"))
+        self.assertEqual(actual, OutputSeq((OutputInt(1), OutputDbl(1.5))))
+        actual = decoder(MockReceiver("*2\r\n:1\r\n(99999999999999999999\r\n"))
+        self.assertEqual(actual, OutputSeq((OutputInt(1), OutputInt(99999999999999999999))))
+        actual = decoder(MockReceiver("*2\r\n#t\r\n#f\r\n"))
+        self.assertEqual(actual, OutputSeq((OutputBool(True), OutputBool(False))))
+
     def test_set_flat(self):
         receiver = MockReceiver("~2\r\n+a\r\n+b\r\n")
         actual = decoder(receiver)
@@ -225,12 +313,9 @@ class TestDecoder(TestCase):
         )
         actual = decoder(receiver)
 
-        # Frozendict containing a Tuple
+        # Frozendict containing a packed array
         expected = OutputMap(frozendict({
-            OutputStr("ListKey"): OutputSeq((
-                OutputStr("1"),
-                OutputStr("2")
-            ))
+            OutputStr("ListKey"): OutputVec(array("q", [1, 2]))
         }))
         self.assertEqual(actual, expected)
 
@@ -265,11 +350,11 @@ class TestDecoder(TestCase):
         }))
         expected_payload = OutputSeq((
             OutputMap(frozendict({
-                OutputStr('id'): OutputStr('1024'),
+                OutputStr('id'): OutputInt(1024),
                 OutputStr('addr'): OutputStr('127.0.0.1:54321')
             })),
             OutputMap(frozendict({
-                OutputStr('id'): OutputStr('1025'),
+                OutputStr('id'): OutputInt(1025),
                 OutputStr('addr'): OutputStr('127.0.0.1:54322')
             }))
         ))
@@ -302,3 +387,73 @@ class TestDecoder(TestCase):
         receiver = MockReceiver("+NotFinished")
         with self.assertRaises(PartialResponseError):
             decoder(receiver)
+
+    # ------------------------------
+    # ------ Resumable Decoder -----
+    # ------------------------------
+
+    def test_resume_byte_by_byte(self):
+        data = (
+            "|1\r\n"
+            "+key\r\n"
+            "$5\r\nvalue\r\n"
+            "*3\r\n"
+              "%1\r\n"
+                "+id\r\n"
+                ":1\r\n"
+              "!3\r\nERR\r\n"
+              "=10\r\ntxt:foobar\r\n"
+        )
+        expected = decoder(MockReceiver(data))
+        
+        receiver = CountingReceiver()
+        instance = Decoder(receiver)
+        actual = None
+        for char in data:
+            receiver.feed(char)
+            try:
+                actual = instance.decode()
+            except PartialResponseError:
+                self.assertTrue(actual is None)
+        
+        self.assertEqual(actual, expected)
+        self.assertFalse(instance.in_progress())
+        # Every line and payload was consumed exactly once.
+        # 9 header lines, 3 payloads and their 3 CRLFs.
+        self.assertEqual(receiver.consumed, 15)
+
+    def test_resume_keeps_bulk_length(self):
+        receiver = CountingReceiver()
+        instance = Decoder(receiver)
+        
+        receiver.feed("$10\r\nTooShort")
+        with self.assertRaises(PartialResponseError):
+            instance.decode()
+        self.assertTrue(instance.in_progress())
+        
+        receiver.feed("!!\r\n")
+        self.assertEqual(instance.decode(), OutputStr("TooShort!!"))
+
+    def test_consecutive_outputs(self):
+        receiver = MockReceiver("+OK\r\n*0\r\n%0\r\n")
+        instance = Decoder(receiver)
+        self.assertEqual(instance.decode(), OutputStr("OK"))
+        self.assertEqual(instance.decode(), OutputSeq(()))
+        self.assertEqual(instance.decode(), OutputMap(frozendict()))
+
+    def test_reset(self):
+        receiver = MockReceiver("*2\r\n+a\r\n")
+        instance = Decoder(receiver)
+        with self.assertRaises(PartialResponseError):
+            instance.decode()
+        
+        instance.reset()
+        self.assertFalse(instance.in_progress())
+
+    def test_deep_nesting(self):
+        depth = 100_000
+        output = decoder(MockReceiver("*1\r\n" * depth + "+a\r\n"))
+        for _ in range(depth):
+            self.assertIsInstance(output, OutputSeq)
+            output = output.values[0]
+        self.assertEqual(output, OutputStr("a"))
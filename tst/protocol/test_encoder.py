@@ -11,17 +11,17 @@ class TestEncoder(TestCase):
     def test_no_args(self):
         actual = encoder("PING", [])
         expected = (
-            "*1\r\n"
-            "$4\r\nPING\r\n"
+            b"*1\r\n"
+            b"$4\r\nPING\r\n"
         )
         self.assertEqual(actual, expected)
 
     def test_single_arg(self):
         actual = encoder("GET", ["mykey"])
         expected = (
-            "*2\r\n"
-            "$3\r\nGET\r\n"
-            "$5\r\nmykey\r\n"
+            b"*2\r\n"
+            b"$3\r\nGET\r\n"
+            b"$5\r\nmykey\r\n"
         )
         self.assertEqual(actual, expected)
 
@@ -29,11 +29,11 @@ class TestEncoder(TestCase):
         argv = ["key", "field1", "value1"]
         actual = encoder("HSET", argv)
         expected = (
-            "*4\r\n"
-            "$4\r\nHSET\r\n"
-            "$3\r\nkey\r\n"
-            "$6\r\nfield1\r\n"
-            "$6\r\nvalue1\r\n"
+            b"*4\r\n"
+            b"$4\r\nHSET\r\n"
+            b"$3\r\nkey\r\n"
+            b"$6\r\nfield1\r\n"
+            b"$6\r\nvalue1\r\n"
         )
         self.assertEqual(actual, expected)
 
@@ -43,10 +43,10 @@ class TestEncoder(TestCase):
         """
         actual = encoder("SET", ["key", ""])
         expected = (
-            "*3\r\n"
-            "$3\r\nSET\r\n"
-            "$3\r\nkey\r\n"
-            "$0\r\n\r\n"
+            b"*3\r\n"
+            b"$3\r\nSET\r\n"
+            b"$3\r\nkey\r\n"
+            b"$0\r\n\r\n"
         )
         self.assertEqual(actual, expected)
 
@@ -56,9 +56,9 @@ class TestEncoder(TestCase):
         """
         actual = encoder("ECHO", ["hello\nworld"])
         expected = (
-            "*2\r\n"
-            "$4\r\nECHO\r\n"
-            "$11\r\nhello\nworld\r\n"
+            b"*2\r\n"
+            b"$4\r\nECHO\r\n"
+            b"$11\r\nhello\nworld\r\n"
         )
         self.assertEqual(actual, expected)
     
@@ -83,18 +83,44 @@ class TestEncoder(TestCase):
                 "WITHSCORES" ]
 
         actual = encoder("ZUNION", argv)
-        expected = ("*12\r\n"
-                    "$6\r\nZUNION\r\n"
-                    "$1\r\n3\r\n"
-                    "$5\r\nzset1\r\n"
-                    "$5\r\nzset2\r\n"
-                    "$5\r\nzset3\r\n"
-                    "$7\r\nWEIGHTS\r\n"
-                    "$3\r\n2.5\r\n"
-                    "$1\r\n1\r\n"
-                    "$3\r\n0.1\r\n"
-                    "$9\r\nAGGREGATE\r\n"
-                    "$3\r\nMAX\r\n"
-                    "$10\r\nWITHSCORES\r\n" )
+        expected = (b"*12\r\n"
+                    b"$6\r\nZUNION\r\n"
+                    b"$1\r\n3\r\n"
+                    b"$5\r\nzset1\r\n"
+                    b"$5\r\nzset2\r\n"
+                    b"$5\r\nzset3\r\n"
+                    b"$7\r\nWEIGHTS\r\n"
+                    b"$3\r\n2.5\r\n"
+                    b"$1\r\n1\r\n"
+                    b"$3\r\n0.1\r\n"
+                    b"$9\r\nAGGREGATE\r\n"
+                    b"$3\r\nMAX\r\n"
+                    b"$10\r\nWITHSCORES\r\n" )
 
         self.assertEqual(actual, expected)
+
+    def test_utf8_arg(self):
+        """
+        The length of a bulk string is counted in bytes, not characters.
+        """
+        actual = encoder("SET", ["key", "café"])
+        expected = (
+            b"*3\r\n"
+            b"$3\r\nSET\r\n"
+            b"$3\r\nkey\r\n"
+            b"$5\r\ncaf\xc3\xa9\r\n"
+        )
+        self.assertEqual(actual, expected)
+
+    def test_bytes_arg(self):
+        """
+        Already encoded arguments are binary-safe.
+        """
+        actual = encoder(b"SET", [b"key", b"\x00\xff\r\n"])
+        expected = (
+            b"*3\r\n"
+            b"$3\r\nSET\r\n"
+            b"$3\r\nkey\r\n"
+            b"$4\r\n\x00\xff\r\n\r\n"
+        )
+        self.assertEqual(actual, expected)
@@ -0,0 +1,129 @@
+import importlib
+import sys
+from array import array
+from frozendict import frozendict
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from src.protocol.format_cache import FormatCache
+from src.protocol.formatter import formatter, formatter_window
+from src.protocol.output import OutputStr, OutputInt, OutputDbl, OutputBool, OutputSeq, OutputVec, OutputMap
+
+# The package exports a function of the same name as the module.
+formatter_module = importlib.import_module("src.protocol.formatter")
+
+class TestFormatCache(TestCase):
+
+    def test_hit_on_equal_key(self):
+        cache = FormatCache(1 << 20)
+        produce = MagicMock(return_value="1) a")
+        
+        self.assertEqual(cache.get(b"k", produce), "1) a")
+        self.assertEqual(cache.get(b"k", produce), "1) a")
+        
+        produce.assert_called_once()
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        # The key is accounted for along with the text.
+        self.assertEqual(cache.size, sys.getsizeof(b"k") + sys.getsizeof("1) a"))
+
+    def test_lru_eviction(self):
+        entry_size = sys.getsizeof(b"k1") + sys.getsizeof("a" * 100)
+        cache = FormatCache(entry_size * 2)
+        cache.get(b"k1", lambda: "a" * 100)
+        cache.get(b"k2", lambda: "b" * 100)
+        # The first key becomes the most recently used one.
+        cache.get(b"k1", lambda: "unused")
+        cache.get(b"k3", lambda: "c" * 100)
+        
+        self.assertEqual(cache.evictions, 1)
+        self.assertEqual(cache.size, entry_size * 2)
+        self.assertEqual(cache.get(b"k1", lambda: "unused"), "a" * 100)
+        self.assertEqual(cache.get(b"k2", lambda: "formatted again"), "formatted again")
+
+    def test_uncached(self):
+        cache = FormatCache(64)
+        # Larger than the whole cache.
+        cache.get(b"k", lambda: "a" * 100)
+        self.assertEqual(cache.size, 0)
+        self.assertEqual(cache.misses, 1)
+        
+        disabled = FormatCache(0)
+        disabled.get(b"k", lambda: "a")
+        disabled.get(b"k", lambda: "a")
+        self.assertEqual((disabled.hits, disabled.misses), (0, 0))
+
+    def test_window_entries(self):
+        cache = FormatCache(1 << 20)
+        cache.get(b"k", lambda: ("1) a", 1))
+        self.assertEqual(cache.get(b"k", lambda: None), ("1) a", 1))
+        self.assertEqual(cache.size, sys.getsizeof(b"k") + sys.getsizeof("1) a"))
+
+    def test_tuple_key_size(self):
+        cache = FormatCache(1 << 20)
+        key = (("",), OutputSeq, 1, OutputStr, "a" * 100)
+        cache.get(key, lambda: "1) a")
+        # The values are accounted for, but not the shared types.
+        expected = sys.getsizeof(key) + sys.getsizeof(("",)) + sys.getsizeof(1) + sys.getsizeof("a" * 100)
+        self.assertEqual(cache.size, expected + sys.getsizeof("1) a"))
+
+    def test_clear(self):
+        cache = FormatCache(1 << 20)
+        cache.get(b"k", lambda: "a")
+        cache.clear()
+        self.assertEqual((cache.size, cache.hits, cache.misses, cache.evictions), (0, 0, 0, 0))
+        self.assertEqual(cache.get(b"k", lambda: "b"), "b")
+
+class TestFormatterCache(TestCase):
+
+    def setUp(self):
+        self.cache = FormatCache(1 << 20)
+        patcher = patch.object(formatter_module, "format_cache", self.cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _output(self):
+        return OutputMap(frozendict({OutputStr("field"): OutputStr("value")}))
+
+    def test_formatter(self):
+        self.assertEqual(formatter(self._output()), "1) field\n2) value")
+        self.assertEqual(formatter(self._output()), "1) field\n2) value")
+        self.assertEqual(formatter(self._output(), "1) "), "1) 1) field\n   2) value")
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 2))
+
+    def test_formatter_window(self):
+        self.assertEqual(formatter_window(self._output(), 0, 1), ("1) field\n2) value", 1))
+        self.assertEqual(formatter_window(self._output(), 0, 1), ("1) field\n2) value", 1))
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_large_outputs_skip_cache(self):
+        output = OutputSeq(tuple(OutputStr("e") for _ in range(formatter_module._CACHE_MAX_ELEMENTS + 1)))
+        formatter(output)
+        formatter_window(output, 0, 10)
+        # Nested elements count as well.
+        nested = OutputSeq((OutputVec(array("q", range(formatter_module._CACHE_MAX_ELEMENTS))),))
+        formatter(nested)
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 0))
+
+    def test_leaves_skip_cache(self):
+        # Leaves and empty aggregates, such as the shared output of +OK, are formatted faster than looked up.
+        self.assertEqual(formatter(OutputStr("OK")), "OK")
+        self.assertEqual(formatter(OutputDbl(-0.0)), "-0")
+        self.assertEqual(formatter_window(OutputSeq(()), 0, 10), ("(empty sequence)", 1))
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 0))
+
+    def test_map_order(self):
+        # Equal maps, whose pairs were received in another order.
+        first = OutputMap(frozendict({OutputStr("f1"): OutputStr("v1"), OutputStr("f2"): OutputStr("v2")}))
+        second = OutputMap(frozendict({OutputStr("f2"): OutputStr("v2"), OutputStr("f1"): OutputStr("v1")}))
+        self.assertEqual(formatter(first), "1) f1\n2) v1\n3) f2\n4) v2")
+        self.assertEqual(formatter(second), "1) f2\n2) v2\n3) f1\n4) v1")
+        self.assertEqual(self.cache.hits, 0)
+
+    def test_typed_elements(self):
+        # Equal values, formatted differently.
+        self.assertEqual(formatter(OutputSeq((OutputDbl(0.0),))), "1) 0")
+        self.assertEqual(formatter(OutputSeq((OutputDbl(-0.0),))), "1) -0")
+        self.assertEqual(formatter(OutputVec(array("d", [-0.0]))), "1) -0")
+        self.assertEqual(formatter(OutputSeq((OutputInt(1),))), "1) 1")
+        self.assertEqual(formatter(OutputSeq((OutputBool(True),))), "1) t")
+        self.assertEqual(self.cache.hits, 0)
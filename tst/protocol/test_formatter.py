@@ -1,8 +1,10 @@
+from array import array
 from frozendict import frozendict
 from unittest import TestCase
 
-from src.protocol.formatter import formatter
-from src.protocol.output import Output, OutputStr, OutputErr, OutputSeq, OutputMap, OutputAtt
+from src.protocol.formatter import formatter, formatter_lines, formatter_chunks, formatter_window, _Traversal
+from src.protocol.output import Output, OutputStr, OutputErr, OutputInt, OutputDbl, OutputBool, OutputSeq, OutputVec, \
+                               OutputMap, OutputAtt
 
 class TestFormatter(TestCase):
 
@@ -22,6 +24,19 @@ class TestFormatter(TestCase):
         expected = "ERR"
         self.assertEqual(actual, expected)
     
+    def test_output_typed_scalars(self):
+        self.assertEqual(formatter(OutputInt(-12)), "-12")
+        self.assertEqual(formatter(OutputInt(3492890328409238509324850943850943825024385)),
+                         "3492890328409238509324850943850943825024385")
+        self.assertEqual(formatter(OutputDbl(1.5)), "1.5")
+        self.assertEqual(formatter(OutputDbl(float("-inf"))), "-inf")
+        # Doubles are displayed as sent by the server.
+        self.assertEqual(formatter(OutputDbl(10.0)), "10")
+        self.assertEqual(formatter(OutputDbl(-0.0)), "-0")
+        self.assertEqual(formatter(OutputDbl(0.1, "0.10000000000000001")), "0.10000000000000001")
+        self.assertEqual(formatter(OutputBool(True)), "t")
+        self.assertEqual(formatter(OutputBool(False)), "f")
+
     # ------------------------------
     # --------- Sequences ----------
     # ------------------------------
@@ -212,6 +227,22 @@ class TestFormatter(TestCase):
         )
         self.assertEqual(expected, actual, f"cacat {actual}")
 
+    def test_output_vec(self):
+        input_obj = OutputSeq((
+            OutputStr("scores"),
+            OutputVec(array("d", [1.5, 2.0])),
+            OutputVec(array("q", [7]))
+        ))
+        actual = formatter(input_obj)
+        expected = (
+            "1) scores\n"
+            "2) 1) 1.5\n"
+            "   2) 2\n"
+            "3) 1) 7"
+        )
+        self.assertEqual(actual, expected)
+        self.assertEqual(formatter(OutputVec(array("q", [1, 2]))), "1) 1\n2) 2")
+
     def test_unknown_output_type(self):
         """Test assertion error for unknown output types."""
         class UnknownOutput(Output):
@@ -219,3 +250,153 @@ class TestFormatter(TestCase):
             
         with self.assertRaises(AssertionError):
             formatter(UnknownOutput())
+
+    def test_deep_nesting(self):
+        depth = 100_000
+        output = OutputStr("leaf")
+        for _ in range(depth):
+            output = OutputSeq((output,))
+        self.assertEqual(formatter(output), "1) " * depth + "leaf")
+
+        output = OutputSeq((output, OutputStr("last")))
+        self.assertTrue(formatter(output).endswith("leaf\n2) last"))
+
+        # Attributes without pairs are skipped, without recursing either.
+        output = OutputStr("leaf")
+        for _ in range(depth):
+            output = OutputAtt(OutputMap(frozendict()), output)
+        self.assertEqual(formatter(output), "leaf")
+
+    def test_leaves_after_nested(self):
+        # The leaves following a nested aggregate are written after it.
+        output = OutputSeq((
+            OutputStr("a"),
+            OutputSeq((OutputStr("b"), OutputSeq(()))),
+            OutputStr("c"),
+            OutputMap(frozendict()),
+            OutputStr("d")
+        ))
+        expected = (
+            "1) a\n"
+            "2) 1) b\n"
+            "   2) (empty sequence)\n"
+            "3) c\n"
+            "4) (empty map)\n"
+            "5) d"
+        )
+        self.assertEqual(formatter(output), expected)
+
+class CountingValues(list):
+    """
+    The elements of a sequence, counting how many of them were iterated.
+    """
+    def __init__(self, values):
+        super().__init__(values)
+        self.iterated = 0
+
+    def __iter__(self):
+        for value in super().__iter__():
+            self.iterated += 1
+            yield value
+
+class TestLazyFormatter(TestCase):
+
+    def _output(self):
+        return OutputSeq((
+            OutputStr("a"),
+            OutputMap(frozendict({OutputStr("k"): OutputSeq((OutputStr("v"), OutputInt(2)))})),
+            OutputVec(array("d", [1.5] * 3000)),
+            OutputAtt(OutputMap(frozendict({OutputStr("ttl"): OutputInt(5)})), OutputStr("payload")),
+            OutputSeq(tuple(OutputStr(f"e{idx}") for idx in range(3000)))
+        ))
+
+    def test_lines_match_formatter(self):
+        output = self._output()
+        self.assertEqual("\n".join(formatter_lines(output)), formatter(output))
+        self.assertEqual("\n".join(formatter_lines(output, "1) ")), formatter(output, "1) "))
+        self.assertEqual(list(formatter_lines(OutputStr(""))), [""])
+
+    def test_chunks_match_formatter(self):
+        output = self._output()
+        chunks = list(formatter_chunks(output, chunk_size=100))
+        self.assertEqual("".join(chunks), formatter(output))
+        self.assertTrue(all(len(chunk) == 100 for chunk in chunks[:-1]))
+        self.assertEqual(list(formatter_chunks(OutputStr(""))), [])
+
+    def test_lines_are_lazy(self):
+        values = CountingValues(OutputStr(f"e{idx}") for idx in range(100_000))
+        lines = formatter_lines(OutputSeq(values))
+        self.assertEqual(next(lines), "1) e0")
+        self.assertEqual(next(lines), "2) e1")
+        # Only the elements of the first flushed piece were formatted.
+        self.assertLess(values.iterated, 10_000)
+
+        self.assertEqual(sum(1 for _ in lines), 100_000 - 2)
+        self.assertEqual(values.iterated, 100_000)
+
+class TestFormatterWindow(TestCase):
+
+    def test_seq_window(self):
+        output = OutputSeq((
+            OutputStr("a"),
+            OutputSeq((OutputStr("b"), OutputStr("c"))),
+            OutputStr("d"),
+            OutputSeq(())
+        ))
+        self.assertEqual(formatter_window(output, 0, 2), ("1) a\n2) 1) b\n   2) c", 4))
+        self.assertEqual(formatter_window(output, 1, 2), ("2) 1) b\n   2) c\n3) d", 4))
+        self.assertEqual(formatter_window(output, 3, 10), ("4) (empty sequence)", 4))
+        self.assertEqual(formatter_window(output, 4, 10), ("", 4))
+        self.assertEqual(formatter_window(output, 1, 1, "1) "), ("   2) 1) b\n      2) c", 4))
+
+    def test_map_window(self):
+        output = OutputMap(frozendict({
+            OutputStr("k1"): OutputStr("v1"),
+            OutputStr("k2"): OutputSeq((OutputStr("x"), OutputStr("y"))),
+            OutputStr("k3"): OutputStr("v3")
+        }))
+        # The pairs keep the numbering of their keys and values.
+        self.assertEqual(formatter_window(output, 1, 1), ("3) k2\n4) 1) x\n   2) y", 3))
+        self.assertEqual(formatter_window(output, 2, 5), ("5) k3\n6) v3", 3))
+
+    def test_vec_window(self):
+        output = OutputVec(array("q", range(10)))
+        self.assertEqual(formatter_window(output, 0, 2), ("1) 0\n2) 1", 10))
+        self.assertEqual(formatter_window(output, 8, 5), ("9) 8\n10) 9", 10))
+
+    def test_single_element(self):
+        output = OutputAtt(OutputMap(frozendict({OutputStr("ttl"): OutputInt(5)})), OutputStr("payload"))
+        self.assertEqual(formatter_window(output, 0, 1), (formatter(output), 1))
+        self.assertEqual(formatter_window(output, 1, 1), ("", 1))
+        self.assertEqual(formatter_window(OutputSeq(()), 0, 1), ("(empty sequence)", 1))
+
+    def test_windows_make_up_formatter(self):
+        output = TestLazyFormatter()._output()
+        for count in (1, 2, 1000):
+            windows = [formatter_window(output, start, count)[0] for start in range(0, 5, count)]
+            self.assertEqual("\n".join(windows), formatter(output))
+
+    def test_window_is_bounded(self):
+        values = CountingValues(OutputStr(f"e{idx}") for idx in range(100_000))
+        text, total = formatter_window(OutputSeq(values), 100, 200)
+        self.assertEqual(total, 100_000)
+        self.assertEqual(len(text.split("\n")), 200)
+        # The window is sliced out; the sequence itself is never iterated.
+        self.assertEqual(values.iterated, 0)
+
+    def test_negative_window(self):
+        with self.assertRaises(ValueError):
+            formatter_window(OutputSeq(()), -1, 1)
+        with self.assertRaises(ValueError):
+            formatter_window(OutputSeq(()), 0, -1)
+
+class TestTraversal(TestCase):
+
+    def test_incomplete_traversal(self):
+        class LeafOnlyTraversal(_Traversal):
+            def leaf(self, item):
+                return str(item)
+
+        # An incomplete traversal fails once created, not while formatting a reply.
+        with self.assertRaises(TypeError):
+            LeafOnlyTraversal(0)
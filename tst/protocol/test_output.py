@@ -1,7 +1,8 @@
+from dataclasses import FrozenInstanceError
 from frozendict import frozendict
 from unittest import TestCase
 
-from src.protocol.output import OutputStr, OutputSeq, OutputMap
+from src.protocol.output import OutputStr, OutputErr, OutputSeq, OutputMap, OutputAtt
 
 class TestOutput(TestCase):
     
@@ -55,3 +56,18 @@ class TestOutput(TestCase):
             "      2) 2"
         )
         self.assertEqual(str(output), expected)
+
+    def test_no_instance_dict(self):
+        value = OutputStr("v")
+        outputs = (value, OutputErr("e"), OutputSeq((value,)),
+                   OutputMap(frozendict({value: value})),
+                   OutputAtt(OutputMap(frozendict()), value))
+        for output in outputs:
+            self.assertFalse(hasattr(output, "__dict__"), type(output))
+
+    def test_frozen(self):
+        output = OutputStr("v")
+        with self.assertRaises(FrozenInstanceError):
+            output.value = "w"
+        self.assertEqual(output, OutputStr("v"))
+        self.assertEqual(hash(output), hash(OutputStr("v")))
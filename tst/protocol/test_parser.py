@@ -1,6 +1,7 @@
 from unittest import TestCase
 
-from src.protocol.parser import parser
+from src.protocol.encoder import encoder
+from src.protocol.parser import parser, parse_encode
 from src.protocol.exceptions import QuoteError, SpaceError, ParserError
 
 class TestParser(TestCase):
@@ -105,3 +106,28 @@ class TestParser(TestCase):
         _, argv = parser(inputs[5]); self.assertEqual(argv[1], " \' \\ ")
         _, argv = parser(inputs[6]); self.assertEqual(argv[1], " \\n \\r \\t \\b \\a ")
         _, argv = parser(inputs[7]); self.assertEqual(argv[1], " \\ \\ a ")
+
+
+class TestParseEncode(TestCase):
+    """
+    The fused path must encode exactly what the regular one does.
+    """
+
+    def test_matches_two_steps(self):
+        inputs = [
+            "set dada 1",
+            "   set    dada  1 ",
+            "incr",
+            "   ",
+            "SET key café",
+            "set dada \"new text\"",
+            "set dada ' \\' \\\\ ' ",
+            "SET\tkey value",
+        ]
+        for input in inputs:
+            self.assertEqual(parse_encode(input), encoder(*parser(input)))
+
+    def test_errors(self):
+        self.assertRaises(ValueError, lambda: parse_encode("12"))
+        self.assertRaises(QuoteError, lambda: parse_encode("set da\"d\"a 1"))
+        self.assertRaises(SpaceError, lambda: parse_encode("set \"dada\"1"))
@@ -0,0 +1,240 @@
+from array import array
+from frozendict import frozendict
+from unittest import TestCase
+from unittest.mock import patch
+
+from src.core.exceptions import PartialResponseError
+
+from src.protocol.constants_resp import NULL
+from src.protocol.decoder import decoder, Decoder
+from src.protocol.formatter import formatter, formatter_window
+from src.protocol.output import OutputStr, OutputErr, OutputInt, OutputDbl, OutputBool, OutputSeq, OutputVec, \
+                               OutputMap, OutputAtt
+from src.protocol.tape import Tape, TapeDecoder, TapeStr, TapeErr, TapeInt, TapeDbl, TapeBool, TapeSeq, TapeMap, TapeAtt
+
+from .test_decoder import MockReceiver
+
+class BytesReceiver:
+    """
+    Simulates the framing interface of the Receiver class for testing the tape decoder.
+    Positions are relative to the first unconsumed byte.
+    """
+    def __init__(self, data: bytes = b""):
+        self.data = data
+        self.idx = 0
+
+    def feed(self, data: bytes) -> None:
+        self.data += data
+
+    def ensure(self, n: int) -> None:
+        if self.idx + n > len(self.data):
+            raise PartialResponseError(f"Insufficient buffer bytes. Needed {n}, has {len(self.data) - self.idx}")
+
+    def find_crlf(self, start: int) -> int:
+        try:
+            return self.data.index(b"\r\n", self.idx + start) - self.idx
+        except ValueError:
+            raise PartialResponseError("Buffer does not contain a CRLF")
+
+    def peek(self, start: int, end: int) -> bytes:
+        self.ensure(end)
+        return self.data[self.idx + start : self.idx + end]
+
+    def consume_bytes(self, n: int) -> bytes:
+        self.ensure(n)
+        res = self.data[self.idx : self.idx + n]
+        self.idx += n
+        return res
+
+class TestTapeDecoder(TestCase):
+
+    _RESPONSES = (
+        "+OK\r\n", "-ERR bad\r\n", ":-12\r\n", "_\r\n", "#t\r\n", ",1.5\r\n", "(123456789\r\n",
+        "$5\r\nhello\r\n", "$0\r\n\r\n", "$-1\r\n", "!3\r\nerr\r\n", "=10\r\ntxt:foobar\r\n",
+        "*0\r\n", "*-1\r\n", "*2\r\n:1\r\n$1\r\na\r\n", "~1\r\n+x\r\n", ">2\r\n+push\r\n:1\r\n",
+        "%2\r\n+k\r\n:1\r\n+k2\r\n*2\r\n:1\r\n*1\r\n_\r\n",
+        "%0\r\n",
+        "|1\r\n+ttl\r\n:5\r\n*2\r\n+a\r\n+b\r\n",
+        "*3\r\n*2\r\n:1\r\n:2\r\n%1\r\n+k\r\n*0\r\n$2\r\nhi\r\n",
+        f"({'1' * 5000}\r\n", f"*2\r\n:1\r\n(-{'1' * 5000}\r\n",
+        "%1\r\n*2\r\n:1\r\n:2\r\n+v\r\n",
+        "%3\r\n+k\r\n:1\r\n+j\r\n:2\r\n$1\r\nk\r\n:3\r\n", "|2\r\n+a\r\n:1\r\n+a\r\n:2\r\n+p\r\n",
+        "%2\r\n*1\r\n:1\r\n+x\r\n*1\r\n:1\r\n+y\r\n",
+        ",10\r\n", ",0.10000000000000001\r\n", "*2\r\n,1.5\r\n,1e+300\r\n", "*2\r\n,10\r\n,1.0\r\n",
+    )
+
+    def _decode(self, response: str):
+        return TapeDecoder(BytesReceiver(response.encode())).decode()
+
+    def test_matches_tree(self):
+        for response in TestTapeDecoder._RESPONSES:
+            tree = Decoder(MockReceiver(response)).decode()
+            view = self._decode(response)
+            self.assertEqual(view.to_output(), tree, response)
+            self.assertEqual(formatter(view), formatter(tree), response)
+            self.assertEqual(formatter_window(view, 1, 1), formatter_window(tree, 1, 1), response)
+
+    def test_repeated_key(self):
+        response = "%3\r\n+k\r\n:1\r\n+j\r\n:2\r\n$1\r\nk\r\n:3\r\n"
+        view = self._decode(response)
+        # The key keeps its first position, along with its last value, as in the tree.
+        self.assertEqual(len(view.values), 2)
+        self.assertEqual(list(view.values.items()), [(OutputStr("k"), OutputInt(3)), (OutputStr("j"), OutputInt(2))])
+        self.assertEqual(formatter(view), "1) k\n2) 3\n3) j\n4) 2")
+        self.assertEqual(formatter(view), formatter(Decoder(MockReceiver(response)).decode()))
+
+    def test_view_types(self):
+        self.assertIsInstance(self._decode("+OK\r\n"), TapeStr)
+        self.assertIsInstance(self._decode("!3\r\nerr\r\n"), TapeErr)
+        self.assertIsInstance(self._decode("~1\r\n+x\r\n"), TapeSeq)
+        self.assertIsInstance(self._decode("%0\r\n"), TapeMap)
+        self.assertIsInstance(self._decode("|0\r\n+x\r\n"), TapeAtt)
+        self.assertIsInstance(self._decode(":1\r\n"), TapeInt)
+        self.assertIsInstance(self._decode("(1\r\n"), TapeInt)
+        self.assertIsInstance(self._decode(",1\r\n"), TapeDbl)
+        self.assertIsInstance(self._decode("#f\r\n"), TapeBool)
+
+    def test_typed_views(self):
+        self.assertEqual(self._decode(":-12\r\n"), OutputInt(-12))
+        self.assertEqual(OutputDbl(1.5), self._decode(",1.5\r\n"))
+        self.assertEqual(OutputDbl(1.0, "1.0"), self._decode(",1.0\r\n"))
+        self.assertNotEqual(OutputDbl(1.0), self._decode(",1.0\r\n"))
+        self.assertEqual(hash(self._decode("#f\r\n")), hash(OutputBool(False)))
+        self.assertIs(self._decode("#f\r\n").value, False)
+        self.assertNotEqual(self._decode(":1\r\n"), OutputStr("1"))
+
+    def test_tape_layout(self):
+        view = self._decode("*2\r\n*1\r\n:7\r\n$-1\r\n")
+        tape = view.tape
+        self.assertEqual(list(tape.lengths), [2, 1, 1, 0])
+        # Every entry points past its own elements.
+        self.assertEqual(list(tape.nexts), [4, 3, 3, 4])
+        self.assertEqual(tape.data[tape.offsets[2] : tape.offsets[2] + tape.lengths[2]], b"7")
+        self.assertEqual(tape.text(3), NULL)
+
+    def test_view_api(self):
+        view = self._decode("*3\r\n:1\r\n*1\r\n+a\r\n$1\r\nb\r\n")
+        values = view.values
+        self.assertEqual(len(values), 3)
+        self.assertEqual(values[-1], OutputStr("b"))
+        self.assertEqual([value.value for value in values[::2]], [1, "b"])
+        self.assertEqual(list(values[1].values), [OutputStr("a")])
+
+        view = self._decode("%2\r\n+k\r\n:1\r\n-k\r\n:2\r\n")
+        self.assertEqual(len(view.values), 2)
+        self.assertEqual(view.values[OutputStr("k")], OutputInt(1))
+        self.assertEqual(view.values[OutputErr("k")], OutputInt(2))
+        self.assertEqual(list(view.values), [OutputStr("k"), OutputErr("k")])
+        with self.assertRaises(KeyError):
+            view.values[OutputStr("missing")]
+
+        view = self._decode("|1\r\n+ttl\r\n:5\r\n+payload\r\n")
+        self.assertEqual(dict(view.attributes.values.items()), {OutputStr("ttl"): OutputInt(5)})
+        self.assertEqual(view.payload, OutputStr("payload"))
+
+    def test_views_equal_outputs(self):
+        self.assertEqual(self._decode("+OK\r\n"), OutputStr("OK"))
+        self.assertEqual(OutputStr("OK"), self._decode("+OK\r\n"))
+        self.assertNotEqual(self._decode("-OK\r\n"), OutputStr("OK"))
+        self.assertEqual(hash(self._decode("$2\r\nOK\r\n")), hash(OutputStr("OK")))
+        self.assertEqual(self._decode("%1\r\n+k\r\n+v\r\n").to_output(),
+                         OutputMap(frozendict({OutputStr("k"): OutputStr("v")})))
+        self.assertEqual(self._decode("|0\r\n:1\r\n").to_output(),
+                         OutputAtt(OutputMap(frozendict()), OutputInt(1)))
+        self.assertEqual(self._decode("*2\r\n:1\r\n:2\r\n").to_output(), OutputVec(array("q", [1, 2])))
+
+    def test_resumes_partial_response(self):
+        response = b"*3\r\n$5\r\nhello\r\n*1\r\n:1\r\n+end\r\n"
+        receiver = BytesReceiver()
+        decoder = TapeDecoder(receiver)
+        for byte in response[:-1]:
+            receiver.feed(bytes([byte]))
+            with self.assertRaises(PartialResponseError):
+                decoder.decode()
+            # Nothing is consumed before the response is complete.
+            self.assertEqual(receiver.idx, 0)
+
+        receiver.feed(response[-1:])
+        self.assertTrue(decoder.in_progress())
+        view = decoder.decode()
+        self.assertFalse(decoder.in_progress())
+        self.assertEqual(receiver.idx, len(response))
+        self.assertEqual(view.tape.data, response)
+        self.assertEqual(view.to_output(), Decoder(MockReceiver(response.decode())).decode())
+
+    def test_consecutive_responses(self):
+        receiver = BytesReceiver(b"+a\r\n*1\r\n+b\r\n:3\r\n")
+        decoder = TapeDecoder(receiver)
+        self.assertEqual(decoder.decode(), OutputStr("a"))
+        self.assertEqual(decoder.decode().to_output(), OutputSeq((OutputStr("b"),)))
+        self.assertEqual(decoder.decode(), OutputInt(3))
+
+    def test_reset(self):
+        receiver = BytesReceiver(b"*2\r\n+a\r\n")
+        decoder = TapeDecoder(receiver)
+        with self.assertRaises(PartialResponseError):
+            decoder.decode()
+        decoder.reset()
+        self.assertFalse(decoder.in_progress())
+
+    def test_deep_nesting(self):
+        depth = 100_000
+        view = self._decode("*1\r\n" * depth + "%1\r\n+k\r\n+v\r\n")
+        self.assertEqual(formatter(view), "1) " * depth + "1) k\n" + " " * (3 * depth) + "2) v")
+
+        output = view.to_output()
+        for _ in range(depth):
+            output = output.values[0]
+        self.assertEqual(output, OutputMap(frozendict({OutputStr("k"): OutputStr("v")})))
+
+    def test_unknown_type(self):
+        with self.assertRaises(KeyError):
+            self._decode("?1\r\n")
+
+class TestLazyViews(TestCase):
+
+    def _decode(self, response: bytes):
+        return decoder(BytesReceiver(response), lazy=True)
+
+    def test_len_decodes_nothing(self):
+        view = self._decode(b"*3\r\n*1\r\n+a\r\n%1\r\n+k\r\n+v\r\n$1\r\nb\r\n")
+        with patch.object(Tape, "text", wraps=view.tape.text) as text, \
+             patch.object(Tape, "children", wraps=view.tape.children) as children:
+            self.assertEqual(len(view.values), 3)
+            self.assertEqual(len(view.values[1].values), 1)
+        # Only the position of the nested map was located.
+        text.assert_not_called()
+        self.assertEqual(children.call_count, 1)
+
+    def test_access_decodes_once(self):
+        view = self._decode(b"*3\r\n+a\r\n+b\r\n+c\r\n")
+        with patch.object(Tape, "text", wraps=view.tape.text) as text:
+            first = view.values[0]
+            self.assertIs(view.values[0], first)
+            self.assertEqual(first.value, "a")
+            self.assertEqual(first.value, "a")
+            self.assertEqual(text.call_count, 1)
+
+            self.assertEqual([element.value for element in view.values[-2:]], ["b", "c"])
+            self.assertEqual(text.call_count, 3)
+
+    def test_slicing_and_iteration(self):
+        view = self._decode(b"*4\r\n:0\r\n*1\r\n:1\r\n:2\r\n:3\r\n")
+        values = view.values
+        self.assertEqual([element.value for element in values[::2]], [0, 2])
+        self.assertEqual(values[1:2][0].to_output(), OutputVec(array("q", [1])))
+        self.assertEqual(values[5:], ())
+        self.assertEqual(len(list(values)), 4)
+        with self.assertRaises(IndexError):
+            values[4]
+
+    def test_map_pairs(self):
+        view = self._decode(b"%2\r\n+a\r\n:1\r\n+b\r\n*0\r\n")
+        pairs = view.values
+        self.assertEqual(len(pairs), 2)
+        self.assertEqual([key.value for key in pairs], ["a", "b"])
+        self.assertIs(pairs[OutputStr("b")], pairs[OutputStr("b")])
+
+    def test_eager_by_default(self):
+        self.assertEqual(type(decoder(MockReceiver("+OK\r\n"))), OutputStr)
+        self.assertIsInstance(self._decode(b"+OK\r\n"), TapeStr)
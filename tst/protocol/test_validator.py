@@ -0,0 +1,103 @@
+from unittest import TestCase
+
+from src.protocol.cmds import CMDS, Vitals, Opts, OptSet, Variadic, KeyedVariadic, VariadicKey, \
+                              ArgEzz, ArgInt, ArgFlt, ArgStr, ArgSet
+from src.protocol.cmds_compiler import _Compiler
+from src.protocol.validator import validator, _Matcher, _MATCHERS
+from src.protocol.exceptions import ArityError, ArgumentError, ValidatorError
+
+class TestValidator(TestCase):
+
+    def _assert_valid(self, *inputs: str) -> None:
+        for input in inputs:
+            cmd, *argv = input.split()
+            validator(cmd, argv)
+
+    def _assert_invalid(self, error: type, *inputs: str) -> None:
+        for input in inputs:
+            cmd, *argv = input.split()
+            with self.assertRaises(error, msg=input):
+                validator(cmd, argv)
+
+    def test_every_command_is_compiled(self):
+        for cmd_dict in CMDS:
+            for name in cmd_dict:
+                self.assertIsNotNone(_MATCHERS.get(name), name)
+        self.assertIsNone(_MATCHERS.get("CLIENT"))
+
+    def test_case_insensitive(self):
+        self._assert_valid("set k v", "Set k v nx Ex 10", "SET k v EX 10 NX GET")
+
+    def test_unknown_command(self):
+        # Commands missing from the tables are left for the server.
+        self._assert_valid("CLIENT LIST", "SELECT 0", "FOO bar baz")
+
+    def test_arity(self):
+        self._assert_invalid(ArityError, "GET", "SET k", "SET k v EX", "HSET h f v f2", "LMPOP 2 a b")
+        self._assert_invalid(ArgumentError, "GET k k2", "RANDOMKEY x", "PING x y", "LPOP k 1 2")
+
+    def test_numbers(self):
+        self._assert_valid("EXPIRE k -10", "INCRBYFLOAT k 1.5e3", "ZADD z +inf a -inf b .5 c", "BLPOP a b 0.5")
+        self._assert_invalid(ArgumentError, "EXPIRE k ten", "EXPIRE k 1.5", "INCRBYFLOAT k nan", "ZADD z 1x a")
+
+    def test_keywords(self):
+        self._assert_valid("LMOVE a b LEFT right", "GETEX k PERSIST", "GETEX k PX 100")
+        self._assert_invalid(ArgumentError, "LMOVE a b UP LEFT", "SET k v FOO", "GETEX k PERSIST EX 1")
+
+    def test_options_any_order(self):
+        self._assert_valid("ZADD z NX CH 1 a 2 b",
+                           "ZADD z CH NX 1 a",
+                           "HELLO 3 SETNAME n AUTH u p",
+                           "SORT k ALPHA GET a BY x GET b LIMIT 0 10 DESC STORE d",
+                           "ZRANGE z (1 5 LIMIT 0 10 BYSCORE",
+                           "MSETEX 1 k v NX EX 10")
+
+    def test_variadic(self):
+        self._assert_valid("DEL a", "DEL a b c d", "HSET h f v f2 v2 f3 v3",
+                           "ZUNION 2 a b WEIGHTS 1 2.5 AGGREGATE SUM WITHSCORES")
+        self._assert_invalid(ArgumentError, "ZUNION two a b")
+        self._assert_invalid(ArityError, "MSET k v k2 v2 k3")
+
+    def test_errors_are_validator_errors(self):
+        self._assert_invalid(ValidatorError, "GET", "EXPIRE k ten")
+
+class TestCompiler(TestCase):
+
+    def _match(self, sections: tuple, input: str) -> bool:
+        matcher = _Matcher(*_Compiler("CMD", sections).build())
+        try:
+            matcher.match(input.split())
+        except ValidatorError:
+            return False
+        return True
+
+    def test_opts_all_or_nothing(self):
+        sections = (Vitals(ArgEzz()), Opts(ArgStr("LIMIT"), ArgInt(), ArgInt()))
+        self.assertTrue(self._match(sections, "k"))
+        self.assertTrue(self._match(sections, "k LIMIT 1 2"))
+        self.assertFalse(self._match(sections, "k LIMIT 1"))
+
+    def test_opt_set_at_most_one(self):
+        sections = (Vitals(ArgEzz()), OptSet(Opts(ArgStr("A")), Opts(ArgStr("B"), ArgFlt())))
+        self.assertTrue(self._match(sections, "k"))
+        self.assertTrue(self._match(sections, "k A"))
+        self.assertTrue(self._match(sections, "k B 1.5"))
+        self.assertFalse(self._match(sections, "k A B 1.5"))
+
+    def test_variadic_cycle(self):
+        sections = (Vitals(ArgEzz()), Variadic(ArgEzz(), ArgInt()))
+        self.assertTrue(self._match(sections, "k"))
+        self.assertTrue(self._match(sections, "k a 1 b 2"))
+        self.assertFalse(self._match(sections, "k a 1 b"))
+
+    def test_keyed_variadic(self):
+        sections = (Vitals(ArgEzz()), KeyedVariadic(VariadicKey(ArgSet("KEYS")), ArgEzz()))
+        self.assertTrue(self._match(sections, "k"))
+        self.assertTrue(self._match(sections, "k keys a b c"))
+        self.assertFalse(self._match(sections, "k a b c"))
+
+    def test_single_keyword_option_is_ordered(self):
+        # A lone optional section is matched at its position only.
+        sections = (Vitals(ArgEzz()), Opts(ArgStr("REV")), Vitals(ArgInt()))
+        self.assertTrue(self._match(sections, "k REV 1"))
+        self.assertFalse(self._match(sections, "k 1 REV"))
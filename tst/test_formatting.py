@@ -0,0 +1,109 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+import time
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+# The outputs must come from the same package the formatting module formats them with.
+from protocol import OutputStr, OutputSeq
+from src import formatting
+
+class TestFormatting(TestCase):
+
+    def setUp(self):
+        self.connection = MagicMock()
+        self.responses = []
+        self.delivered = Event()
+        # Every test stops the workers; the next one starts them again.
+        closed = patch.object(formatting, "_closed", False)
+        closed.start()
+        self.addCleanup(closed.stop)
+
+    def tearDown(self):
+        formatting.shutdown()
+
+    def _on_response(self, expected: int):
+        def on_response(res):
+            self.responses.append(res)
+            if len(self.responses) == expected:
+                self.delivered.set()
+        return on_response
+
+    def test_without_workers(self):
+        with patch.object(formatting.core, "FORMAT_WORKERS", 0):
+            output = OutputSeq(tuple(OutputStr(f"e{idx}") for idx in range(formatting.PAGE_SIZE + 1)))
+            formatting.submit(self.connection, output, self._on_response(1))
+        
+        # Delivered at once, by the calling thread.
+        res, = self.responses
+        self.assertIs(res.output, output)
+        self.assertEqual(res.total, formatting.PAGE_SIZE + 1)
+        self.assertTrue(res.text.endswith(f"{formatting.PAGE_SIZE}) e{formatting.PAGE_SIZE - 1}"))
+
+    def test_order_per_connection(self):
+        def slow_format(output):
+            # The first responses take the longest to format.
+            time.sleep(0.05 / (1 + int(output.value)))
+            return output.value, 1
+        
+        on_response = self._on_response(20)
+        with patch.object(formatting, "_format_page", slow_format), \
+             patch.object(formatting, "_executor", ThreadPoolExecutor(4)):
+            for idx in range(20):
+                formatting.submit(self.connection, OutputStr(str(idx)), on_response)
+            self.assertTrue(self.delivered.wait(5))
+        
+        self.assertEqual([res.text for res in self.responses], [str(idx) for idx in range(20)])
+        self.assertEqual(formatting._pending, {})
+
+    def test_failed_format(self):
+        def failing_format(output):
+            raise ValueError("bad output")
+        
+        with patch.object(formatting, "_format_page", failing_format), \
+             patch.object(formatting, "_executor", ThreadPoolExecutor(1)):
+            formatting.submit(self.connection, OutputStr("a"), self._on_response(1))
+            self.assertTrue(self.delivered.wait(5))
+        
+        self.assertIn("bad output", self.responses[0].text)
+
+    def test_discard(self):
+        started, release = Event(), Event()
+        def blocking_format(output):
+            started.set()
+            release.wait(5)
+            return output.value, 1
+        
+        on_response = MagicMock()
+        with patch.object(formatting, "_format_page", blocking_format), \
+             patch.object(formatting, "_executor", ThreadPoolExecutor(1)):
+            formatting.submit(self.connection, OutputStr("a"), on_response)
+            self.assertTrue(started.wait(5))
+            formatting.discard(self.connection)
+            release.set()
+            formatting._executor.shutdown(wait=True)
+        
+        on_response.assert_not_called()
+
+    def test_callback_submits(self):
+        # The callbacks are called without the lock, so they may submit other responses.
+        on_response = self._on_response(2)
+        def resubmit(res):
+            on_response(res)
+            if res.text == "a":
+                formatting.submit(self.connection, OutputStr("b"), on_response)
+        
+        with patch.object(formatting, "_executor", ThreadPoolExecutor(1)):
+            formatting.submit(self.connection, OutputStr("a"), resubmit)
+            self.assertTrue(self.delivered.wait(5))
+        
+        self.assertEqual([res.text for res in self.responses], ["a", "b"])
+
+    def test_after_shutdown(self):
+        with patch.object(formatting.core, "FORMAT_WORKERS", 2):
+            formatting.shutdown()
+            formatting.submit(self.connection, OutputStr("a"), self._on_response(1))
+        
+        # The workers are not started again; the response is delivered at once, by the calling thread.
+        self.assertIsNone(formatting._executor)
+        self.assertEqual([res.text for res in self.responses], ["a"])
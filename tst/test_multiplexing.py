@@ -0,0 +1,99 @@
+import socket
+from threading import Event
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+# The classes must come from the same packages the multiplexing module uses.
+from network import Receiver, Synchronizer
+from protocol import Decoder
+from src import multiplexing
+
+class TestMultiplexing(TestCase):
+    
+    def test_latency_stats(self):
+        stats = multiplexing.LoopStats()
+        self.assertEqual(stats.latency_avg, 0.0)
+        
+        stats.record_latency(0.5)
+        stats.record_latency(1.5)
+        self.assertEqual(stats.sent_count, 2)
+        self.assertEqual(stats.latency_avg, 1.0)
+        self.assertEqual(stats.latency_max, 1.5)
+
+    def test_dispatch_stats(self):
+        stats = multiplexing.LoopStats()
+        stats.record_dispatch(0.001)
+        stats.record_dispatch(multiplexing.STALL_THRESHOLD * 2)
+        self.assertEqual(stats.stalls, 1)
+        self.assertEqual(stats.dispatch_max, multiplexing.STALL_THRESHOLD * 2)
+        self.assertAlmostEqual(stats.dispatch_total, 0.001 + multiplexing.STALL_THRESHOLD * 2)
+
+    def test_wakeup_interrupts_selection(self):
+        iterations = multiplexing.loop_stats.iterations
+        wakeups = multiplexing.loop_stats.wakeups
+        
+        # The multiplexing module must share the reactor it selects with.
+        multiplexing.reactor.wakeup()
+        # Would block forever without the wakeup signal.
+        multiplexing._sel_and_dispatch()
+        
+        self.assertEqual(multiplexing.loop_stats.iterations, iterations + 1)
+        self.assertEqual(multiplexing.loop_stats.wakeups, wakeups + 1)
+        self.assertGreaterEqual(multiplexing.loop_stats.dispatch_total, 0.0)
+
+    def test_readable_delivers_every_response(self):
+        writer, reader = socket.socketpair()
+        reader.setblocking(False)
+        self.addCleanup(writer.close)
+        self.addCleanup(reader.close)
+        
+        connection = MagicMock()
+        connection.receiver = Receiver(reader)
+        connection.decoder = Decoder(connection.receiver)
+        connection.synchronizer = Synchronizer(3)
+        for cmd in ("GET a", "GET b", "GET c"):
+            connection.synchronizer.sync_input(cmd)
+            connection.synchronizer.mark_sent()
+        
+        writer.sendall(b"+a\r\n+b\r\n+c\r\n")
+        responses = []
+        delivered = Event()
+        def on_response(res):
+            responses.append(res.text)
+            if len(responses) == 3:
+                delivered.set()
+        multiplexing._sel_readable(connection, on_response)
+        
+        # A single readable event delivers every complete response, once formatted.
+        self.assertTrue(delivered.wait(5))
+        self.assertEqual(responses, ["a", "b", "c"])
+        self.assertEqual(connection.synchronizer.in_flight_count(), 0)
+
+    def test_readable_delivers_responses_before_error(self):
+        writer, reader = socket.socketpair()
+        reader.setblocking(False)
+        self.addCleanup(writer.close)
+        self.addCleanup(reader.close)
+        
+        connection = MagicMock()
+        connection.receiver = Receiver(reader)
+        connection.decoder = Decoder(connection.receiver)
+        connection.synchronizer = Synchronizer(2)
+        for cmd in ("GET a", "GET b"):
+            connection.synchronizer.sync_input(cmd)
+            connection.synchronizer.mark_sent()
+        
+        # A good response, followed by a malformed one.
+        writer.sendall(b"+a\r\n?b\r\n")
+        responses = []
+        delivered = Event()
+        def on_response(res):
+            responses.append(res.text)
+            delivered.set()
+        with self.assertRaises(KeyError):
+            multiplexing._sel_readable(connection, on_response)
+        
+        # The response decoded before the error still reaches the client.
+        self.assertTrue(delivered.wait(5))
+        self.assertEqual(responses, ["a"])
+        self.assertEqual(connection.synchronizer.in_flight_count(), 1)
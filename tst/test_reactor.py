@@ -0,0 +1,77 @@
+from selectors import EVENT_READ, EVENT_WRITE
+import socket
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from src import reactor
+
+class TestReactor(TestCase):
+    
+    def setUp(self):
+        self.sock, self.peer = socket.socketpair()
+        self.connection = MagicMock()
+        self.connection.fileno.return_value = self.sock.fileno()
+        self.connection.wants_write.return_value = False
+
+    def tearDown(self):
+        try:
+            reactor._selector.unregister(self.connection)
+        except KeyError:
+            pass
+        reactor._response_lambdas.pop(self.connection, None)
+        reactor._connections_to_arm.clear()
+        self.sock.close()
+        self.peer.close()
+
+    def test_add_connection_read_only(self):
+        reactor.add_connection(self.connection, MagicMock())
+        key = reactor._selector.get_key(self.connection)
+        self.assertEqual(key.events, EVENT_READ)
+
+    def test_add_connection_with_pending(self):
+        self.connection.wants_write.return_value = True
+        reactor.add_connection(self.connection, MagicMock())
+        key = reactor._selector.get_key(self.connection)
+        self.assertEqual(key.events, EVENT_READ | EVENT_WRITE)
+
+    def test_sync_write_interest(self):
+        reactor.add_connection(self.connection, MagicMock())
+        
+        self.connection.wants_write.return_value = True
+        reactor.sync_write_interest(self.connection)
+        key = reactor._selector.get_key(self.connection)
+        self.assertEqual(key.events, EVENT_READ | EVENT_WRITE)
+        
+        # The queue was drained.
+        self.connection.wants_write.return_value = False
+        reactor.sync_write_interest(self.connection)
+        key = reactor._selector.get_key(self.connection)
+        self.assertEqual(key.events, EVENT_READ)
+
+    def test_sync_write_interest_unregistered(self):
+        self.connection.wants_write.return_value = True
+        reactor.sync_write_interest(self.connection)
+        with self.assertRaises(KeyError):
+            reactor._selector.get_key(self.connection)
+
+    def test_enque_pending_input(self):
+        reactor.enque_pending_input(self.connection, "GET key")
+        
+        self.connection.sender.add_pending.assert_called_with("GET key")
+        self.assertIn(self.connection, reactor._connections_to_arm)
+
+    def test_wakeup(self):
+        reactor.wakeup()
+        reactor.wakeup()
+        events = reactor._selector.select(0)
+        self.assertTrue(any(reactor.is_wakeup(key.fileobj) for key, _ in events))
+        
+        reactor.drain_wakeup()
+        events = reactor._selector.select(0)
+        self.assertFalse(any(reactor.is_wakeup(key.fileobj) for key, _ in events))
+
+    def test_enque_signals_wakeup(self):
+        reactor.enque_pending_input(self.connection, "GET key")
+        events = reactor._selector.select(0)
+        self.assertTrue(any(reactor.is_wakeup(key.fileobj) for key, _ in events))
+        reactor.drain_wakeup()